@@ -0,0 +1,32 @@
+"""Индексы для списка комнат
+
+Revision ID: 4b1d7c2e9a10
+Revises: 36ed3b2fec1c
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d7c2e9a10'
+down_revision: Union[str, Sequence[str], None] = '36ed3b2fec1c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_rooms_created_at_id', 'rooms', ['created_at', 'id'], unique=False)
+    op.create_index('ix_rooms_game_name_created_at_id', 'rooms', ['game_name', 'created_at', 'id'], unique=False)
+    op.create_index(op.f('ix_players_room_id'), 'players', ['room_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_players_room_id'), table_name='players')
+    op.drop_index('ix_rooms_game_name_created_at_id', table_name='rooms')
+    op.drop_index('ix_rooms_created_at_id', table_name='rooms')
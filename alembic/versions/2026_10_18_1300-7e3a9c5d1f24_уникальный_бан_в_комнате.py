@@ -0,0 +1,37 @@
+"""Уникальный бан в комнате
+
+Revision ID: 7e3a9c5d1f24
+Revises: 4b1d7c2e9a10
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3a9c5d1f24'
+down_revision: Union[str, Sequence[str], None] = '4b1d7c2e9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Удаляем накопившиеся дубли, оставляя самую раннюю запись
+    op.execute(
+        sa.text(
+            'DELETE FROM blacklist AS duplicate USING blacklist AS original '
+            'WHERE duplicate.room_id = original.room_id '
+            'AND duplicate.user_id = original.user_id '
+            'AND duplicate.id > original.id'
+        )
+    )
+    op.create_unique_constraint('uq_blacklist_room_id_user_id', 'blacklist', ['room_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_blacklist_room_id_user_id', 'blacklist', type_='unique')
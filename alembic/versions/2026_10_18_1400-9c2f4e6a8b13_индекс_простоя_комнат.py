@@ -0,0 +1,34 @@
+"""Индекс простоя комнат
+
+Revision ID: 9c2f4e6a8b13
+Revises: 7e3a9c5d1f24
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2f4e6a8b13'
+down_revision: Union[str, Sequence[str], None] = '7e3a9c5d1f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_rooms_afk_time_not_started',
+        'rooms',
+        ['afk_time'],
+        unique=False,
+        postgresql_where=sa.text('started IS false'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rooms_afk_time_not_started', table_name='rooms', postgresql_where=sa.text('started IS false'))
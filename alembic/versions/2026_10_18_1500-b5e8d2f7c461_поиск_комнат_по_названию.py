@@ -0,0 +1,41 @@
+"""Поиск комнат по названию
+
+Revision ID: b5e8d2f7c461
+Revises: 9c2f4e6a8b13
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e8d2f7c461'
+down_revision: Union[str, Sequence[str], None] = '9c2f4e6a8b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    op.create_index(
+        'ix_rooms_title_trgm',
+        'rooms',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_rooms_title_trgm',
+        table_name='rooms',
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
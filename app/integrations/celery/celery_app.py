@@ -6,6 +6,7 @@ celery_app: Celery = Celery(
     'app',
     broker=get_env_settings().celery_broker_url.get_secret_value(),
     backend=get_env_settings().celery_result_backend.get_secret_value(),
+    include=['app.integrations.celery.tasks'],
 )
 
 celery_app.conf.update(
@@ -14,5 +15,19 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='Europe/Moscow',
     enable_utc=True,
+    beat_schedule={
+        'reconcile-room-seats': {
+            'task': 'app.integrations.celery.tasks.reconcile_room_seats_task',
+            'schedule': get_env_settings().room_seats_reconcile_interval,
+        },
+        'purge-idle-rooms': {
+            'task': 'app.integrations.celery.tasks.purge_idle_rooms_task',
+            'schedule': get_env_settings().idle_rooms_purge_interval,
+        },
+        'sweep-room-presence': {
+            'task': 'app.integrations.celery.tasks.sweep_room_presence_task',
+            'schedule': get_env_settings().room_presence_sweep_interval,
+        },
+    },
 )
 
@@ -1,10 +1,25 @@
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
 from pydantic import EmailStr
+
 from app.integrations.celery.celery_app import celery_app
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from app.integrations.redis.deadlines import Deadlines, player_timeout_deadline
+from app.integrations.redis.redis import RedisFacade
+from app.integrations.redis.room_matchmaking import RoomMatchmaking
+from app.integrations.redis.room_presence import PlayerKey, RoomPresence
+from app.integrations.redis.room_seats import RoomSeats
+from app.services.background_jobs import build_lobby_service, lobby_service_task_context, task_session_context
 from app.transports.handlers.users.utils import (
     EmailService,
     create_token_for_confirm_email,
     generate_link_for_confirm_email,
 )
+from app.utils.config import get_env_settings
+from app.utils.logger_config import user_lobby_logger
 
 
 @celery_app.task
@@ -19,3 +34,97 @@ def send_confirmation_email_task(
     email_service.send_registration_confirm_link(user_email, link)
 
 
+@asynccontextmanager
+async def lobby_task_context() -> AsyncGenerator[tuple[LobbyRepository, RedisFacade]]:
+    """Репозиторий лобби и Redis для периодических задач."""
+    async with task_session_context() as (session, redis):
+        yield LobbyRepository(session), redis
+
+
+async def reconcile_room_seats() -> int:
+    """Сверить счётчики мест комнат и очередь быстрого входа в Redis с таблицей players."""
+    async with lobby_task_context() as (lobby_repository, redis):
+        rooms = await lobby_repository.get_rooms_seats()
+        stale = await RoomSeats(redis).reconcile(rooms)
+        stale_queued = await RoomMatchmaking(redis).reconcile(rooms)
+    user_lobby_logger.info(
+        f'Счётчики мест сверены: комнат {len(rooms)}, удалено устаревших {stale}, '
+        f'убрано из очереди быстрого входа {stale_queued}'
+    )
+    return len(rooms)
+
+
+@celery_app.task
+def reconcile_room_seats_task() -> int:
+    return asyncio.run(reconcile_room_seats())
+
+
+async def purge_idle_rooms() -> int:
+    """Удалить комнаты, в которых дольше порога не начиналась игра."""
+    settings = get_env_settings()
+    started_at = time.perf_counter()
+    async with lobby_service_task_context() as lobby_service:
+        purged = await lobby_service.purge_idle_rooms(
+            idle_seconds=settings.idle_room_timeout,
+            batch_size=settings.idle_rooms_purge_batch_size,
+        )
+    user_lobby_logger.info(f'Удалено простаивающих комнат: {purged} за {time.perf_counter() - started_at:.3f} с')
+    return purged
+
+
+@celery_app.task
+def purge_idle_rooms_task() -> int:
+    return asyncio.run(purge_idle_rooms())
+
+
+async def _write_disconnected(
+    lobby_repository: LobbyRepository,
+    players: list[PlayerKey],
+    is_disconnect: bool,
+) -> list[PlayerKey]:
+    batch_size = get_env_settings().room_presence_sweep_batch_size
+    written: list[PlayerKey] = []
+    for start in range(0, len(players), batch_size):
+        written.extend(
+            await lobby_repository.set_players_disconnected(
+                players=players[start : start + batch_size], is_disconnect=is_disconnect
+            )
+        )
+    return written
+
+
+async def sweep_room_presence() -> int:
+    """Записать в players смены состояния связи игроков, найденные по heartbeat в Redis.
+
+    Для отключившихся планируется срок ожидания, по истечении которого игрок удаляется из комнаты.
+    """
+    settings = get_env_settings()
+    async with task_session_context() as (session, redis):
+        lobby_repository = LobbyRepository(session)
+        room_presence = RoomPresence(redis)
+        transitions = await room_presence.transitions(grace_seconds=settings.room_presence_grace)
+        disconnected = await _write_disconnected(lobby_repository, transitions.disconnected, is_disconnect=True)
+        reconnected = await _write_disconnected(lobby_repository, transitions.reconnected, is_disconnect=False)
+        lingering = await lobby_repository.get_existing_players(players=transitions.lingering)
+        # Состояние в Redis меняем только после коммита, иначе переход потеряется при откате.
+        # is_disconnect входит в список комнат, поэтому вместе с коммитом сбрасывается кэш и уходят дельты
+        await build_lobby_service(session, redis).publish_connection_changes(disconnected, reconnected)
+        checked = [*transitions.disconnected, *transitions.reconnected, *transitions.lingering]
+        found = {*disconnected, *reconnected, *lingering}
+        gone = [player for player in checked if player not in found]
+        await room_presence.apply(disconnected=disconnected, reconnected=reconnected, gone=gone)
+        deadlines = Deadlines(redis)
+        for room_id, user_id in disconnected:
+            await deadlines.schedule(player_timeout_deadline(room_id, user_id), settings.player_disconnect_timeout)
+        for room_id, user_id in reconnected:
+            await deadlines.cancel(player_timeout_deadline(room_id, user_id))
+    if disconnected or reconnected:
+        user_lobby_logger.info(
+            f'Состояние связи игроков обновлено: отключились {len(disconnected)}, вернулись {len(reconnected)}'
+        )
+    return len(disconnected) + len(reconnected)
+
+
+@celery_app.task
+def sweep_room_presence_task() -> int:
+    return asyncio.run(sweep_room_presence())
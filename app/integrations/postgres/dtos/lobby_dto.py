@@ -50,3 +50,66 @@ class RoomGameSchemaDTO(BaseDTO):
     afk_time: datetime
     started: bool
     players: list[PlayerSchemaDTO]
+
+
+class RoomSummaryDTO(BaseDTO):
+    """DTO краткой информации о комнате для списка лобби"""
+
+    id: int
+    title: str
+    game_name: str
+    max_players: int
+    is_private: bool
+    started: bool
+    created_at: datetime
+    player_count: int
+    free_slots: int
+    host_name: str | None
+
+
+class RoomSettingsDTO(RoomSummaryDTO):
+    """DTO комнаты после изменения настроек, с паролем для проверки открытости комнаты"""
+
+    password: str | None
+
+
+class RoomFilterDTO(BaseDTO):
+    """DTO фильтров для списка комнат"""
+
+    game_name: str | None = None
+    started: bool | None = None
+    is_private: bool | None = None
+    has_free_seats: bool | None = None
+
+
+class RoomCursorDTO(BaseDTO):
+    """DTO курсора для постраничного списка комнат"""
+
+    created_at: datetime
+    id: int
+
+
+class RoomJoinDTO(BaseDTO):
+    """DTO заблокированной комнаты с данными для проверки входа пользователя"""
+
+    room: RoomSchemaDTO
+    user_in_room: bool | None
+    banned_user_ids: list[int]
+
+
+class RoomSeatsDTO(BaseDTO):
+    """DTO занятых мест комнаты для сверки счётчиков и очереди быстрого входа в Redis"""
+
+    id: int
+    max_players: int
+    player_count: int
+    game_name: str
+    is_private: bool
+    started: bool
+
+
+class RoomWithHostDTO(BaseDTO):
+    """DTO созданной комнаты вместе с игроком-хостом"""
+
+    room: RoomCreateDTO
+    host: PlayerSchemaDTO
@@ -140,6 +140,20 @@ class UserAchievementsDTO(BaseDTO):
     receiving_cond: datetime | None
 
 
+class UserProfileDTO(UserDetailDTO):
+    """DTO профиля пользователя со статистикой и достижениями."""
+
+    statistics: list[PlayerStatisticDTO]
+    achievements: list[UserAchievementsDTO]
+
+
+class UserPublicProfileDTO(UserPublicDTO):
+    """DTO публичного профиля пользователя с достижениями."""
+
+    id: int
+    achievements: list[UserAchievementsDTO]
+
+
 class UserSchemaDTO(BaseDTO):
     id: int
     username: str
@@ -32,3 +32,6 @@ class PlayerNotFoundPostgres(BasePostgresError):
 class AchievementNotFoundPostgres(BasePostgresError):
     pass
 
+
+class SearchTimeoutPostgres(BasePostgresError):
+    pass
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.integrations.postgres.orms.baseorm import BaseORM
@@ -13,6 +13,7 @@ class BlackListORM(BaseORM):
     """Черный список"""
 
     __tablename__ = 'blacklist'
+    __table_args__ = (UniqueConstraint('room_id', 'user_id', name='uq_blacklist_room_id_user_id'),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True, comment='Id записи')
     user_id: Mapped[int] = mapped_column(comment='Номер пользователя')
@@ -23,6 +23,6 @@ class PlayerORM(BaseORM):
     is_vip: Mapped[bool] = mapped_column(default=False, comment='VIP статус')
     is_host: Mapped[bool] = mapped_column(default=False, comment='Хост')
     room_id: Mapped[int] = mapped_column(
-        ForeignKey('rooms.id', ondelete='CASCADE'), comment='ID комнаты, в которой находится игрок'
+        ForeignKey('rooms.id', ondelete='CASCADE'), index=True, comment='ID комнаты, в которой находится игрок'
     )
     room: Mapped['RoomORM'] = relationship('RoomORM', back_populates='players', lazy='raise')
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func, text
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,12 @@ from app.integrations.postgres.orms.player_orm import PlayerORM
 
 class RoomORM(AsyncAttrs, BaseORM):
     __tablename__: str = 'rooms'
+    __table_args__ = (
+        Index('ix_rooms_created_at_id', 'created_at', 'id'),
+        Index('ix_rooms_game_name_created_at_id', 'game_name', 'created_at', 'id'),
+        Index('ix_rooms_afk_time_not_started', 'afk_time', postgresql_where=text('started IS false')),
+        Index('ix_rooms_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(100), unique=True, comment='Название комнаты')
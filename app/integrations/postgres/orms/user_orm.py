@@ -1,7 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from passlib.context import CryptContext
 from sqlalchemy import DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,8 +9,6 @@ from app.integrations.postgres.orms.baseorm import BaseORM
 if TYPE_CHECKING:
     from app.integrations.postgres.orms.rank_orm import RankORM
 
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
-
 
 class UserORM(BaseORM):
     __tablename__ = 'users'
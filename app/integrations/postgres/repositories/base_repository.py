@@ -3,6 +3,11 @@ from typing import Annotated, cast
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.integrations.redis.profile_cache import (
+    ProfileCache,
+    discard_pending_profiles,
+    invalidate_committed_profiles,
+)
 from app.transports.depends.postgres import session_depend
 
 
@@ -10,8 +15,25 @@ class BaseRepository:
     def __init__(
         self,
         session: Annotated[AsyncSession, Depends(session_depend)] = None,  # type: ignore
+        profile_cache: Annotated[ProfileCache, Depends()] = None,  # type: ignore
     ) -> None:
         self._session: AsyncSession | None = session
+        self._profile_cache: ProfileCache | None = profile_cache
 
     def set_session(self, session: AsyncSession) -> None:
         self._session = session
+
+    async def commit(self) -> None:
+        """Зафиксировать транзакцию запроса до конца обработчика."""
+        await self._session.commit()
+        await invalidate_committed_profiles(self._session)
+
+    async def rollback(self) -> None:
+        """Откатить транзакцию запроса и снять взятые в ней блокировки строк."""
+        await self._session.rollback()
+        discard_pending_profiles(self._session)
+
+    async def _invalidate_profile(self, user_id: int) -> None:
+        """Сбросить кэш публичного профиля пользователя после фиксации его изменения."""
+        if self._profile_cache is not None:
+            self._profile_cache.invalidate_after_commit(self._session, user_id)
@@ -1,13 +1,29 @@
-from sqlalchemy import delete, func, select, update
-from sqlalchemy.exc import IntegrityError, MultipleResultsFound, NoResultFound
-from sqlalchemy.orm import selectinload
-
-from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO, RoomCreateDTO, RoomSchemaDTO
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import Select, case, delete, exists, false, func, insert, literal, or_, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError, MultipleResultsFound, NoResultFound
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.integrations.postgres.dtos.lobby_dto import (
+    PlayerSchemaDTO,
+    RoomCreateDTO,
+    RoomCursorDTO,
+    RoomFilterDTO,
+    RoomJoinDTO,
+    RoomSchemaDTO,
+    RoomSeatsDTO,
+    RoomWithHostDTO,
+    RoomSettingsDTO,
+    RoomSummaryDTO,
+)
 from app.integrations.postgres.dtos.user_dto import AchievementDTO, PlayerStatisticDTO
 from app.integrations.postgres.exceptions import (
     AchievementNotFoundPostgres,
     PlayerNotFoundPostgres,
     RoomNotFoundPostgres,
+    SearchTimeoutPostgres,
     TitleCreateRoomPostgres,
 )
 from app.integrations.postgres.orms.achievement_orm import AchievementORM
@@ -20,9 +36,12 @@ from app.integrations.postgres.orms.player_orm import PlayerORM
 from app.integrations.postgres.orms.room_orm import RoomORM
 from app.integrations.postgres.orms.user_orm import UserORM
 from app.integrations.postgres.repositories.base_repository import BaseRepository
-from app.transports.handlers.lobby.schemas import RoomCreateSchema
+from app.transports.handlers.lobby.schemas import RoomCreateSchema, RoomUpdateSchema
 from app.utils.integrations.postgres.base_exception_handler import sqlalchemy_error_handle
 
+# Код ошибки Postgres при отмене запроса по statement_timeout
+QUERY_CANCELED_SQLSTATE = '57014'
+
 
 class LobbyRepository(BaseRepository):
     """Репозиторий для работы с лобби."""
@@ -37,6 +56,73 @@ class LobbyRepository(BaseRepository):
             raise RoomNotFoundPostgres from exc
         return RoomSchemaDTO.model_validate(room)
 
+    @sqlalchemy_error_handle
+    async def lock_room_for_join(self, room_id: int, user_id: int) -> RoomJoinDTO:
+        """Комната с игроками под блокировкой строки и всё, что нужно для проверки входа, одним запросом.
+
+        Блокировка держится до конца транзакции, поэтому параллельные входы в комнату выполняются по очереди
+        и не могут превысить max_players.
+        """
+        user_in_room = select(UserORM.in_room).where(UserORM.id == user_id).scalar_subquery()
+        banned_user_ids = (
+            select(func.array_agg(BlackListORM.user_id)).where(BlackListORM.room_id == RoomORM.id).scalar_subquery()
+        )
+        stmt = (
+            select(RoomORM, user_in_room.label('user_in_room'), banned_user_ids.label('banned_user_ids'))
+            .where(RoomORM.id == room_id)
+            .options(joinedload(RoomORM.players))
+            .with_for_update(of=RoomORM)
+        )
+        result = await self._session.execute(stmt)
+        row = result.unique().one_or_none()
+        if row is None:
+            raise RoomNotFoundPostgres
+        return RoomJoinDTO(
+            room=RoomSchemaDTO.model_validate(row.RoomORM),
+            user_in_room=row.user_in_room,
+            banned_user_ids=row.banned_user_ids or [],
+        )
+
+    @sqlalchemy_error_handle
+    async def add_player_to_room(self, room_id: int, user_id: int) -> PlayerSchemaDTO:
+        """Добавить пользователя в комнату одним запросом.
+
+        Удаляет его игроков из других комнат, создаёт игрока из данных пользователя и отмечает пользователя в комнате.
+        """
+        deleted_players = (
+            delete(PlayerORM)
+            .where(PlayerORM.user_id == user_id, PlayerORM.room_id != room_id)
+            .returning(PlayerORM.id)
+            .cte('deleted_players')
+        )
+        updated_user = (
+            update(UserORM)
+            .where(UserORM.id == user_id)
+            .values(in_room=True)
+            .returning(UserORM.id)
+            .cte('updated_user')
+        )
+        stmt = (
+            insert(PlayerORM)
+            .from_select(
+                ['name', 'user_id', 'room_id', 'nickname_color', 'avatar', 'is_vip', 'is_host'],
+                select(
+                    UserORM.username,
+                    UserORM.id,
+                    literal(room_id),
+                    UserORM.nickname_color,
+                    UserORM.avatar,
+                    UserORM.is_vip,
+                    false(),
+                ).where(UserORM.id == user_id),
+            )
+            .returning(*PlayerORM.__table__.c)
+            .add_cte(deleted_players)
+            .add_cte(updated_user)
+        )
+        result = await self._session.execute(stmt)
+        return PlayerSchemaDTO.model_validate(result.one())
+
     @sqlalchemy_error_handle
     async def get_all_rooms(
         self,
@@ -45,6 +131,131 @@ class LobbyRepository(BaseRepository):
         result = await self._session.execute(stmt)
         return [RoomSchemaDTO.model_validate(room) for room in result.scalars().all()]
 
+    @sqlalchemy_error_handle
+    async def get_rooms_page(
+        self,
+        filters: RoomFilterDTO,
+        limit: int,
+        cursor: RoomCursorDTO | None = None,
+    ) -> list[RoomSchemaDTO]:
+        """Страница комнат от новых к старым с keyset-пагинацией по (created_at, id)."""
+        stmt = self._filter_rooms(select(RoomORM), filters=filters, cursor=cursor)
+        stmt = stmt.order_by(RoomORM.created_at.desc(), RoomORM.id.desc()).limit(limit)
+        result = await self._session.execute(stmt.options(selectinload(RoomORM.players)))
+        return [RoomSchemaDTO.model_validate(room) for room in result.scalars().all()]
+
+    @sqlalchemy_error_handle
+    async def get_rooms_summary_page(
+        self,
+        filters: RoomFilterDTO,
+        limit: int | None,
+        cursor: RoomCursorDTO | None = None,
+    ) -> list[RoomSummaryDTO]:
+        """Страница комнат с количеством игроков и именем хоста одним агрегирующим запросом."""
+        stmt = self._filter_rooms(self._rooms_summary_select(), filters=filters, cursor=cursor)
+        stmt = stmt.order_by(RoomORM.created_at.desc(), RoomORM.id.desc()).limit(limit)
+        result = await self._session.execute(stmt)
+        return [RoomSummaryDTO.model_validate(row) for row in result.all()]
+
+    @sqlalchemy_error_handle
+    async def get_rooms_seats(self) -> list[RoomSeatsDTO]:
+        """Число игроков и мест во всех комнатах. Комната с паролем считается приватной."""
+        stmt = (
+            select(
+                RoomORM.id,
+                RoomORM.max_players,
+                func.count(PlayerORM.id).label('player_count'),
+                RoomORM.game_name,
+                (RoomORM.is_private | RoomORM.password.is_not(None)).label('is_private'),
+                RoomORM.started,
+            )
+            .outerjoin(PlayerORM, PlayerORM.room_id == RoomORM.id)
+            .group_by(RoomORM.id)
+        )
+        result = await self._session.execute(stmt)
+        return [RoomSeatsDTO.model_validate(row) for row in result.all()]
+
+    @sqlalchemy_error_handle
+    async def search_rooms(
+        self,
+        query: str,
+        limit: int,
+        timeout_ms: int,
+    ) -> list[RoomSummaryDTO]:
+        """Поиск комнат по названию через триграммный GIN индекс.
+
+        Сначала идут названия, начинающиеся с запроса, затем названия, содержащие похожее слово,
+        по убыванию word_similarity.
+        statement_timeout выставляется как SET LOCAL и действует до конца текущей транзакции.
+        """
+        await self._session.execute(select(func.set_config('statement_timeout', str(timeout_ms), true())))
+        escaped_query = query.replace('/', '//').replace('%', '/%').replace('_', '/_')
+        is_prefix = RoomORM.title.ilike(f'{escaped_query}%', escape='/')
+        stmt = (
+            self._rooms_summary_select()
+            .where(or_(literal(query).op('<%')(RoomORM.title), is_prefix))
+            .order_by(is_prefix.desc(), func.word_similarity(query, RoomORM.title).desc(), RoomORM.id.desc())
+            .limit(limit)
+        )
+        try:
+            result = await self._session.execute(stmt)
+        except DBAPIError as exc:
+            if getattr(exc.orig, 'sqlstate', None) != QUERY_CANCELED_SQLSTATE:
+                raise
+            await self._session.rollback()
+            raise SearchTimeoutPostgres from exc
+        return [RoomSummaryDTO.model_validate(row) for row in result.all()]
+
+    @staticmethod
+    def _rooms_summary_select() -> Select[Any]:
+        player_count = func.count(PlayerORM.id)
+        return (
+            select(
+                RoomORM.id,
+                RoomORM.title,
+                RoomORM.game_name,
+                RoomORM.max_players,
+                RoomORM.is_private,
+                RoomORM.started,
+                RoomORM.created_at,
+                player_count.label('player_count'),
+                func.greatest(RoomORM.max_players - player_count, 0).label('free_slots'),
+                func.max(case((PlayerORM.is_host.is_(True), PlayerORM.name))).label('host_name'),
+            )
+            .outerjoin(PlayerORM, PlayerORM.room_id == RoomORM.id)
+            .group_by(RoomORM.id)
+        )
+
+    @staticmethod
+    def _filter_rooms(
+        stmt: Select[Any],
+        filters: RoomFilterDTO,
+        cursor: RoomCursorDTO | None,
+    ) -> Select[Any]:
+        if filters.game_name is not None:
+            stmt = stmt.where(RoomORM.game_name == filters.game_name)
+        if filters.started is not None:
+            stmt = stmt.where(RoomORM.started == filters.started)
+        if filters.is_private is not None:
+            stmt = stmt.where(RoomORM.is_private == filters.is_private)
+        if filters.has_free_seats is not None:
+            players_count = (
+                select(func.count(PlayerORM.id))
+                .where(PlayerORM.room_id == RoomORM.id)
+                .correlate(RoomORM)
+                .scalar_subquery()
+            )
+            if filters.has_free_seats:
+                stmt = stmt.where(players_count < RoomORM.max_players)
+            else:
+                stmt = stmt.where(players_count >= RoomORM.max_players)
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(RoomORM.created_at, RoomORM.id)
+                < tuple_(literal(cursor.created_at, RoomORM.created_at.type), literal(cursor.id))
+            )
+        return stmt
+
     @sqlalchemy_error_handle
     async def get_player(
         self,
@@ -105,6 +316,87 @@ class LobbyRepository(BaseRepository):
                 raise TitleCreateRoomPostgres
         return RoomCreateDTO.model_validate(room)
 
+    @sqlalchemy_error_handle
+    async def create_room_with_host(
+        self,
+        room_data: RoomCreateSchema,
+        user_id: int,
+    ) -> RoomWithHostDTO | None:
+        """Создать комнату и игрока-хоста и отметить пользователя в комнате одним запросом.
+
+        Пишет только если пользователь существует и не находится в комнате, иначе возвращает None.
+        """
+        host_user = (
+            select(UserORM.id, UserORM.username, UserORM.nickname_color, UserORM.avatar, UserORM.is_vip)
+            .where(UserORM.id == user_id, UserORM.in_room.is_(False))
+            .with_for_update()
+            .cte('host_user')
+        )
+        new_room = (
+            insert(RoomORM)
+            .from_select(
+                ['title', 'max_players', 'is_private', 'password'],
+                select(
+                    literal(room_data.title),
+                    literal(room_data.max_players),
+                    literal(room_data.is_private or bool(room_data.password)),
+                    literal(room_data.password, RoomORM.password.type),
+                ).where(exists(select(host_user.c.id))),
+            )
+            .returning(*RoomORM.__table__.c)
+            .cte('new_room')
+        )
+        host_player = (
+            insert(PlayerORM)
+            .from_select(
+                ['name', 'user_id', 'room_id', 'nickname_color', 'avatar', 'is_vip', 'is_host'],
+                select(
+                    host_user.c.username,
+                    host_user.c.id,
+                    new_room.c.id,
+                    host_user.c.nickname_color,
+                    host_user.c.avatar,
+                    host_user.c.is_vip,
+                    true(),
+                ).select_from(host_user.join(new_room, true())),
+            )
+            .returning(*PlayerORM.__table__.c)
+            .cte('host_player')
+        )
+        updated_user = (
+            update(UserORM)
+            .where(UserORM.id.in_(select(host_player.c.user_id)))
+            .values(in_room=True)
+            .returning(UserORM.id)
+            .cte('updated_user')
+        )
+        stmt = (
+            select(
+                *[column.label(f'room_{column.name}') for column in new_room.c],
+                *[column.label(f'host_{column.name}') for column in host_player.c],
+            )
+            .select_from(new_room.join(host_player, true()))
+            .add_cte(updated_user)
+        )
+        try:
+            result = await self._session.execute(stmt)
+        except IntegrityError as exc:
+            await self._session.rollback()
+            if 'rooms_title_key' in exc.args[0]:
+                raise TitleCreateRoomPostgres from exc
+            raise
+        row = result.mappings().one_or_none()
+        if row is None:
+            return None
+        return RoomWithHostDTO(
+            room=RoomCreateDTO.model_validate(
+                {name.removeprefix('room_'): value for name, value in row.items() if name.startswith('room_')}
+            ),
+            host=PlayerSchemaDTO.model_validate(
+                {name.removeprefix('host_'): value for name, value in row.items() if name.startswith('host_')}
+            ),
+        )
+
     @sqlalchemy_error_handle
     async def create_player(
         self,
@@ -159,10 +451,85 @@ class LobbyRepository(BaseRepository):
         user_id: int,
         room_id: int,
     ) -> None:
-        blacklist = BlackListORM(user_id=user_id, room_id=room_id)
-        self._session.add(blacklist)
+        stmt = (
+            pg_insert(BlackListORM)
+            .values(user_id=user_id, room_id=room_id)
+            .on_conflict_do_nothing(constraint='uq_blacklist_room_id_user_id')
+        )
+        await self._session.execute(stmt)
         await self._session.flush()
 
+    @sqlalchemy_error_handle
+    async def delete_idle_rooms(
+        self,
+        idle_seconds: int,
+        limit: int,
+    ) -> list[int]:
+        """Удалить пачку простаивающих неначатых комнат и освободить их игроков одним запросом.
+
+        Комнаты, заблокированные другими транзакциями (например, входом игрока), пропускаются.
+        Игроки удаляются каскадом по внешнему ключу. Возвращает id удалённых комнат.
+        """
+        idle_rooms = (
+            select(RoomORM.id)
+            .where(
+                RoomORM.started.is_(False),
+                RoomORM.afk_time < func.now() - timedelta(seconds=idle_seconds),
+            )
+            .order_by(RoomORM.afk_time)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte('idle_rooms')
+        )
+        freed_users = (
+            update(UserORM)
+            .where(UserORM.id.in_(select(PlayerORM.user_id).where(PlayerORM.room_id.in_(select(idle_rooms.c.id)))))
+            .values(in_room=False)
+            .returning(UserORM.id)
+            .cte('freed_users')
+        )
+        deleted_rooms = (
+            delete(RoomORM).where(RoomORM.id.in_(select(idle_rooms.c.id))).returning(RoomORM.id).cte('deleted_rooms')
+        )
+        stmt = select(deleted_rooms.c.id).add_cte(freed_users)
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    @sqlalchemy_error_handle
+    async def kick_and_ban(
+        self,
+        user_id: int,
+        room_id: int,
+    ) -> PlayerSchemaDTO | None:
+        """Удалить игрока из комнаты, снять отметку пребывания в комнате и забанить одним запросом.
+
+        Возвращает удалённого игрока или None, если пользователя не было в комнате (бан записывается всё равно).
+        """
+        kicked_player = (
+            delete(PlayerORM)
+            .where(PlayerORM.room_id == room_id, PlayerORM.user_id == user_id)
+            .returning(*PlayerORM.__table__.c)
+            .cte('kicked_player')
+        )
+        updated_user = (
+            update(UserORM)
+            .where(UserORM.id.in_(select(kicked_player.c.user_id)))
+            .values(in_room=False)
+            .returning(UserORM.id)
+            .cte('updated_user')
+        )
+        banned_user = (
+            pg_insert(BlackListORM)
+            .values(user_id=user_id, room_id=room_id)
+            .on_conflict_do_nothing(constraint='uq_blacklist_room_id_user_id')
+            .returning(BlackListORM.id)
+            .cte('banned_user')
+        )
+        stmt = select(kicked_player).add_cte(updated_user).add_cte(banned_user)
+        result = await self._session.execute(stmt)
+        player = result.one_or_none()
+        return PlayerSchemaDTO.model_validate(player) if player else None
+
     @sqlalchemy_error_handle
     async def disconnect_change(self, user_id: int, is_disconnect: bool) -> None:
         stmt = update(PlayerORM).where(PlayerORM.user_id == user_id).values(is_disconnect=is_disconnect)
@@ -176,6 +543,41 @@ class LobbyRepository(BaseRepository):
         player = result.scalars().first()
         return player.is_disconnect if player else True
 
+    @sqlalchemy_error_handle
+    async def set_players_disconnected(
+        self,
+        players: list[tuple[int, int]],
+        is_disconnect: bool,
+    ) -> list[tuple[int, int]]:
+        """Выставить флаг разрыва соединения игрокам (room_id, user_id) одним запросом.
+
+        Возвращает игроков, которые нашлись в таблице.
+        """
+        if not players:
+            return []
+        stmt = (
+            update(PlayerORM)
+            .where(tuple_(PlayerORM.room_id, PlayerORM.user_id).in_(players))
+            .values(is_disconnect=is_disconnect)
+            .returning(PlayerORM.room_id, PlayerORM.user_id)
+        )
+        result = await self._session.execute(stmt)
+        return [(room_id, user_id) for room_id, user_id in result.all()]
+
+    @sqlalchemy_error_handle
+    async def get_existing_players(
+        self,
+        players: list[tuple[int, int]],
+    ) -> list[tuple[int, int]]:
+        """Отобрать игроков (room_id, user_id), которые ещё находятся в своих комнатах."""
+        if not players:
+            return []
+        stmt = select(PlayerORM.room_id, PlayerORM.user_id).where(
+            tuple_(PlayerORM.room_id, PlayerORM.user_id).in_(players)
+        )
+        result = await self._session.execute(stmt)
+        return [(room_id, user_id) for room_id, user_id in result.all()]
+
     @sqlalchemy_error_handle
     async def delete_player(
         self,
@@ -229,6 +631,61 @@ class LobbyRepository(BaseRepository):
         await self._session.execute(stmt)
         await self._session.flush()
 
+    @sqlalchemy_error_handle
+    async def update_room_settings(
+        self,
+        room_id: int,
+        host_user_id: int,
+        settings: RoomUpdateSchema,
+    ) -> RoomSettingsDTO | None:
+        """Применить переданные настройки комнаты одним UPDATE ... RETURNING.
+
+        Обновление проходит, только если пользователь - хост комнаты и новое число мест
+        не меньше текущего числа игроков. Иначе ничего не меняется и возвращается None.
+        Строка комнаты сначала блокируется так же, как при входе, поэтому параллельный вход
+        либо уже зафиксирован и учтён в подсчёте игроков, либо ждёт и видит новое число мест.
+        """
+        await self._session.execute(select(RoomORM.id).where(RoomORM.id == room_id).with_for_update())
+        values = settings.model_dump(exclude_unset=True)
+        if values.get('password'):
+            values['is_private'] = True
+        elif 'password' in values and 'is_private' not in values:
+            # Комната с паролем создаётся приватной, поэтому снятие пароля снова делает её открытой
+            values['is_private'] = False
+        player_count = select(func.count(PlayerORM.id)).where(PlayerORM.room_id == RoomORM.id).scalar_subquery()
+        host_name = (
+            select(PlayerORM.name)
+            .where(PlayerORM.room_id == RoomORM.id, PlayerORM.is_host.is_(True))
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = update(RoomORM).where(
+            RoomORM.id == room_id,
+            exists().where(
+                PlayerORM.room_id == RoomORM.id,
+                PlayerORM.user_id == host_user_id,
+                PlayerORM.is_host.is_(True),
+            ),
+        )
+        if 'max_players' in values:
+            stmt = stmt.where(player_count <= values['max_players'])
+        stmt = stmt.values(**values).returning(
+            RoomORM.id,
+            RoomORM.title,
+            RoomORM.game_name,
+            RoomORM.max_players,
+            RoomORM.is_private,
+            RoomORM.started,
+            RoomORM.created_at,
+            player_count.label('player_count'),
+            func.greatest(RoomORM.max_players - player_count, 0).label('free_slots'),
+            host_name.label('host_name'),
+            RoomORM.password,
+        )
+        result = await self._session.execute(stmt)
+        room = result.one_or_none()
+        return RoomSettingsDTO.model_validate(room) if room else None
+
     @sqlalchemy_error_handle
     async def game_started(self, room_id: int, started: bool) -> None:
         stmt = update(RoomORM).where(RoomORM.id == room_id).values(started=started)
@@ -258,9 +715,12 @@ class LobbyRepository(BaseRepository):
             update(UserGameStatisticsORM)
             .where(UserGameStatisticsORM.id == statistic_id)
             .values(won_game=win_game, total_game=total_game)
+            .returning(UserGameStatisticsORM.user_id)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
         await self._session.flush()
+        for user_id in result.scalars().all():
+            await self._invalidate_profile(user_id)
 
     @sqlalchemy_error_handle
     async def get_achievement(self, name_achievement: str) -> AchievementDTO:
@@ -277,6 +737,7 @@ class LobbyRepository(BaseRepository):
         achievement = GameAchievementsORM(user_id=user_id, achievement_id=achievement_id, game_name=game_name)
         self._session.add(achievement)
         await self._session.flush()
+        await self._invalidate_profile(user_id)
 
     @sqlalchemy_error_handle
     async def create_game_statistics(
@@ -1,8 +1,13 @@
+from itertools import chain
+from typing import Any
+
 from pydantic import EmailStr
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import ColumnElement, Integer, any_, bindparam, delete, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, aggregate_order_by
 from sqlalchemy.exc import IntegrityError, MultipleResultsFound, NoResultFound
 from sqlalchemy.orm import joinedload, selectinload
 
+from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO
 from app.integrations.postgres.dtos.user_dto import (
     CreateRankDTO,
     PlayerStatisticDTO,
@@ -17,6 +22,8 @@ from app.integrations.postgres.dtos.user_dto import (
     UserDTO,
     UserExpDTO,
     UserLoginResponseDTO,
+    UserProfileDTO,
+    UserPublicProfileDTO,
     UserPublicDTO,
     UserTempCreateDTO,
     UserTempResponseDTO,
@@ -24,6 +31,7 @@ from app.integrations.postgres.dtos.user_dto import (
 )
 from app.integrations.postgres.orms.games_achievements_orm import GameAchievementsORM
 from app.integrations.postgres.orms.player_game_statistics_orm import UserGameStatisticsORM
+from app.integrations.postgres.orms.player_orm import PlayerORM
 from app.integrations.postgres.orms.user_orm import UserORM
 from app.utils.integrations.postgres.base_exception_handler import sqlalchemy_error_handle
 
@@ -33,6 +41,11 @@ from ..orms.rank_orm import RankORM
 from .base_repository import BaseRepository
 
 
+def _json_object(**fields: ColumnElement[Any]) -> ColumnElement[Any]:
+    """json_build_object из пар имя поля - выражение."""
+    return func.json_build_object(*chain.from_iterable(fields.items()))
+
+
 class UserRepository(BaseRepository):
     """Репозиторий для работы с пользователями."""
 
@@ -98,6 +111,109 @@ class UserRepository(BaseRepository):
             raise UserNotFoundPostgres from exc
         return UserPublicDTO.model_validate(user)
 
+    @sqlalchemy_error_handle
+    async def get_profile(
+        self,
+        user_id: int,
+    ) -> UserProfileDTO:
+        """Профиль пользователя с рангом, статистикой и достижениями за один запрос.
+
+        Статистика и достижения собираются в JSON коррелированными подзапросами,
+        поэтому строки пользователя не размножаются соединениями.
+        """
+        statistics = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        _json_object(
+                            id=UserGameStatisticsORM.id,
+                            game_name=UserGameStatisticsORM.game_name,
+                            total_game=UserGameStatisticsORM.total_game,
+                            won_game=UserGameStatisticsORM.won_game,
+                        ),
+                        UserGameStatisticsORM.id,
+                    ),
+                    type_=JSON,
+                )
+            )
+            .where(UserGameStatisticsORM.user_id == UserORM.id)
+            .scalar_subquery()
+        )
+        achievements = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        _json_object(
+                            achievement=_json_object(
+                                id=AchievementORM.id,
+                                name=AchievementORM.name,
+                                desc=AchievementORM.desc,
+                            ),
+                            game_name=GameAchievementsORM.game_name,
+                            receiving_cond=GameAchievementsORM.receiving_cond,
+                        ),
+                        GameAchievementsORM.id,
+                    ),
+                    type_=JSON,
+                )
+            )
+            .join(AchievementORM, AchievementORM.id == GameAchievementsORM.achievement_id)
+            .where(GameAchievementsORM.user_id == UserORM.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(UserORM, statistics.label('statistics'), achievements.label('achievements'))
+            .options(joinedload(UserORM.rank))
+            .where(UserORM.id == user_id)
+        )
+        result = await self._session.execute(stmt)
+        try:
+            user, user_statistics, user_achievements = result.one()
+        except (NoResultFound, MultipleResultsFound) as exc:
+            raise UserNotFoundPostgres from exc
+        return UserProfileDTO(
+            **UserDetailDTO.model_validate(user).model_dump(),
+            statistics=user_statistics or [],
+            achievements=user_achievements or [],
+        )
+
+    @sqlalchemy_error_handle
+    async def get_public_profiles(
+        self,
+        user_ids: list[int],
+    ) -> list[UserPublicProfileDTO]:
+        """Публичные профили нескольких пользователей: по одному запросу на пользователей и достижения.
+
+        Несуществующие пользователи пропускаются, порядок - по возрастанию id.
+        """
+        ids = bindparam('user_ids', user_ids, type_=ARRAY(Integer))
+        users_stmt = (
+            select(UserORM)
+            .options(joinedload(UserORM.rank))
+            .where(UserORM.id == any_(ids))
+            .order_by(UserORM.id)
+        )
+        users = (await self._session.execute(users_stmt)).scalars().all()
+        if not users:
+            return []
+        achievements_stmt = (
+            select(GameAchievementsORM)
+            .options(joinedload(GameAchievementsORM.achievement))
+            .where(GameAchievementsORM.user_id == any_(ids))
+            .order_by(GameAchievementsORM.id)
+        )
+        achievements: dict[int, list[UserAchievementsDTO]] = {user.id: [] for user in users}
+        for achievement in (await self._session.execute(achievements_stmt)).scalars().all():
+            achievements[achievement.user_id].append(UserAchievementsDTO.model_validate(achievement))
+        return [
+            UserPublicProfileDTO(
+                **UserPublicDTO.model_validate(user).model_dump(),
+                id=user.id,
+                achievements=achievements[user.id],
+            )
+            for user in users
+        ]
+
     @sqlalchemy_error_handle
     async def add_one(
         self,
@@ -174,8 +290,33 @@ class UserRepository(BaseRepository):
         except (NoResultFound, MultipleResultsFound) as exc:
             raise UserNotFoundPostgres from exc
         await self._session.flush()
+        await self._invalidate_profile(user_id)
         return UpdatedUserDTO.model_validate(updated_user)
 
+    @sqlalchemy_error_handle
+    async def update_avatar(
+        self,
+        user_id: int,
+        avatar: str,
+    ) -> tuple[UpdatedUserDTO, list[PlayerSchemaDTO]]:
+        """Сменить аватар пользователя и его копию у игроков в комнатах.
+
+        Возвращает пользователя и изменённых игроков, чтобы сервис разослал их комнатам.
+        """
+        stmt = update(UserORM).where(UserORM.id == user_id).values(avatar=avatar).returning(UserORM)
+        result = await self._session.execute(stmt)
+        try:
+            updated_user = result.scalar_one()
+        except (NoResultFound, MultipleResultsFound) as exc:
+            raise UserNotFoundPostgres from exc
+        players = await self._session.scalars(
+            update(PlayerORM).where(PlayerORM.user_id == user_id).values(avatar=avatar).returning(PlayerORM)
+        )
+        updated_players = [PlayerSchemaDTO.model_validate(player) for player in players]
+        await self._session.flush()
+        await self._invalidate_profile(user_id)
+        return UpdatedUserDTO.model_validate(updated_user), updated_players
+
     @sqlalchemy_error_handle
     async def activate_user(
         self,
@@ -206,6 +347,23 @@ class UserRepository(BaseRepository):
             raise UserNotFoundPostgres from exc
         return UserByEmailDTO.model_validate(user)
 
+    @sqlalchemy_error_handle
+    async def update_hash_password(
+        self,
+        user_id: int,
+        old_hash_password: str,
+        new_hash_password: str,
+    ) -> bool:
+        """Заменить хеш пароля, только если пароль не сменили с момента чтения старого хеша."""
+        stmt = (
+            update(UserORM)
+            .where(UserORM.id == user_id, UserORM.hash_password == old_hash_password)
+            .values(hash_password=new_hash_password)
+            .returning(UserORM.id)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
     @sqlalchemy_error_handle
     async def update_exp(self, user_id: int, exp: int) -> UserExpDTO:
         stmt = update(UserORM).where(UserORM.id == user_id).values(exp=exp).returning(UserORM)
@@ -215,6 +373,7 @@ class UserRepository(BaseRepository):
         except (NoResultFound, MultipleResultsFound) as exc:
             raise UserNotFoundPostgres from exc
         await self._session.flush()
+        await self._invalidate_profile(user_id)
         return UserExpDTO.model_validate(user)
 
     @sqlalchemy_error_handle
@@ -222,6 +381,7 @@ class UserRepository(BaseRepository):
         stmt = update(UserORM).where(UserORM.id == user_id).values(rank_id=rank)
         await self._session.execute(stmt)
         await self._session.flush()
+        await self._invalidate_profile(user_id)
 
     @sqlalchemy_error_handle
     async def get_next_rank(self, user_exp: int) -> RankDetailDTO | None:
@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+from typing import Annotated
+
+from fastapi import Depends
+from redis import RedisError
+
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.redis import redis_facade_depend
+from app.utils.logger_config import user_lobby_logger
+from app.utils.metrics import LOBBY_DEADLINES_DEPTH, LOBBY_DEADLINES_LATENESS
+
+DEADLINES_KEY = 'lobby:deadlines'
+PLAYER_TIMEOUT_DEADLINE = 'player_timeout:{room_id}:{user_id}'
+
+SCHEDULE_SCRIPT = """
+local now = redis.call('TIME')
+return redis.call('ZADD', KEYS[1], now[1] * 1000 + math.floor(now[2] / 1000) + tonumber(ARGV[1]), ARGV[2])
+"""
+
+CANCEL_SCRIPT = """
+return redis.call('ZREM', KEYS[1], ARGV[1])
+"""
+
+# Забирает просроченные сроки атомарно, поэтому несколько воркеров не выполнят одно действие дважды
+POP_DUE_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = now[1] * 1000 + math.floor(now[2] / 1000)
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now_ms, 'WITHSCORES', 'LIMIT', 0, tonumber(ARGV[1]))
+local result = {}
+for i = 1, #due, 2 do
+    redis.call('ZREM', KEYS[1], due[i])
+    table.insert(result, due[i])
+    table.insert(result, tostring(now_ms - tonumber(due[i + 1])))
+end
+return {result, redis.call('ZCARD', KEYS[1])}
+"""
+
+DeadlineHandler = Callable[[list[str]], Awaitable[None]]
+
+
+def player_timeout_deadline(room_id: int, user_id: int) -> str:
+    """Срок ожидания возвращения отключившегося игрока."""
+    return PLAYER_TIMEOUT_DEADLINE.format(room_id=room_id, user_id=user_id)
+
+
+def parse_player_timeout_deadline(deadline: str) -> tuple[int, int] | None:
+    """Вернуть (room_id, user_id) срока ожидания игрока или None для сроков другого вида."""
+    kind, _, ids = deadline.partition(':')
+    room_id, _, user_id = ids.partition(':')
+    if kind != 'player_timeout' or not room_id.isdigit() or not user_id.isdigit():
+        return None
+    return int(room_id), int(user_id)
+
+
+class Deadlines:
+    """Очередь отложенных действий лобби в sorted set Redis.
+
+    Оценка - момент срабатывания по часам Redis, поэтому сроки переживают перезапуск
+    приложения и не зависят от часов отдельных инстансов. Повторное планирование того же
+    срока переносит его, а отмена - одна команда ZREM.
+    """
+
+    def __init__(
+        self,
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+    ) -> None:
+        self._redis = redis
+
+    async def schedule(self, deadline: str, delay_seconds: float) -> None:
+        """Запланировать срок через delay_seconds."""
+        await self._redis.eval(SCHEDULE_SCRIPT, keys=[DEADLINES_KEY], args=[int(delay_seconds * 1000), deadline])
+
+    async def cancel(self, deadline: str) -> None:
+        """Отменить срок, если он ещё не сработал."""
+        await self._redis.eval(CANCEL_SCRIPT, keys=[DEADLINES_KEY], args=[deadline])
+
+    async def pop_due(self, limit: int) -> list[str]:
+        """Забрать до limit наступивших сроков, обновив метрики глубины очереди и опоздания."""
+        due, depth = await self._redis.eval(POP_DUE_SCRIPT, keys=[DEADLINES_KEY], args=[limit])
+        LOBBY_DEADLINES_DEPTH.set(depth)
+        deadlines = due[::2]
+        for lateness_ms in due[1::2]:
+            LOBBY_DEADLINES_LATENESS.observe(int(lateness_ms) / 1000)
+        return deadlines
+
+
+class DeadlineRunner:
+    """Фоновое выполнение наступивших сроков пачками внутри воркера приложения."""
+
+    def __init__(
+        self,
+        deadlines: Deadlines,
+        handler: DeadlineHandler,
+        batch_size: int,
+        poll_interval: float,
+    ) -> None:
+        self._deadlines = deadlines
+        self._handler = handler
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Запустить обработку сроков."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить обработку сроков."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _run(self) -> None:
+        while True:
+            due: list[str] = []
+            try:
+                due = await self._deadlines.pop_due(self._batch_size)
+                if due:
+                    await self._handler(due)
+            except RedisError as err:
+                user_lobby_logger.warning(f'Очередь сроков лобби недоступна: {err}')
+            except Exception as err:
+                # Забранные сроки не возвращаются в очередь: действия над игроками не должны повторяться
+                user_lobby_logger.error(f'Ошибка при обработке сроков лобби {due}: {err}')
+            # Пока очередь отдаёт полные пачки, разбираем её без пауз
+            if len(due) < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
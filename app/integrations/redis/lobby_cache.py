@@ -0,0 +1,81 @@
+import hashlib
+import json
+import time
+from typing import Annotated, Any
+
+from fastapi import Depends
+from redis import RedisError
+
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.redis import redis_facade_depend
+from app.utils.config import get_env_settings
+from app.utils.logger_config import user_lobby_logger
+from app.utils.metrics import LOBBY_CACHE_REQUESTS
+
+LOBBY_VERSION_KEY = 'lobby:version'
+LOBBY_SNAPSHOT_KEY = 'lobby:snapshot:{version}:{params}'
+
+
+class LobbyCache:
+    """Кэш снимков списка комнат в Redis.
+
+    Снимки хранятся под текущей версией лобби, поэтому инвалидация - это один INCR версии,
+    а старые снимки просто истекают по TTL (максимальная устарелость списка).
+    """
+
+    def __init__(
+        self,
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+    ) -> None:
+        self._redis = redis
+
+    async def get_version(self) -> int | None:
+        """Текущая версия лобби, None если Redis недоступен."""
+        try:
+            version = await self._redis.get(LOBBY_VERSION_KEY)
+            if version is None:
+                # Стартуем с текущего времени, чтобы после потери ключа версии не повторялись
+                await self._redis.set_if_absent(LOBBY_VERSION_KEY, time.time_ns() // 1_000_000)
+                version = await self._redis.get(LOBBY_VERSION_KEY)
+            return int(version)
+        except (RedisError, TypeError, ValueError) as err:
+            user_lobby_logger.warning(f'Не удалось получить версию лобби из Redis: {err}')
+            return None
+
+    async def get_snapshot(self, version: int, params: dict[str, Any]) -> Any | None:
+        """Получить снимок списка комнат для версии и параметров запроса."""
+        try:
+            snapshot = await self._redis.get_json(self._snapshot_key(version, params))
+        except (RedisError, RuntimeError) as err:
+            user_lobby_logger.warning(f'Не удалось прочитать снимок лобби из Redis: {err}')
+            snapshot = {}
+        if 'data' not in snapshot:
+            LOBBY_CACHE_REQUESTS.labels(result='miss').inc()
+            return None
+        LOBBY_CACHE_REQUESTS.labels(result='hit').inc()
+        return snapshot['data']
+
+    async def set_snapshot(self, version: int, params: dict[str, Any], data: Any) -> None:
+        """Сохранить снимок списка комнат."""
+        try:
+            await self._redis.set_json(
+                self._snapshot_key(version, params),
+                {'data': data},
+                expire=get_env_settings().lobby_cache_ttl,
+            )
+        except (RedisError, RuntimeError) as err:
+            user_lobby_logger.warning(f'Не удалось сохранить снимок лобби в Redis: {err}')
+
+    async def invalidate(self) -> int | None:
+        """Сбросить все снимки, увеличив версию лобби."""
+        try:
+            return await self._redis.incr(LOBBY_VERSION_KEY)
+        except RuntimeError as err:
+            # Без инвалидации список просто устареет не дольше, чем на TTL снимка
+            user_lobby_logger.warning(f'Не удалось сбросить кэш лобби: {err}')
+            return None
+
+    @staticmethod
+    def _snapshot_key(version: int, params: dict[str, Any]) -> str:
+        raw_params = json.dumps(params, sort_keys=True, default=str)
+        return LOBBY_SNAPSHOT_KEY.format(version=version, params=hashlib.sha1(raw_params.encode()).hexdigest())
@@ -0,0 +1,85 @@
+import asyncio
+import contextlib
+import json
+from typing import Any
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from app.utils.logger_config import user_lobby_logger
+from app.utils.metrics import LOBBY_WS_CONNECTIONS, LOBBY_WS_DROPPED
+
+WS_EVENTS_CHANNEL = 'ws_events'
+RECONNECT_DELAY_SECONDS = 1
+
+
+class LobbyFeed:
+    """Раздача событий лобби подключённым WebSocket внутри одного воркера.
+
+    Воркер держит одну подписку на канал ws_events и раскладывает каждое событие
+    по ограниченным очередям соединений. Соединение, которое не успевает читать,
+    отключается, а не копит события в памяти.
+    """
+
+    def __init__(self, redis: Redis, queue_size: int) -> None:
+        self._redis = redis
+        self._queue_size = queue_size
+        self._queues: set[asyncio.Queue[dict[str, Any] | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Запустить чтение канала событий."""
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Остановить чтение канала и отключить всех подписчиков."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        for queue in list(self._queues):
+            self._close(queue)
+
+    def subscribe(self) -> asyncio.Queue[dict[str, Any] | None]:
+        """Зарегистрировать соединение. None в очереди означает, что соединение нужно закрыть."""
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=self._queue_size)
+        self._queues.add(queue)
+        LOBBY_WS_CONNECTIONS.inc()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+        """Удалить соединение из рассылки."""
+        if queue in self._queues:
+            self._queues.discard(queue)
+            LOBBY_WS_CONNECTIONS.dec()
+
+    def dispatch(self, event: dict[str, Any]) -> None:
+        """Разложить событие по очередям всех соединений."""
+        for queue in list(self._queues):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                LOBBY_WS_DROPPED.inc()
+                self._close(queue)
+
+    def _close(self, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+        self.unsubscribe(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(WS_EVENTS_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message['type'] != 'message':
+                            continue
+                        try:
+                            self.dispatch(json.loads(message['data']))
+                        except (json.JSONDecodeError, TypeError) as err:
+                            user_lobby_logger.warning(f'Некорректное событие лобби в канале {WS_EVENTS_CHANNEL}: {err}')
+            except RedisError as err:
+                user_lobby_logger.error(f'Потеряна подписка на {WS_EVENTS_CHANNEL}: {err}')
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
@@ -0,0 +1,160 @@
+import json
+import time
+from typing import Annotated, Any
+
+from fastapi import Depends
+from redis import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.redis import redis_facade_depend
+from app.utils.config import get_env_settings
+from app.utils.logger_config import user_lobby_logger
+from app.utils.metrics import USER_PROFILE_CACHE_REQUESTS
+
+USER_PROFILE_VERSION_KEY = 'user:{user_id}:profile:version'
+USER_PROFILE_KEY = 'user:{user_id}:profile:{version}'
+# Ключ в session.info с профилями, которые нужно сбросить после фиксации транзакции сессии
+PENDING_INVALIDATIONS_KEY = 'profile_cache_pending_invalidations'
+
+
+class ProfileCache:
+    """Кэш публичных профилей пользователей в Redis.
+
+    Профиль хранится под текущей версией пользователя, поэтому инвалидация - это один INCR
+    версии при изменении пользователя, его ранга, статистики или достижений, а старые
+    профили просто истекают по TTL. Версия увеличивается только после фиксации транзакции:
+    иначе параллельный запрос успел бы прочитать старые данные и сохранить их под новой версией.
+    """
+
+    def __init__(
+        self,
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+    ) -> None:
+        self._redis = redis
+
+    async def get_version(self, user_id: int) -> int | None:
+        """Текущая версия профиля пользователя, None если Redis недоступен."""
+        key = self._version_key(user_id)
+        try:
+            version = await self._redis.get(key)
+            if version is None:
+                # Стартуем с текущего времени, чтобы после потери ключа версии не повторялись
+                await self._redis.set_if_absent(key, time.time_ns() // 1_000_000)
+                version = await self._redis.get(key)
+            return int(version)
+        except (RedisError, TypeError, ValueError) as err:
+            user_lobby_logger.warning(f'Не удалось получить версию профиля пользователя {user_id} из Redis: {err}')
+            return None
+
+    async def get_profile(self, user_id: int, version: int) -> dict[str, Any] | None:
+        """Получить публичный профиль пользователя для версии."""
+        try:
+            profile = await self._redis.get_json(self._profile_key(user_id, version))
+        except (RedisError, RuntimeError) as err:
+            user_lobby_logger.warning(f'Не удалось прочитать профиль пользователя {user_id} из Redis: {err}')
+            profile = {}
+        if not profile:
+            USER_PROFILE_CACHE_REQUESTS.labels(result='miss').inc()
+            return None
+        USER_PROFILE_CACHE_REQUESTS.labels(result='hit').inc()
+        return profile
+
+    async def set_profile(self, user_id: int, version: int, profile: dict[str, Any]) -> None:
+        """Сохранить публичный профиль пользователя."""
+        try:
+            await self._redis.set_json(
+                self._profile_key(user_id, version),
+                profile,
+                expire=get_env_settings().user_profile_cache_ttl,
+            )
+        except (RedisError, RuntimeError) as err:
+            user_lobby_logger.warning(f'Не удалось сохранить профиль пользователя {user_id} в Redis: {err}')
+
+    async def get_versions(self, user_ids: list[int]) -> dict[int, int]:
+        """Текущие версии профилей нескольких пользователей, пустой словарь если Redis недоступен."""
+        try:
+            versions = await self._redis.get_many([self._version_key(user_id) for user_id in user_ids])
+        except RedisError as err:
+            user_lobby_logger.warning(f'Не удалось получить версии профилей пользователей из Redis: {err}')
+            return {}
+        result = {user_id: int(version) for user_id, version in zip(user_ids, versions) if version is not None}
+        missing = [user_id for user_id in user_ids if user_id not in result]
+        if missing:
+            # Недостающие версии создаются разом, как в get_version, и читаются в том же пайплайне
+            initial = time.time_ns() // 1_000_000
+            try:
+                created = await self._redis.set_many_if_absent(
+                    {self._version_key(user_id): initial for user_id in missing}
+                )
+            except RedisError as err:
+                user_lobby_logger.warning(f'Не удалось создать версии профилей пользователей в Redis: {err}')
+                return result
+            result.update(
+                {user_id: int(version) for user_id, version in zip(missing, created) if version is not None}
+            )
+        return result
+
+    async def get_profiles(self, versions: dict[int, int]) -> dict[int, dict[str, Any]]:
+        """Получить публичные профили пользователей для их версий одной командой."""
+        try:
+            raw_profiles = await self._redis.get_many(
+                [self._profile_key(user_id, version) for user_id, version in versions.items()]
+            )
+        except RedisError as err:
+            user_lobby_logger.warning(f'Не удалось прочитать профили пользователей из Redis: {err}')
+            raw_profiles = [None] * len(versions)
+        profiles = {
+            user_id: json.loads(raw_profile)
+            for user_id, raw_profile in zip(versions, raw_profiles)
+            if raw_profile is not None
+        }
+        USER_PROFILE_CACHE_REQUESTS.labels(result='hit').inc(len(profiles))
+        USER_PROFILE_CACHE_REQUESTS.labels(result='miss').inc(len(versions) - len(profiles))
+        return profiles
+
+    async def set_profiles(self, versions: dict[int, int], profiles: dict[int, dict[str, Any]]) -> None:
+        """Сохранить публичные профили пользователей, для которых известна версия."""
+        try:
+            await self._redis.set_many_json(
+                {
+                    self._profile_key(user_id, versions[user_id]): profile
+                    for user_id, profile in profiles.items()
+                    if user_id in versions
+                },
+                expire=get_env_settings().user_profile_cache_ttl,
+            )
+        except (RedisError, RuntimeError) as err:
+            user_lobby_logger.warning(f'Не удалось сохранить профили пользователей в Redis: {err}')
+
+    def invalidate_after_commit(self, session: AsyncSession, user_id: int) -> None:
+        """Отложить сброс профиля пользователя до фиксации транзакции сессии."""
+        session.info.setdefault(PENDING_INVALIDATIONS_KEY, {})[user_id] = self
+
+    async def invalidate(self, user_id: int) -> None:
+        """Сбросить закэшированный профиль, увеличив версию пользователя."""
+        try:
+            await self._redis.incr(self._version_key(user_id))
+        except (RedisError, RuntimeError) as err:
+            # Без инвалидации профиль просто устареет не дольше, чем на TTL
+            user_lobby_logger.warning(f'Не удалось сбросить кэш профиля пользователя {user_id}: {err}')
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return USER_PROFILE_VERSION_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def _profile_key(user_id: int, version: int) -> str:
+        return USER_PROFILE_KEY.format(user_id=user_id, version=version)
+
+
+async def invalidate_committed_profiles(session: AsyncSession) -> None:
+    """Сбросить кэш профилей, изменённых в только что зафиксированной транзакции сессии."""
+    pending: dict[int, ProfileCache] = session.info.pop(PENDING_INVALIDATIONS_KEY, {})
+    for user_id, profile_cache in pending.items():
+        await profile_cache.invalidate(user_id)
+
+
+def discard_pending_profiles(session: AsyncSession) -> None:
+    """Забыть отложенные сбросы профилей после отката транзакции сессии."""
+    session.info.pop(PENDING_INVALIDATIONS_KEY, None)
@@ -67,6 +67,10 @@ class RedisFacade:
         """Сохранить одиночное значение с TTL (по умолчанию 20 мин)."""
         await self._redis.set(name=key, value=data, ex=expire)
 
+    async def set_if_absent(self, key: str, data: Any) -> bool:
+        """Сохранить одиночное значение без TTL, только если ключа ещё нет."""
+        return bool(await self._redis.set(name=key, value=data, nx=True))
+
     async def set_list(
         self,
         key: str,
@@ -94,6 +98,58 @@ class RedisFacade:
         except RedisError as err:
             raise RuntimeError(f"Ошибка при инкременте Redis-ключа '{key}': {err}") from err
 
+    async def eval(self, script: str, keys: list[str], args: list[Any]) -> Any:
+        """Выполнить Lua-скрипт атомарно на стороне Redis."""
+        return await self._redis.eval(script, len(keys), *keys, *args)
+
+    async def delete(self, *keys: str) -> None:
+        """Удалить ключи."""
+        await self._redis.delete(*keys)
+
+    async def scan_keys(self, pattern: str) -> list[str]:
+        """Найти ключи по шаблону без блокировки Redis (SCAN)."""
+        return [key async for key in self._redis.scan_iter(match=pattern)]
+
+    async def set_hashes(self, hashes: dict[str, dict[str, Any]]) -> None:
+        """Перезаписать поля нескольких хэшей одним пайплайном."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, mapping in hashes.items():
+                pipe.hset(key, mapping=mapping)
+            await pipe.execute()
+
+    async def get_many(self, keys: list[str]) -> list[Any]:
+        """Получить несколько одиночных значений одной командой (MGET)."""
+        return await self._redis.mget(keys) if keys else []
+
+    async def set_many_if_absent(self, items: dict[str, Any]) -> list[Any]:
+        """Сохранить значения без TTL для ещё не существующих ключей и вернуть текущие одним пайплайном."""
+        if not items:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, data in items.items():
+                pipe.set(name=key, value=data, nx=True)
+            pipe.mget(list(items))
+            *_, values = await pipe.execute()
+        return values
+
+    async def set_many_json(self, items: dict[str, Any], expire: int = DEFAULT_EXPIRE_SECONDS) -> None:
+        """Сохранить несколько объектов как JSON с TTL одним пайплайном."""
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, data in items.items():
+                    pipe.set(name=key, value=json.dumps(data, ensure_ascii=False), ex=expire)
+                await pipe.execute()
+        except (TypeError, RedisError) as err:
+            raise RuntimeError(f'Ошибка при сохранении JSON в Redis: {err}') from err
+
+    async def range_by_score(self, key: str, minimum: float, limit: int) -> list[str]:
+        """Первые limit элементов sorted set с оценкой не меньше minimum, по возрастанию оценки."""
+        return await self._redis.zrangebyscore(key, minimum, '+inf', start=0, num=limit)
+
+    async def get_hash_keys(self, key: str) -> list[str]:
+        """Получить поля хэша."""
+        return await self._redis.hkeys(key)
+
     async def publish_ws_event(self, event: dict[str, Any]) -> None:
         """Публикация события в WebSocket channel"""
         msg = json.dumps(event, ensure_ascii=False)
@@ -0,0 +1,85 @@
+from typing import Annotated
+
+from fastapi import Depends
+from redis import RedisError
+
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.redis import redis_facade_depend
+from app.utils.logger_config import user_lobby_logger
+
+ROOM_BANS_KEY = 'lobby:room:{room_id}:bans'
+ROOM_BANS_TTL_SECONDS = 60 * 60
+# Служебный элемент множества: отличает загруженный пустой список банов от отсутствующего
+LOADED_MARKER = '0'
+
+IS_BANNED_SCRIPT = """
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 0 then
+    return -1
+end
+return redis.call('SISMEMBER', KEYS[1], ARGV[2])
+"""
+
+LOAD_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('SADD', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+# Бан добавляется только в уже загруженное множество, иначе его подхватит следующая загрузка из БД
+ADD_SCRIPT = """
+if redis.call('SISMEMBER', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+return redis.call('SADD', KEYS[1], ARGV[2])
+"""
+
+
+class RoomBans:
+    """Множество забаненных пользователей комнаты в Redis.
+
+    Множество загружается из таблицы blacklist при первом входе в комнату и живёт
+    ROOM_BANS_TTL_SECONDS, новые баны дописываются в него сразу после записи в БД.
+    """
+
+    def __init__(
+        self,
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+    ) -> None:
+        self._redis = redis
+
+    async def is_banned(self, room_id: int, user_id: int) -> bool | None:
+        """Забанен ли пользователь, None если баны комнаты ещё не загружены."""
+        try:
+            result = int(
+                await self._redis.eval(IS_BANNED_SCRIPT, keys=[self.key(room_id)], args=[LOADED_MARKER, user_id])
+            )
+        except RedisError as err:
+            user_lobby_logger.warning(f'Баны комнаты {room_id} недоступны в Redis: {err}')
+            return None
+        return None if result < 0 else bool(result)
+
+    async def load(self, room_id: int, user_ids: list[int]) -> None:
+        """Загрузить баны комнаты из БД."""
+        await self._run(LOAD_SCRIPT, room_id, ROOM_BANS_TTL_SECONDS, LOADED_MARKER, *user_ids)
+
+    async def add(self, room_id: int, user_id: int) -> None:
+        """Добавить бан в загруженное множество."""
+        await self._run(ADD_SCRIPT, room_id, LOADED_MARKER, user_id)
+
+    async def drop(self, room_id: int) -> None:
+        """Удалить множество банов удалённой комнаты."""
+        try:
+            await self._redis.delete(self.key(room_id))
+        except RedisError as err:
+            user_lobby_logger.warning(f'Не удалось удалить баны комнаты {room_id} из Redis: {err}')
+
+    @staticmethod
+    def key(room_id: int) -> str:
+        return ROOM_BANS_KEY.format(room_id=room_id)
+
+    async def _run(self, script: str, room_id: int, *args: int | str) -> None:
+        try:
+            await self._redis.eval(script, keys=[self.key(room_id)], args=list(args))
+        except RedisError as err:
+            user_lobby_logger.warning(f'Не удалось обновить баны комнаты {room_id} в Redis: {err}')
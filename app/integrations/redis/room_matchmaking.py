@@ -0,0 +1,95 @@
+from typing import Annotated
+
+from fastapi import Depends
+from redis import RedisError
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSeatsDTO
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.redis import redis_facade_depend
+from app.utils.logger_config import user_lobby_logger
+
+QUICK_JOIN_KEY = 'lobby:quick_join'
+QUICK_JOIN_GAME_KEY = 'lobby:quick_join:game:{game_name}'
+# Игра, под которой комната сейчас лежит в очереди, чтобы при смене игры убрать её из старого набора
+QUICK_JOIN_GAMES_KEY = 'lobby:quick_join:games'
+
+UPDATE_SCRIPT = """
+local old_game = redis.call('HGET', KEYS[2], ARGV[1])
+if old_game then
+    redis.call('ZREM', ARGV[5] .. old_game, ARGV[1])
+end
+if ARGV[4] == '1' and tonumber(ARGV[2]) > 0 then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+    redis.call('ZADD', ARGV[5] .. ARGV[3], ARGV[2], ARGV[1])
+    redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+else
+    redis.call('ZREM', KEYS[1], ARGV[1])
+    redis.call('HDEL', KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+
+class RoomMatchmaking:
+    """Комнаты для быстрого входа в sorted set Redis с оценкой по числу свободных мест.
+
+    В наборе лежат только открытые, неначатые и незаполненные комнаты, поэтому самая
+    заполненная подходящая комната находится одним ZRANGEBYSCORE за O(log n) независимо
+    от общего числа комнат. Набор обновляется сервисом лобби при каждом изменении комнаты
+    и пересобирается периодической задачей сверки мест.
+    """
+
+    def __init__(
+        self,
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+    ) -> None:
+        self._redis = redis
+
+    async def update(self, room_id: int, free_slots: int, game_name: str, is_open: bool) -> None:
+        """Поставить комнату в очередь быстрого входа или убрать её, если входить в неё нельзя."""
+        try:
+            await self._redis.eval(
+                UPDATE_SCRIPT,
+                keys=[QUICK_JOIN_KEY, QUICK_JOIN_GAMES_KEY],
+                args=[room_id, free_slots, game_name, int(is_open), self._game_key('')],
+            )
+        except RedisError as err:
+            user_lobby_logger.warning(f'Не удалось обновить комнату {room_id} в очереди быстрого входа: {err}')
+
+    async def remove(self, room_id: int) -> None:
+        """Убрать комнату из очереди быстрого входа."""
+        await self.update(room_id, free_slots=0, game_name='', is_open=False)
+
+    async def candidates(self, game_name: str | None, limit: int) -> list[int]:
+        """До limit подходящих комнат, начиная с самых заполненных."""
+        key = self._game_key(game_name) if game_name is not None else QUICK_JOIN_KEY
+        try:
+            room_ids = await self._redis.range_by_score(key, minimum=1, limit=limit)
+        except RedisError as err:
+            user_lobby_logger.warning(f'Очередь быстрого входа недоступна: {err}')
+            return []
+        return [int(room_id) for room_id in room_ids]
+
+    async def reconcile(self, rooms: list[RoomSeatsDTO]) -> int:
+        """Выставить комнаты по данным Postgres и убрать из очереди несуществующие.
+
+        Возвращает число убранных комнат.
+        """
+        for room in rooms:
+            await self.update(
+                room.id,
+                free_slots=room.max_players - room.player_count,
+                game_name=room.game_name,
+                is_open=not room.is_private and not room.started,
+            )
+        known_rooms = {str(room.id) for room in rooms}
+        stale_rooms = [
+            room_id for room_id in await self._redis.get_hash_keys(QUICK_JOIN_GAMES_KEY) if room_id not in known_rooms
+        ]
+        for room_id in stale_rooms:
+            await self.remove(int(room_id))
+        return len(stale_rooms)
+
+    @staticmethod
+    def _game_key(game_name: str) -> str:
+        return QUICK_JOIN_GAME_KEY.format(game_name=game_name)
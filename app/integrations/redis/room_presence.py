@@ -0,0 +1,142 @@
+import json
+from collections import defaultdict
+from typing import Annotated, NamedTuple
+
+from fastapi import Depends
+from redis import RedisError
+
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.redis import redis_facade_depend
+from app.utils.logger_config import user_lobby_logger
+
+ROOM_PRESENCE_KEY = 'lobby:room:{room_id}:presence'
+ROOM_DISCONNECTED_KEY = 'lobby:room:{room_id}:disconnected'
+PRESENCE_ROOMS_KEY = 'lobby:presence:rooms'
+
+# Время берётся у Redis, чтобы часы разных инстансов приложения не влияли на оценки
+HEARTBEAT_SCRIPT = """
+local now = redis.call('TIME')
+redis.call('ZADD', KEYS[1], now[1] * 1000 + math.floor(now[2] / 1000), ARGV[2])
+redis.call('SADD', KEYS[2], ARGV[1])
+return 1
+"""
+
+# Только читает: состояние в Redis меняется после записи переходов в Postgres
+TRANSITIONS_SCRIPT = """
+local now = redis.call('TIME')
+local cutoff = now[1] * 1000 + math.floor(now[2] / 1000) - tonumber(ARGV[1])
+local disconnected = {}
+local lingering = {}
+for _, user_id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', '(' .. cutoff)) do
+    if redis.call('SISMEMBER', KEYS[2], user_id) == 0 then
+        table.insert(disconnected, user_id)
+    else
+        table.insert(lingering, user_id)
+    end
+end
+local reconnected = {}
+for _, user_id in ipairs(redis.call('SMEMBERS', KEYS[2])) do
+    local score = redis.call('ZSCORE', KEYS[1], user_id)
+    if score and tonumber(score) >= cutoff then
+        table.insert(reconnected, user_id)
+    end
+end
+return {disconnected, reconnected, lingering}
+"""
+
+APPLY_SCRIPT = """
+local changes = cjson.decode(ARGV[2])
+for _, user_id in ipairs(changes['disconnected']) do
+    redis.call('SADD', KEYS[2], user_id)
+end
+for _, user_id in ipairs(changes['reconnected']) do
+    redis.call('SREM', KEYS[2], user_id)
+end
+for _, user_id in ipairs(changes['gone']) do
+    redis.call('ZREM', KEYS[1], user_id)
+    redis.call('SREM', KEYS[2], user_id)
+end
+if redis.call('ZCARD', KEYS[1]) == 0 then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    redis.call('SREM', KEYS[3], ARGV[1])
+end
+return 1
+"""
+
+PlayerKey = tuple[int, int]
+
+
+class PresenceTransitions(NamedTuple):
+    """Игроки (room_id, user_id), чьё состояние связи нужно проверить в Postgres."""
+
+    disconnected: list[PlayerKey]
+    reconnected: list[PlayerKey]
+    # Уже отмеченные отключившимися: проверяются только на то, что ещё остаются в комнате
+    lingering: list[PlayerKey]
+
+
+class RoomPresence:
+    """Присутствие игроков комнат в Redis.
+
+    Для каждой комнаты хранится sorted set пользователей с временем последнего heartbeat
+    и множество тех, кто уже записан в Postgres как отключившийся. Heartbeat - одна команда
+    в Redis, а в таблицу players попадают только смены состояния, которые находит фоновая задача.
+    """
+
+    def __init__(
+        self,
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+    ) -> None:
+        self._redis = redis
+
+    async def heartbeat(self, room_id: int, user_id: int) -> None:
+        """Отметить, что игрок комнаты на связи."""
+        try:
+            await self._redis.eval(
+                HEARTBEAT_SCRIPT,
+                keys=[self._presence_key(room_id), PRESENCE_ROOMS_KEY],
+                args=[room_id, user_id],
+            )
+        except RedisError as err:
+            user_lobby_logger.warning(f'Не удалось обновить присутствие игрока {user_id} в комнате {room_id}: {err}')
+
+    async def transitions(self, grace_seconds: int) -> PresenceTransitions:
+        """Найти игроков, которые не присылали heartbeat дольше grace_seconds или снова на связи."""
+        transitions = PresenceTransitions([], [], [])
+        for room_id in map(int, await self._redis.get_list(PRESENCE_ROOMS_KEY)):
+            room_transitions = await self._redis.eval(
+                TRANSITIONS_SCRIPT,
+                keys=[self._presence_key(room_id), self._disconnected_key(room_id)],
+                args=[grace_seconds * 1000],
+            )
+            for players, user_ids in zip(transitions, room_transitions):
+                players.extend((room_id, int(user_id)) for user_id in user_ids)
+        return transitions
+
+    async def apply(
+        self,
+        disconnected: list[PlayerKey],
+        reconnected: list[PlayerKey],
+        gone: list[PlayerKey],
+    ) -> None:
+        """Запомнить записанные в Postgres переходы и забыть игроков, которых больше нет в комнатах."""
+        changes: dict[int, dict[str, list[int]]] = defaultdict(
+            lambda: {'disconnected': [], 'reconnected': [], 'gone': []}
+        )
+        for name, players in (('disconnected', disconnected), ('reconnected', reconnected), ('gone', gone)):
+            for room_id, user_id in players:
+                changes[room_id][name].append(user_id)
+        for room_id, room_changes in changes.items():
+            await self._redis.eval(
+                APPLY_SCRIPT,
+                keys=[self._presence_key(room_id), self._disconnected_key(room_id), PRESENCE_ROOMS_KEY],
+                args=[room_id, json.dumps(room_changes)],
+            )
+
+    @staticmethod
+    def _presence_key(room_id: int) -> str:
+        return ROOM_PRESENCE_KEY.format(room_id=room_id)
+
+    @staticmethod
+    def _disconnected_key(room_id: int) -> str:
+        return ROOM_DISCONNECTED_KEY.format(room_id=room_id)
@@ -0,0 +1,119 @@
+from typing import Annotated
+
+from fastapi import Depends
+from redis import RedisError
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSeatsDTO
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.redis import redis_facade_depend
+from app.utils.logger_config import user_lobby_logger
+
+ROOM_SEATS_KEY = 'lobby:room:{room_id}:seats'
+
+SEAT_UNKNOWN = -1
+SEAT_FULL = 0
+SEAT_RESERVED = 1
+
+# Счётчик создаётся только если его ещё нет, чтобы не затереть резервы параллельных входов
+INIT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'taken', ARGV[1], 'max', ARGV[2])
+return 1
+"""
+
+RESERVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+local taken = tonumber(redis.call('HGET', KEYS[1], 'taken'))
+local max = tonumber(redis.call('HGET', KEYS[1], 'max'))
+if taken >= max then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], 'taken', 1)
+return 1
+"""
+
+RESIZE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+redis.call('HSET', KEYS[1], 'max', ARGV[1])
+return 1
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+if tonumber(redis.call('HINCRBY', KEYS[1], 'taken', -1)) < 0 then
+    redis.call('HSET', KEYS[1], 'taken', 0)
+end
+return 1
+"""
+
+
+class RoomSeats:
+    """Счётчик занятых мест комнаты в Redis.
+
+    Места резервируются Lua-скриптом до обращения к Postgres, поэтому при наплыве входов
+    в заполненную комнату отказ не стоит транзакции. Postgres остаётся источником истины:
+    если счётчика нет или Redis недоступен, вход идёт по обычному пути, а периодическая
+    задача сверяет счётчики с таблицей players.
+    """
+
+    def __init__(
+        self,
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+    ) -> None:
+        self._redis = redis
+
+    async def init(self, room_id: int, taken: int, max_players: int) -> None:
+        """Создать счётчик мест комнаты, если его ещё нет."""
+        await self._run(INIT_SCRIPT, room_id, taken, max_players)
+
+    async def reserve(self, room_id: int) -> int:
+        """Занять место: SEAT_RESERVED, SEAT_FULL или SEAT_UNKNOWN, если счётчика нет."""
+        return await self._run(RESERVE_SCRIPT, room_id)
+
+    async def release(self, room_id: int) -> None:
+        """Освободить место."""
+        await self._run(RELEASE_SCRIPT, room_id)
+
+    async def resize(self, room_id: int, max_players: int) -> None:
+        """Изменить число мест комнаты, не трогая занятые."""
+        await self._run(RESIZE_SCRIPT, room_id, max_players)
+
+    async def drop(self, room_id: int) -> None:
+        """Удалить счётчик удалённой комнаты."""
+        try:
+            await self._redis.delete(self.key(room_id))
+        except RedisError as err:
+            user_lobby_logger.warning(f'Не удалось удалить счётчик мест комнаты {room_id}: {err}')
+
+    async def reconcile(self, rooms: list[RoomSeatsDTO]) -> int:
+        """Выставить счётчики по данным Postgres и удалить счётчики несуществующих комнат.
+
+        Возвращает число удалённых счётчиков.
+        """
+        await self._redis.set_hashes(
+            {self.key(room.id): {'taken': room.player_count, 'max': room.max_players} for room in rooms}
+        )
+        known_keys = {self.key(room.id) for room in rooms}
+        stale_keys = [key for key in await self._redis.scan_keys(self.key('*')) if key not in known_keys]
+        if stale_keys:
+            await self._redis.delete(*stale_keys)
+        return len(stale_keys)
+
+    @staticmethod
+    def key(room_id: int | str) -> str:
+        return ROOM_SEATS_KEY.format(room_id=room_id)
+
+    async def _run(self, script: str, room_id: int, *args: int) -> int:
+        try:
+            return int(await self._redis.eval(script, keys=[self.key(room_id)], args=list(args)))
+        except RedisError as err:
+            user_lobby_logger.warning(f'Счётчик мест комнаты {room_id} недоступен: {err}')
+            return SEAT_UNKNOWN
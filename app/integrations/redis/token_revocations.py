@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+import time
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from app.utils.bloom_filter import BloomFilter
+from app.utils.logger_config import user_lobby_logger
+
+REVOKED_TOKEN_KEY = 'auth:revoked:{jti}'
+USER_REVOKED_BEFORE_KEY = 'auth:user:{user_id}:revoked_before'
+REVOCATIONS_CHANNEL = 'auth:revocations'
+RECONNECT_DELAY_SECONDS = 1
+POLL_TIMEOUT_SECONDS = 1
+
+
+class TokenRevocations:
+    """Отзыв JWT до истечения срока в Redis с локальным фильтром Блума в каждом воркере.
+
+    Отзываются отдельные токены по jti и все токены пользователя, выданные до момента
+    отзыва. Ключи живут не дольше отозванных токенов. Воркер держит фильтр Блума отозванных
+    jti и пользователей, пополняемый через канал Redis, поэтому проверка неотозванного
+    токена обходится без сетевого запроса, а в Redis идут только возможные совпадения.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        token_lifetime_seconds: int,
+        capacity: int,
+        error_rate: float,
+        rebuild_interval: int,
+    ) -> None:
+        self._redis = redis
+        self._token_lifetime_seconds = token_lifetime_seconds
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._rebuild_interval = rebuild_interval
+        self._filter = BloomFilter(capacity, error_rate)
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Запустить синхронизацию фильтра с Redis."""
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Остановить синхронизацию фильтра."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def revoke_token(self, jti: str, expires_at: float) -> None:
+        """Отозвать один токен до его exp."""
+        ttl = int(expires_at - time.time()) + 1
+        if ttl > 0:
+            await self._redis.set(REVOKED_TOKEN_KEY.format(jti=jti), 1, ex=ttl)
+            await self._publish(self._token_member(jti))
+
+    async def revoke_user(self, user_id: int) -> None:
+        """Отозвать все токены пользователя, выданные до этого момента."""
+        await self._redis.set(
+            USER_REVOKED_BEFORE_KEY.format(user_id=user_id),
+            time.time(),
+            ex=self._token_lifetime_seconds,
+        )
+        await self._publish(self._user_member(user_id))
+
+    async def is_revoked(self, jti: str | None, user_id: int, issued_at: float | None) -> bool:
+        """Отозван ли токен. Redis запрашивается только при срабатывании фильтра."""
+        token_member = self._token_member(jti) if jti else None
+        if token_member not in self._filter and self._user_member(user_id) not in self._filter:
+            return False
+        try:
+            revoked_token, revoked_before = await self._redis.mget(
+                REVOKED_TOKEN_KEY.format(jti=jti),
+                USER_REVOKED_BEFORE_KEY.format(user_id=user_id),
+            )
+        except RedisError as err:
+            # Без Redis токены не блокируются: отзыв не должен останавливать всё приложение
+            user_lobby_logger.warning(f'Не удалось проверить отзыв токена пользователя {user_id}: {err}')
+            return False
+        if jti and revoked_token is not None:
+            return True
+        # iat хранится в секундах, поэтому токены, выданные в секунду отзыва, тоже отзываются
+        return revoked_before is not None and (issued_at is None or issued_at < float(revoked_before))
+
+    async def _publish(self, member: str) -> None:
+        self._filter.add(member)
+        await self._redis.publish(REVOCATIONS_CHANNEL, member)
+
+    async def _rebuild(self) -> None:
+        """Собрать фильтр заново из ключей Redis, забыв истёкшие отзывы."""
+        bloom_filter = BloomFilter(self._capacity, self._error_rate)
+        async for key in self._redis.scan_iter(match=REVOKED_TOKEN_KEY.format(jti='*')):
+            bloom_filter.add(self._token_member(key.removeprefix(REVOKED_TOKEN_KEY.format(jti=''))))
+        async for key in self._redis.scan_iter(match=USER_REVOKED_BEFORE_KEY.format(user_id='*')):
+            bloom_filter.add(self._user_member(key.split(':')[2]))
+        self._filter = bloom_filter
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    # Подписка до пересборки, чтобы отзывы во время сканирования не потерялись
+                    await pubsub.subscribe(REVOCATIONS_CHANNEL)
+                    await self._rebuild()
+                    rebuilt_at = time.monotonic()
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=POLL_TIMEOUT_SECONDS,
+                        )
+                        if message is not None:
+                            self._filter.add(message['data'])
+                        if time.monotonic() - rebuilt_at > self._rebuild_interval:
+                            await self._rebuild()
+                            rebuilt_at = time.monotonic()
+            except RedisError as err:
+                user_lobby_logger.error(f'Потеряна подписка на {REVOCATIONS_CHANNEL}: {err}')
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    @staticmethod
+    def _token_member(jti: str) -> str:
+        return f'jti:{jti}'
+
+    @staticmethod
+    def _user_member(user_id: int | str) -> str:
+        return f'user:{user_id}'
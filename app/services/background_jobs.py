@@ -0,0 +1,101 @@
+import contextlib
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.integrations.postgres.providers import postgres_engine_provide, session_factory_provide, session_provide
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from app.integrations.postgres.repositories.user_repository import UserRepository
+from app.integrations.redis.config import async_redis_context
+from app.integrations.redis.deadlines import parse_player_timeout_deadline
+from app.integrations.redis.lobby_cache import LobbyCache
+from app.integrations.redis.profile_cache import ProfileCache, invalidate_committed_profiles
+from app.integrations.redis.redis import RedisFacade
+from app.integrations.redis.room_bans import RoomBans
+from app.integrations.redis.room_matchmaking import RoomMatchmaking
+from app.integrations.redis.room_seats import RoomSeats
+from app.services.lobby_service import LobbyService
+from app.utils.config import get_env_settings
+from app.utils.logger_config import user_lobby_logger
+from app.utils.password_hasher import get_password_hasher
+
+
+@asynccontextmanager
+async def postgres_task_context(
+    engine: AsyncEngine | None = None,
+) -> AsyncGenerator[AsyncSession]:
+    """Сессия Postgres с собственной транзакцией для фоновых задач, которым не нужен Redis.
+
+    Без engine создаётся собственный пул подключений, как в отдельном процессе Celery.
+    """
+    async with contextlib.AsyncExitStack() as stack:
+        if engine is None:
+            engine = await stack.enter_async_context(
+                postgres_engine_provide(get_env_settings().postgres_dsn.get_secret_value())
+            )
+        session_factory = await stack.enter_async_context(session_factory_provide(engine))
+        session = await stack.enter_async_context(session_provide(session_factory, mode='runtime'))
+        yield session
+
+
+@asynccontextmanager
+async def task_session_context(
+    engine: AsyncEngine | None = None,
+) -> AsyncGenerator[tuple[AsyncSession, RedisFacade]]:
+    """Сессия Postgres с собственной транзакцией и Redis для фоновых задач."""
+    async with postgres_task_context(engine) as session, async_redis_context() as redis:
+        yield session, RedisFacade(redis)
+        # Фиксируем до выхода из session_provide, чтобы сбросить кэш профилей, пока Redis ещё открыт
+        await session.commit()
+        await invalidate_committed_profiles(session)
+
+
+@asynccontextmanager
+async def lobby_service_task_context(
+    engine: AsyncEngine | None = None,
+) -> AsyncGenerator[LobbyService]:
+    """Сервис лобби для фоновых задач, собранный без DI FastAPI."""
+    async with task_session_context(engine) as (session, redis):
+        yield build_lobby_service(session, redis)
+
+
+def build_lobby_service(session: AsyncSession, redis: RedisFacade) -> LobbyService:
+    """Сервис лобби на сессии и Redis фоновой задачи."""
+    return LobbyService(
+        lobby_repository=LobbyRepository(session, ProfileCache(redis)),
+        user_repository=UserRepository(session, ProfileCache(redis)),
+        lobby_cache=LobbyCache(redis),
+        redis=redis,
+        room_seats=RoomSeats(redis),
+        room_bans=RoomBans(redis),
+        room_matchmaking=RoomMatchmaking(redis),
+    )
+
+
+async def expire_disconnected_players(engine: AsyncEngine, deadlines: list[str]) -> None:
+    """Удалить из комнат игроков, чьи сроки ожидания возвращения истекли.
+
+    Обработчик DeadlineRunner, работает в процессе приложения на его пуле подключений.
+    """
+    players = [player for player in map(parse_player_timeout_deadline, deadlines) if player is not None]
+    async with lobby_service_task_context(engine) as lobby_service:
+        removed = await lobby_service.expire_disconnected_players(players=players)
+    user_lobby_logger.info(f'Сроки ожидания игроков истекли: {len(players)}, удалено из комнат {removed}')
+
+
+async def rehash_password(
+    engine: AsyncEngine,
+    user_id: int,
+    raw_password: str,
+    old_hash_password: str,
+) -> None:
+    """Перехешировать пароль пользователя под текущую стоимость bcrypt после успешного входа.
+
+    Фоновая задача FastAPI, работает в процессе приложения на его пуле подключений.
+    """
+    new_hash_password = await get_password_hasher().hash(raw_password)
+    async with postgres_task_context(engine) as session:
+        updated = await UserRepository(session).update_hash_password(user_id, old_hash_password, new_hash_password)
+    if updated:
+        user_lobby_logger.info(f'Пароль пользователя {user_id} перехеширован под текущую стоимость')
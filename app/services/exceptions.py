@@ -75,6 +75,14 @@ class FileExtensionService(BaseExceptionService):
     pass
 
 
+class FileTooLargeService(BaseExceptionService):
+    pass
+
+
+class ImageTooLargeService(BaseExceptionService):
+    pass
+
+
 class InvalidIsActiveService(BaseExceptionService):
     pass
 
@@ -85,3 +93,27 @@ class UserAlreadyActiveService(BaseExceptionService):
 
 class DeleteRoomNotAdminService(BaseExceptionService):
     pass
+
+
+class InvalidCursorService(BaseExceptionService):
+    pass
+
+
+class PlayerNotInRoomService(BaseExceptionService):
+    pass
+
+
+class NotRoomHostService(BaseExceptionService):
+    pass
+
+
+class MaxPlayersBelowCountService(BaseExceptionService):
+    pass
+
+
+class NoRoomForQuickJoinService(BaseExceptionService):
+    pass
+
+
+class SearchTimeoutService(BaseExceptionService):
+    pass
@@ -1,63 +1,285 @@
-from typing import Annotated
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Annotated, Any, TypeVar
 
 from fastapi import Depends
+from redis import RedisError
 
-from app.integrations.postgres.exceptions import RoomNotFoundPostgres, UserNotFoundPostgres, TitleCreateRoomPostgres
+from app.integrations.postgres.dtos.lobby_dto import (
+    PlayerSchemaDTO,
+    RoomCursorDTO,
+    RoomFilterDTO,
+    RoomSchemaDTO,
+    RoomSettingsDTO,
+    RoomSummaryDTO,
+)
+from app.integrations.postgres.exceptions import (
+    RoomNotFoundPostgres,
+    SearchTimeoutPostgres,
+    TitleCreateRoomPostgres,
+    UserNotFoundPostgres,
+)
 from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
 
 from app.integrations.postgres.repositories.user_repository import UserRepository
+from app.integrations.redis.lobby_cache import LobbyCache
+from app.integrations.redis.redis import RedisFacade
+from app.integrations.redis.room_bans import RoomBans
+from app.integrations.redis.room_matchmaking import RoomMatchmaking
+from app.integrations.redis.room_seats import SEAT_FULL, SEAT_RESERVED, SEAT_UNKNOWN, RoomSeats
 from app.services.exceptions import (
     UserInRoomService,
     UserNotFoundService, TitleCreateRoomService, RoomNotFoundService, NoSlotService, BlackListService,
     DeleteRoomNotAdminService,
+    InvalidCursorService,
+    NotRoomHostService,
+    PlayerNotInRoomService,
+    PasswordRoomNotValidService,
+    MaxPlayersBelowCountService,
+    NoRoomForQuickJoinService,
+    SearchTimeoutService,
 )
-from app.transports.handlers.lobby.exceptions import PasswordRoomNotValidError
 from app.transports.handlers.lobby.schemas import (
     JoinRoomSchema,
+    LobbyDeltaSchema,
+    LobbyDeltaType,
+    LobbySnapshotResponse,
     PlayerSchemaResponse,
     RoomCreateResponse,
     RoomCreateSchema,
+    RoomFilterSchema,
+    RoomPageResponse,
     RoomResponse,
+    RoomSummaryPageResponse,
+    RoomSummaryResponse,
+    RoomUpdateSchema,
 )
+from app.transports.depends.redis import redis_facade_depend
+from app.transports.handlers.lobby.utils import decode_room_cursor, encode_room_cursor
+from app.utils.config import get_env_settings
 from app.utils.logger_config import user_lobby_logger
 
+ResponseT = TypeVar('ResponseT')
+
 
 class LobbyService:
     def __init__(
         self,
         lobby_repository: Annotated[LobbyRepository, Depends()],
         user_repository: Annotated[UserRepository, Depends()],
+        lobby_cache: Annotated[LobbyCache, Depends()],
+        redis: Annotated[RedisFacade, Depends(redis_facade_depend)],
+        room_seats: Annotated[RoomSeats, Depends()],
+        room_bans: Annotated[RoomBans, Depends()],
+        room_matchmaking: Annotated[RoomMatchmaking, Depends()],
     ) -> None:
         self._lobby_repository = lobby_repository
         self._user_repository = user_repository
+        self._lobby_cache = lobby_cache
+        self._redis = redis
+        self._room_seats = room_seats
+        self._room_bans = room_bans
+        self._room_matchmaking = room_matchmaking
+
+    async def get_lobby_version(self) -> int | None:
+        """Текущая версия лобби, меняется при любом изменении комнат или игроков"""
+        return await self._lobby_cache.get_version()
 
     async def get_all_rooms(
         self,
     ) -> list[RoomResponse]:
         """Сервис получения всех комнат"""
+        return await self._cached(
+            params={'view': 'all'},
+            load=self._load_all_rooms,
+            dump=lambda rooms: [room.model_dump(mode='json') for room in rooms],
+            restore=lambda data: [RoomResponse(**room) for room in data],
+        )
+
+    async def _load_all_rooms(self) -> list[RoomResponse]:
         result = await self._lobby_repository.get_all_rooms()
         return [RoomResponse(**room.model_dump()) for room in result]
 
+    async def get_rooms_page(
+        self,
+        filters: RoomFilterSchema,
+        limit: int,
+        cursor: str | None = None,
+    ) -> RoomPageResponse:
+        """Сервис получения страницы комнат"""
+        return await self._cached(
+            params={'view': 'page', 'filters': filters.model_dump(), 'limit': limit, 'cursor': cursor},
+            load=lambda: self._load_rooms_page(filters, limit, cursor),
+            dump=lambda page: page.model_dump(mode='json'),
+            restore=lambda data: RoomPageResponse(**data),
+        )
+
+    async def _load_rooms_page(
+        self,
+        filters: RoomFilterSchema,
+        limit: int,
+        cursor: str | None,
+    ) -> RoomPageResponse:
+        # Берём на одну запись больше, чтобы понять, есть ли следующая страница
+        rooms = await self._lobby_repository.get_rooms_page(
+            filters=RoomFilterDTO(**filters.model_dump()),
+            limit=limit + 1,
+            cursor=self._decode_cursor(cursor),
+        )
+        return RoomPageResponse(
+            items=[RoomResponse(**room.model_dump()) for room in rooms[:limit]],
+            next_cursor=self._next_cursor(rooms, limit),
+        )
+
+    async def get_rooms_summary_page(
+        self,
+        filters: RoomFilterSchema,
+        limit: int,
+        cursor: str | None = None,
+    ) -> RoomSummaryPageResponse:
+        """Сервис получения страницы комнат без списка игроков"""
+        return await self._cached(
+            params={'view': 'summary', 'filters': filters.model_dump(), 'limit': limit, 'cursor': cursor},
+            load=lambda: self._load_rooms_summary_page(filters, limit, cursor),
+            dump=lambda page: page.model_dump(mode='json'),
+            restore=lambda data: RoomSummaryPageResponse(**data),
+        )
+
+    async def _load_rooms_summary_page(
+        self,
+        filters: RoomFilterSchema,
+        limit: int,
+        cursor: str | None,
+    ) -> RoomSummaryPageResponse:
+        rooms = await self._lobby_repository.get_rooms_summary_page(
+            filters=RoomFilterDTO(**filters.model_dump()),
+            limit=limit + 1,
+            cursor=self._decode_cursor(cursor),
+        )
+        return RoomSummaryPageResponse(
+            items=[RoomSummaryResponse(**room.model_dump()) for room in rooms[:limit]],
+            next_cursor=self._next_cursor(rooms, limit),
+        )
+
+    async def _cached(
+        self,
+        params: dict[str, Any],
+        load: Callable[[], Awaitable[ResponseT]],
+        dump: Callable[[ResponseT], Any],
+        restore: Callable[[Any], ResponseT],
+    ) -> ResponseT:
+        """Отдать список комнат из снимка текущей версии лобби или собрать его из БД."""
+        version = await self._lobby_cache.get_version()
+        if version is None:
+            return await load()
+
+        snapshot = await self._lobby_cache.get_snapshot(version, params)
+        if snapshot is not None:
+            return restore(snapshot)
+
+        result = await load()
+        await self._lobby_cache.set_snapshot(version, params, dump(result))
+        return result
+
+    async def search_rooms(
+        self,
+        query: str,
+        limit: int,
+    ) -> list[RoomSummaryResponse]:
+        """Сервис поиска комнат по названию"""
+        try:
+            rooms = await self._lobby_repository.search_rooms(
+                query=query.strip(),
+                limit=limit,
+                timeout_ms=get_env_settings().lobby_search_timeout_ms,
+            )
+        except SearchTimeoutPostgres as exc:
+            user_lobby_logger.warning(f'Поиск комнат по запросу {query!r} не уложился в лимит времени')
+            raise SearchTimeoutService from exc
+        return [RoomSummaryResponse(**room.model_dump()) for room in rooms]
+
+    async def get_lobby_snapshot(self) -> LobbySnapshotResponse:
+        """Сервис получения снимка лобби с номером последней применённой дельты"""
+        seq = await self._lobby_cache.get_version()
+        rooms = await self._lobby_repository.get_rooms_summary_page(filters=RoomFilterDTO(), limit=None)
+        return LobbySnapshotResponse(
+            seq=seq or 0,
+            rooms=[RoomSummaryResponse(**room.model_dump()) for room in rooms],
+        )
+
+    async def _publish_deltas(self, *deltas: tuple[LobbyDeltaType, int, dict[str, Any]]) -> None:
+        """Зафиксировать изменения лобби, сбросить кэш списка и разослать дельты в WebSocket
+
+        Через этот метод проходит каждое изменение комнат и игроков в сервисе, поэтому кэш
+        списка и ETag сбрасываются на всех путях записи, а не только при создании и входе.
+        """
+        # Коммитим до рассылки, чтобы клиент, получивший дельту, уже видел новые данные
+        await self._lobby_repository.commit()
+        for delta_type, room_id, data in deltas:
+            seq = await self._lobby_cache.invalidate()
+            if seq is None:
+                # Без номера клиент не сможет упорядочить дельту, он догонит состояние по снимку
+                continue
+            delta = LobbyDeltaSchema(seq=seq, type=delta_type, room_id=room_id, data=data)
+            try:
+                await self._redis.publish_ws_event(delta.model_dump(mode='json'))
+            except RedisError as err:
+                user_lobby_logger.warning(f'Не удалось отправить дельту {delta_type} комнаты {room_id}: {err}')
+
+    async def _sync_matchmaking(self, room: RoomSchemaDTO | RoomSettingsDTO, player_count: int) -> None:
+        """Обновить комнату в очереди быстрого входа после изменения состава игроков или настроек"""
+        await self._room_matchmaking.update(
+            room.id,
+            free_slots=room.max_players - player_count,
+            game_name=room.game_name,
+            is_open=not room.is_private and not room.password and not room.started,
+        )
+
+    @staticmethod
+    def _decode_cursor(cursor: str | None) -> RoomCursorDTO | None:
+        try:
+            return decode_room_cursor(cursor) if cursor else None
+        except ValueError as exc:
+            raise InvalidCursorService from exc
+
+    @staticmethod
+    def _next_cursor(rooms: Sequence[RoomSchemaDTO | RoomSummaryDTO], limit: int) -> str | None:
+        if len(rooms) <= limit:
+            return None
+        last_room = rooms[limit - 1]
+        return encode_room_cursor(created_at=last_room.created_at, room_id=last_room.id)
+
     async def create_room(self, room_data: RoomCreateSchema, current_user_id: int) -> RoomCreateResponse:
         """Сервис создания комнаты"""
         user_lobby_logger.info(f'Пользователь {current_user_id} создаёт комнату с данными: {room_data.model_dump()}')
         try:
-            user = await self._user_repository.get_one_by_id(user_id=current_user_id)
-        except UserNotFoundPostgres as exc:
-            user_lobby_logger.error(f'Пользователь {current_user_id} не найден')
-            raise UserNotFoundService from exc
-
-        try:
-            room = await self._lobby_repository.create_room(room_data=room_data)
+            created = await self._lobby_repository.create_room_with_host(room_data=room_data, user_id=current_user_id)
         except TitleCreateRoomPostgres as exc:
             user_lobby_logger.error(f'Ошибка при создании комнаты: название {room_data.title} уже занято')
             raise TitleCreateRoomService from exc
 
-        if user.in_room:
+        if created is None:
+            # Запрос ничего не записал: пользователя нет или он уже в комнате
+            try:
+                await self._user_repository.get_one_by_id(user_id=current_user_id)
+            except UserNotFoundPostgres as exc:
+                user_lobby_logger.error(f'Пользователь {current_user_id} не найден')
+                raise UserNotFoundService from exc
             user_lobby_logger.warning(f'Пользователь {current_user_id} уже находится в другой комнате')
             raise UserInRoomService
 
-        player = await self._lobby_repository.create_player(room_id=room.id, user_id=current_user_id, is_host=True)
+        room, player = created.room, created.host
+        summary = RoomSummaryResponse(
+            **room.model_dump(),
+            started=False,
+            player_count=1,
+            free_slots=room.max_players - 1,
+            host_name=player.name,
+        )
+        await self._publish_deltas(('room_created', room.id, {'room': summary.model_dump(mode='json')}))
+        await self._room_seats.init(room.id, taken=1, max_players=room.max_players)
+        await self._room_matchmaking.update(
+            room.id, free_slots=summary.free_slots, game_name=room.game_name, is_open=not room.is_private
+        )
         user_lobby_logger.info(f'Комната {room.id} успешно создана пользователем {current_user_id}')
         return RoomCreateResponse(**room.model_dump(), players=[PlayerSchemaResponse(**player.model_dump())])
 
@@ -72,44 +294,116 @@ class LobbyService:
             f'Пользователь {user_id} пытается войти в комнату {room_id} с паролем: {join_data.password or "None"}'
         )
 
-        await self._lobby_repository.delete_player_except_current_room(user_id=user_id, room_id=room_id)
+        banned = await self._room_bans.is_banned(room_id, user_id)
+        if banned:
+            user_lobby_logger.warning(f'Пользователь {user_id} находится в чёрном списке комнаты {room_id}')
+            raise BlackListService
+
+        reservation = await self._room_seats.reserve(room_id)
+        if reservation == SEAT_FULL:
+            # Отказ по счётчику мест в Redis, без транзакции в Postgres
+            user_lobby_logger.warning(f'Комната {room_id} переполнена')
+            raise NoSlotService
 
         try:
-            user = await self._user_repository.get_one_by_id(user_id)
-        except UserNotFoundPostgres as exc:
-            user_lobby_logger.error(f'Пользователь {user_id} не найден')
-            raise UserNotFoundService from exc
+            room, seat_taken = await self._join_room(
+                join_data=join_data,
+                room_id=room_id,
+                user_id=user_id,
+                load_bans=banned is None,
+            )
+        except Exception:
+            if reservation == SEAT_RESERVED:
+                await self._room_seats.release(room_id)
+            raise
 
-        if user.in_room:
-            user_lobby_logger.warning(f'Пользователь {user_id} уже в другой комнате')
-            raise UserInRoomService
+        if reservation == SEAT_RESERVED and not seat_taken:
+            await self._room_seats.release(room_id)
+        elif reservation == SEAT_UNKNOWN:
+            await self._room_seats.init(room_id, taken=len(room.players), max_players=room.max_players)
+        if seat_taken:
+            await self._sync_matchmaking(room, player_count=len(room.players))
+
+        user_lobby_logger.info(f'Пользователь {user_id} успешно вошёл в комнату {room_id}')
+        return RoomResponse(**room.model_dump())
 
-        if not await self._lobby_repository.find_player(user_id=user_id):
-            await self._lobby_repository.create_player(room_id=room_id, user_id=user_id, is_host=False)
-            user_lobby_logger.info(f'Пользователь {user_id} добавлен в комнату {room_id}')
+    async def quick_join(
+        self,
+        user_id: int,
+        game_name: str | None,
+    ) -> RoomResponse:
+        """Сервис быстрого входа в самую заполненную открытую комнату"""
+        room_ids = await self._room_matchmaking.candidates(game_name, limit=get_env_settings().quick_join_candidates)
+        for room_id in room_ids:
+            try:
+                return await self.join_lobby(join_data=JoinRoomSchema(password=None), room_id=room_id, user_id=user_id)
+            except RoomNotFoundService:
+                await self._room_matchmaking.remove(room_id)
+            except (NoSlotService, BlackListService, PasswordRoomNotValidService):
+                # Комнату заняли раньше или в неё нельзя этому пользователю: снимаем блокировку
+                # строки, чтобы не держать её, пока пробуем следующую, и не ловить взаимоблокировки
+                await self._lobby_repository.rollback()
+        user_lobby_logger.warning(f'Для пользователя {user_id} не нашлось комнаты для быстрого входа в {game_name}')
+        raise NoRoomForQuickJoinService
 
+    async def _join_room(
+        self,
+        join_data: JoinRoomSchema,
+        room_id: int,
+        user_id: int,
+        load_bans: bool,
+    ) -> tuple[RoomSchemaDTO, bool]:
+        """Вход в комнату под блокировкой строки. Возвращает комнату и признак того, что занято новое место"""
         try:
-            room = await self._lobby_repository.get_one_room(room_id)
+            join_check = await self._lobby_repository.lock_room_for_join(room_id=room_id, user_id=user_id)
         except RoomNotFoundPostgres as exc:
             user_lobby_logger.error(f'Комната {room_id} не найдена')
             raise RoomNotFoundService from exc
+        room = join_check.room
+        if load_bans:
+            await self._room_bans.load(room_id, join_check.banned_user_ids)
+
+        if join_check.user_in_room is None:
+            user_lobby_logger.error(f'Пользователь {user_id} не найден')
+            raise UserNotFoundService
 
-        if len(room.players) > room.max_players:
+        if join_check.user_in_room:
+            user_lobby_logger.warning(f'Пользователь {user_id} уже в другой комнате')
+            raise UserInRoomService
+
+        player = next((player for player in room.players if player.user_id == user_id), None)
+        if player is None and len(room.players) >= room.max_players:
             user_lobby_logger.warning(f'Комната {room_id} переполнена')
             raise NoSlotService
 
         if room.password and join_data.password != room.password:
             user_lobby_logger.warning(f'Неверный пароль для входа в комнату {room_id} пользователем {user_id}')
-            raise PasswordRoomNotValidError
+            raise PasswordRoomNotValidService
 
-        if await self._lobby_repository.black_list(room_id=room_id, user_id=user_id):
+        if user_id in join_check.banned_user_ids:
             user_lobby_logger.warning(f'Пользователь {user_id} находится в чёрном списке комнаты {room_id}')
             raise BlackListService
 
-        await self._lobby_repository.user_in_room(user_id=user_id, in_room=True)
+        if player is not None:
+            # Игрок уже в комнате, новое место не занимается
+            await self._lobby_repository.user_in_room(user_id=user_id, in_room=True)
+            return room, False
 
-        user_lobby_logger.info(f'Пользователь {user_id} успешно вошёл в комнату {room_id}')
-        return RoomResponse(**room.model_dump())
+        player = await self._lobby_repository.add_player_to_room(room_id=room_id, user_id=user_id)
+        room = room.model_copy(update={'players': [*room.players, player]})
+        user_lobby_logger.info(f'Пользователь {user_id} добавлен в комнату {room_id}')
+        await self._publish_deltas(
+            (
+                'player_joined',
+                room_id,
+                {
+                    'player': PlayerSchemaResponse(**player.model_dump()).model_dump(mode='json'),
+                    'player_count': len(room.players),
+                },
+            )
+        )
+
+        return room, True
 
     async def delete_lobby(
         self,
@@ -123,5 +417,221 @@ class LobbyService:
            raise UserNotFoundService from exc
         if user.is_admin:
             await self._lobby_repository.delete_room(room_id=room_id)
+            await self._publish_deltas(('room_removed', room_id, {}))
+            await self._room_seats.drop(room_id)
+            await self._room_bans.drop(room_id)
+            await self._room_matchmaking.remove(room_id)
         else:
             raise DeleteRoomNotAdminService
+
+    async def leave_lobby(
+        self,
+        room_id: int,
+        user_id: int,
+    ) -> None:
+        """Сервис выхода из лобби"""
+        try:
+            room = await self._lobby_repository.get_one_room(room_id)
+        except RoomNotFoundPostgres as exc:
+            user_lobby_logger.error(f'Комната {room_id} не найдена')
+            raise RoomNotFoundService from exc
+
+        player = next((player for player in room.players if player.user_id == user_id), None)
+        if player is None:
+            user_lobby_logger.warning(f'Пользователь {user_id} не находится в комнате {room_id}')
+            raise PlayerNotInRoomService
+        await self._remove_player(room, player)
+        user_lobby_logger.info(f'Пользователь {user_id} вышел из комнаты {room_id}')
+
+    async def expire_disconnected_players(
+        self,
+        players: list[tuple[int, int]],
+    ) -> int:
+        """Сервис удаления игроков (room_id, user_id), не вернувшихся после разрыва соединения
+
+        Игроки, которые уже вернулись или покинули комнату, пропускаются. Возвращает число удалённых.
+        """
+        removed = 0
+        for room_id, user_id in players:
+            try:
+                room = await self._lobby_repository.get_one_room(room_id)
+            except RoomNotFoundPostgres:
+                continue
+            player = next((player for player in room.players if player.user_id == user_id), None)
+            if player is None or not player.is_disconnect:
+                continue
+            await self._remove_player(room, player)
+            removed += 1
+            user_lobby_logger.info(f'Пользователь {user_id} не вернулся и удалён из комнаты {room_id}')
+        return removed
+
+    async def _remove_player(self, room: RoomSchemaDTO, player: PlayerSchemaDTO) -> None:
+        """Удалить игрока из комнаты, передав права хоста следующему или удалив опустевшую комнату"""
+        room_id, user_id = room.id, player.user_id
+        await self._lobby_repository.delete_player(user_id=user_id)
+        await self._lobby_repository.user_in_room(user_id=user_id, in_room=False)
+        remaining = [other for other in room.players if other.id != player.id]
+        if not remaining:
+            await self._lobby_repository.delete_room(room_id=room_id)
+            await self._publish_deltas(('room_removed', room_id, {}))
+            await self._room_seats.drop(room_id)
+            await self._room_bans.drop(room_id)
+            await self._room_matchmaking.remove(room_id)
+            user_lobby_logger.info(f'Последний игрок {user_id} вышел, комната {room_id} удалена')
+            return
+
+        deltas: list[tuple[LobbyDeltaType, int, dict[str, Any]]] = [
+            ('player_left', room_id, {'player_id': player.id, 'player_count': len(remaining)}),
+        ]
+        if player.is_host:
+            # Хост передаётся первому игроку на связи, а если отключены все - первому по списку
+            successor = next((other for other in remaining if not other.is_disconnect), remaining[0])
+            await self._lobby_repository.change_host(player_id=successor.id, is_host=True)
+            deltas.append(('host_changed', room_id, {'player_id': successor.id, 'host_name': successor.name}))
+        await self._publish_deltas(*deltas)
+        await self._room_seats.release(room_id)
+        await self._sync_matchmaking(room, player_count=len(remaining))
+
+    async def kick_player(
+        self,
+        room_id: int,
+        host_user_id: int,
+        user_id: int,
+    ) -> None:
+        """Сервис исключения игрока из комнаты с баном (только хост)"""
+        try:
+            room = await self._lobby_repository.get_one_room(room_id)
+        except RoomNotFoundPostgres as exc:
+            user_lobby_logger.error(f'Комната {room_id} не найдена')
+            raise RoomNotFoundService from exc
+
+        if not any(player.user_id == host_user_id and player.is_host for player in room.players):
+            user_lobby_logger.warning(f'Пользователь {host_user_id} не хост комнаты {room_id} и не может банить')
+            raise NotRoomHostService
+        if user_id == host_user_id:
+            user_lobby_logger.warning(f'Хост {host_user_id} пытается забанить себя в комнате {room_id}')
+            raise NotRoomHostService
+
+        kicked_player = await self._lobby_repository.kick_and_ban(user_id=user_id, room_id=room_id)
+        if kicked_player is not None:
+            await self._publish_deltas(
+                ('player_left', room_id, {'player_id': kicked_player.id, 'player_count': len(room.players) - 1}),
+            )
+            await self._room_seats.release(room_id)
+            await self._sync_matchmaking(room, player_count=len(room.players) - 1)
+        else:
+            await self._lobby_repository.commit()
+        await self._room_bans.add(room_id, user_id)
+        user_lobby_logger.info(f'Пользователь {user_id} исключён и забанен в комнате {room_id} хостом {host_user_id}')
+
+    async def update_room_settings(
+        self,
+        room_id: int,
+        host_user_id: int,
+        settings: RoomUpdateSchema,
+    ) -> RoomSummaryResponse:
+        """Сервис изменения настроек комнаты (только хост)"""
+        room = await self._lobby_repository.update_room_settings(
+            room_id=room_id, host_user_id=host_user_id, settings=settings
+        )
+        if room is None:
+            # Запрос ничего не изменил: выясняем причину отдельным чтением
+            try:
+                current_room = await self._lobby_repository.get_one_room(room_id)
+            except RoomNotFoundPostgres as exc:
+                user_lobby_logger.error(f'Комната {room_id} не найдена')
+                raise RoomNotFoundService from exc
+            if not any(player.user_id == host_user_id and player.is_host for player in current_room.players):
+                user_lobby_logger.warning(f'Пользователь {host_user_id} не хост комнаты {room_id}')
+                raise NotRoomHostService
+            user_lobby_logger.warning(
+                f'Нельзя уменьшить число мест комнаты {room_id} до {settings.max_players}: '
+                f'в ней {len(current_room.players)} игроков'
+            )
+            raise MaxPlayersBelowCountService
+
+        summary = RoomSummaryResponse(**room.model_dump(exclude={'password'}))
+        await self._publish_deltas(('room_updated', room.id, {'room': summary.model_dump(mode='json')}))
+        if 'max_players' in settings.model_fields_set:
+            await self._room_seats.resize(room.id, max_players=room.max_players)
+        await self._sync_matchmaking(room, player_count=room.player_count)
+        user_lobby_logger.info(
+            f'Настройки комнаты {room_id} изменены хостом {host_user_id}: {sorted(settings.model_fields_set)}'
+        )
+        return summary
+
+    async def publish_players_updated(self, players: Sequence[PlayerSchemaDTO]) -> None:
+        """Зафиксировать и разослать комнатам игроков, изменённых вне сервиса лобби (например, аватар)"""
+        await self._publish_deltas(
+            *(
+                (
+                    'player_updated',
+                    player.room_id,
+                    {'player': PlayerSchemaResponse(**player.model_dump()).model_dump(mode='json')},
+                )
+                for player in players
+            )
+        )
+
+    async def publish_connection_changes(
+        self,
+        disconnected: Sequence[tuple[int, int]],
+        reconnected: Sequence[tuple[int, int]],
+    ) -> None:
+        """Зафиксировать и разослать смены состояния связи игроков (room_id, user_id), записанные вне сервиса"""
+        await self._publish_deltas(
+            *(
+                ('player_disconnected', room_id, {'user_id': user_id, 'is_disconnect': True})
+                for room_id, user_id in disconnected
+            ),
+            *(
+                ('player_reconnected', room_id, {'user_id': user_id, 'is_disconnect': False})
+                for room_id, user_id in reconnected
+            ),
+        )
+
+    async def start_game(
+        self,
+        room_id: int,
+        host_user_id: int,
+    ) -> None:
+        """Сервис начала игры в комнате (только хост)"""
+        try:
+            room = await self._lobby_repository.get_one_room(room_id)
+        except RoomNotFoundPostgres as exc:
+            user_lobby_logger.error(f'Комната {room_id} не найдена')
+            raise RoomNotFoundService from exc
+
+        if not any(player.user_id == host_user_id and player.is_host for player in room.players):
+            user_lobby_logger.warning(f'Пользователь {host_user_id} не хост комнаты {room_id} и не может начать игру')
+            raise NotRoomHostService
+        if room.started:
+            return
+
+        await self._lobby_repository.game_started(room_id=room_id, started=True)
+        await self._publish_deltas(('started', room_id, {'started': True}))
+        # В начатую игру войти нельзя, поэтому комната уходит из очереди быстрого входа
+        await self._room_matchmaking.remove(room_id)
+        user_lobby_logger.info(f'Игра в комнате {room_id} начата хостом {host_user_id}')
+
+    async def purge_idle_rooms(
+        self,
+        idle_seconds: int,
+        batch_size: int,
+    ) -> int:
+        """Сервис удаления простаивающих комнат пачками, возвращает количество удалённых комнат"""
+        purged = 0
+        while True:
+            room_ids = await self._lobby_repository.delete_idle_rooms(idle_seconds=idle_seconds, limit=batch_size)
+            if not room_ids:
+                break
+            # Каждая пачка фиксируется отдельно, чтобы блокировки комнат не держались на всё время чистки
+            await self._publish_deltas(*(('room_removed', room_id, {}) for room_id in room_ids))
+            for room_id in room_ids:
+                await self._room_seats.drop(room_id)
+                await self._room_bans.drop(room_id)
+                await self._room_matchmaking.remove(room_id)
+            purged += len(room_ids)
+            if len(room_ids) < batch_size:
+                break
+        return purged
@@ -1,13 +1,15 @@
 from typing import Annotated
 
-from fastapi import Depends, File, UploadFile
-from passlib.context import CryptContext
+from PIL import Image
+from fastapi import BackgroundTasks, Depends, File, UploadFile
 from pydantic import EmailStr
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.integrations.postgres.dtos.user_dto import (
     RecoveryPasswordDTO,
     UserCreateDTO,
     UserTempCreateDTO,
+    UserProfileDTO,
     UserUpdatePartialDTO,
 )
 from app.integrations.postgres.exceptions import (
@@ -16,10 +18,15 @@ from app.integrations.postgres.exceptions import (
     UserNotFoundPostgres,
 )
 from app.integrations.postgres.repositories.user_repository import UserRepository
+from app.integrations.redis.profile_cache import ProfileCache
+from app.integrations.redis.token_revocations import TokenRevocations
+from app.services.background_jobs import rehash_password
 from app.services.exceptions import (
     EmailAlreadyExistsService,
     FileExtensionService,
     FileNotUploadService,
+    FileTooLargeService,
+    ImageTooLargeService,
     InvalidIsActiveService,
     InvalidNewPasswordService,
     InvalidOldPasswordService,
@@ -30,6 +37,8 @@ from app.services.exceptions import (
     UsernameAlreadyExistsService,
     UserNotFoundService,
 )
+from app.services.lobby_service import LobbyService
+from app.transports.depends.app_scope import postgres_engine_depend, token_revocations_depend
 from app.transports.handlers.users.exceptions import FileNotUploadError
 from app.transports.handlers.users.schemas import (
     AccessResetPasswordResponse,
@@ -37,63 +46,107 @@ from app.transports.handlers.users.schemas import (
     ActivateUser,
     LoginRequest,
     LoginTempRequest,
-    PlayerStatisticResponse,
     RecoveryPassword,
     ResetPassword,
     TempUserCreate,
     TokenResponse,
     UpdatedUserResponse,
-    UserAchievementsResponse,
     UserCreate,
     UserCreateResponse,
+    UserPublicBatchResponse,
     UserPublicResponse,
     UserResponse,
     UserTempResponse,
     UserUpdate,
 )
-from app.transports.handlers.users.utils import create_access_token, create_refresh_token, resize_user_avatar
-
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+from app.transports.handlers.users.utils import (
+    TokenClaims,
+    create_access_token,
+    create_refresh_token,
+)
+from app.utils.avatar_processor import (
+    AVATAR_SIGNATURE_SIZE,
+    AvatarProcessor,
+    get_avatar_processor,
+    read_avatar_size,
+    sniff_avatar_format,
+)
+from app.utils.config import get_env_settings
+from app.utils.password_hasher import PasswordHasher, get_password_hasher
 
 
 class UserService:
     def __init__(
         self,
         user_repository: Annotated[UserRepository, Depends()],
+        profile_cache: Annotated[ProfileCache, Depends()],
+        password_hasher: Annotated[PasswordHasher, Depends(get_password_hasher)],
+        postgres_engine: Annotated[AsyncEngine, Depends(postgres_engine_depend)],
+        background_tasks: BackgroundTasks,
+        token_revocations: Annotated[TokenRevocations, Depends(token_revocations_depend)],
+        avatar_processor: Annotated[AvatarProcessor, Depends(get_avatar_processor)],
+        lobby_service: Annotated[LobbyService, Depends()],
     ) -> None:
         self._user_repository = user_repository
+        self._profile_cache = profile_cache
+        self._password_hasher = password_hasher
+        self._postgres_engine = postgres_engine
+        self._background_tasks = background_tasks
+        self._token_revocations = token_revocations
+        self._avatar_processor = avatar_processor
+        self._lobby_service = lobby_service
 
     async def get_user(
         self,
         user_id: int,
     ) -> UserPublicResponse:
         """Сервис по получению незарегистрированного пользователя"""
-        try:
-            user = await self._user_repository.get_one_with_rank_public(user_id=user_id)
-        except UserNotFoundPostgres as exc:
-            raise UserNotFoundService from exc
-        achievements = await self._user_repository.get_user_achievements(user_id=user_id)
-        return UserPublicResponse(
-            **user.model_dump(),
-            achievements=[UserAchievementsResponse(**achievement.model_dump()) for achievement in achievements],
-        )
+        version = await self._profile_cache.get_version(user_id)
+        if version is not None and (profile := await self._profile_cache.get_profile(user_id, version)):
+            return UserPublicResponse.model_validate(profile)
+        response = UserPublicResponse.model_validate(await self._get_profile(user_id))
+        if version is not None:
+            await self._profile_cache.set_profile(user_id, version, response.model_dump(mode='json'))
+        return response
 
     async def get_current_user(
         self,
         user_id: int,
     ) -> UserResponse:
         """Сервис по получению зарегистрированного пользователя"""
+        return UserResponse.model_validate(await self._get_profile(user_id))
+
+    async def get_users(
+        self,
+        user_ids: list[int],
+    ) -> list[UserPublicBatchResponse]:
+        """Сервис по получению публичных профилей нескольких пользователей.
+
+        Профили берутся из кэша, а недостающие загружаются двумя запросами независимо
+        от их числа. Несуществующие пользователи пропускаются.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        versions = await self._profile_cache.get_versions(user_ids)
+        profiles = await self._profile_cache.get_profiles(versions) if versions else {}
+        if missing_user_ids := [user_id for user_id in user_ids if user_id not in profiles]:
+            loaded_profiles = {
+                profile.id: UserPublicResponse.model_validate(profile).model_dump(mode='json')
+                for profile in await self._user_repository.get_public_profiles(user_ids=missing_user_ids)
+            }
+            await self._profile_cache.set_profiles(versions, loaded_profiles)
+            profiles |= loaded_profiles
+        return [
+            UserPublicBatchResponse(**profiles[user_id], id=user_id) for user_id in user_ids if user_id in profiles
+        ]
+
+    async def _get_profile(
+        self,
+        user_id: int,
+    ) -> UserProfileDTO:
         try:
-            user = await self._user_repository.get_one_with_rank(user_id=user_id)
+            return await self._user_repository.get_profile(user_id=user_id)
         except UserNotFoundPostgres as exc:
             raise UserNotFoundService from exc
-        statistics = await self._user_repository.get_user_statistics(user_id=user_id)
-        achievements = await self._user_repository.get_user_achievements(user_id=user_id)
-        return UserResponse(
-            **user.model_dump(),
-            statistics=[PlayerStatisticResponse(**statistic.model_dump()) for statistic in statistics],
-            achievements=[UserAchievementsResponse(**achievement.model_dump()) for achievement in achievements],
-        )
 
     async def login_user(
         self,
@@ -107,7 +160,7 @@ class UserService:
                 )
             ):
                 raise UserNotFoundService
-            if not self.check_password(user_login_data.password, user.hash_password):
+            if not await self._password_hasher.verify(user_login_data.password, user.hash_password):
                 raise InvalidPasswordService
         else:
             raise MissCredentialsService
@@ -115,6 +168,15 @@ class UserService:
             raise InvalidStatusService
         if not user.is_active:
             raise InvalidIsActiveService
+        if self._password_hasher.needs_update(user.hash_password):
+            # Хеш старой стоимости пересчитывается после ответа, вход не ждёт лишнего bcrypt
+            self._background_tasks.add_task(
+                rehash_password,
+                self._postgres_engine,
+                user.id,
+                user_login_data.password,
+                user.hash_password,
+            )
         access_token = create_access_token(data={'user_id': user.id})
         refresh_token = create_refresh_token(data={'user_id': user.id})
         return TokenResponse(access=access_token, refresh=refresh_token)
@@ -125,7 +187,7 @@ class UserService:
         user_data: UserCreate,
     ) -> UserCreateResponse:
         """Сервис для создания пользователя"""
-        hash_password = self.set_password(user_data.password)
+        hash_password = await self._password_hasher.hash(user_data.password)
         try:
             user = await self._user_repository.add_one(
                 UserCreateDTO(
@@ -160,6 +222,17 @@ class UserService:
     ) -> None:
         """Сервис для создания удаление пользователя"""
         await self._user_repository.delete_one(user_id=user_id)
+        await self._token_revocations.revoke_user(user_id)
+
+    async def logout_user(
+        self,
+        claims: TokenClaims,
+        refresh_claims: TokenClaims | None = None,
+    ) -> None:
+        """Сервис выхода: отзыв access и refresh токенов до истечения их срока"""
+        for token_claims in (claims, refresh_claims):
+            if token_claims is not None and token_claims.jti and token_claims.expires_at:
+                await self._token_revocations.revoke_token(token_claims.jti, token_claims.expires_at)
 
     async def update_user(
         self,
@@ -190,25 +263,26 @@ class UserService:
             user = await self._user_repository.get_one_by_id(user_id=user_id)
         except UserNotFoundPostgres as exc:
             raise UserNotFoundService from exc
-        if not self.check_password(
+        if not await self._password_hasher.verify(
             reset_password_data.old_password,
             user.hash_password,  # type: ignore
         ):
             raise InvalidOldPasswordService
 
-        if self.check_password(
+        if await self._password_hasher.verify(
             reset_password_data.new_password,
             user.hash_password,  # type: ignore
         ):
             raise InvalidNewPasswordService
 
-        new_hash_password = self.set_password(reset_password_data.new_password)
+        new_hash_password = await self._password_hasher.hash(reset_password_data.new_password)
         try:
             await self._user_repository.update(
                 user_id=user_id, user_update=UserUpdatePartialDTO(hash_password=new_hash_password)
             )
         except UserNotFoundPostgres as exc:
             raise UserNotFoundService from exc
+        await self._token_revocations.revoke_user(user_id)
         return AccessResetPasswordResponse(
             access='Пароль для пользователя был изменен!',
             username=user.username,
@@ -219,35 +293,22 @@ class UserService:
         self,
         recovery_password_data: RecoveryPassword,
     ) -> AccessUpdatePasswordResponse:
+        hash_password = await self._password_hasher.hash(recovery_password_data.new_password)
         try:
             user = await self._user_repository.recovery_password(
                 recovery_password_data=RecoveryPasswordDTO(
                     email=recovery_password_data.email,
-                    hash_password=self.set_password(recovery_password_data.new_password),
+                    hash_password=hash_password,
                 )
             )
         except UserNotFoundPostgres as exc:
             raise UserNotFoundService from exc
+        await self._token_revocations.revoke_user(user.id)
         return AccessUpdatePasswordResponse(
             access='Пароль для пользователя был изменен!',
             username=user.username,
         )
 
-    @staticmethod
-    def set_password(
-        raw_password: str,
-    ) -> str:
-        """Функция для хеширования пароля"""
-        return pwd_context.hash(raw_password)
-
-    @staticmethod
-    def check_password(
-        raw_password: str,
-        hash_password: str,
-    ) -> bool:
-        """Функция для проверки пароля"""
-        return pwd_context.verify(raw_password, hash_password)
-
     async def upload_user_avatar(self, user_id: int, file: UploadFile = File(...)) -> UpdatedUserResponse:
         """Функция сохранения файла аватарки"""
         allowed_mime_types = {'image/jpeg', 'image/png', 'image/gif'}
@@ -256,21 +317,50 @@ class UserService:
                 raise FileExtensionService
 
         try:
-            contents = await file.read()
-
-            # Изменяем размер аватарки, если он большой
-            image = resize_user_avatar(max_size=200, contents=contents)
             if not file.filename:
                 raise ValueError('Файл не имеет имени')
 
-            new_filename = f'{user_id}_avatar.{file.filename.split(".")[-1]}'
-            file_path = f'/media/avatar/{new_filename}'
+            # Тело уже принято потоком во временный файл, поэтому размер известен без чтения в память
+            max_bytes = get_env_settings().avatar_max_bytes
+            if file.size is not None and file.size > max_bytes:
+                raise FileTooLargeService
+
+            # Формат определяется по сигнатуре файла, а не по заявленному клиентом типу
+            image_format = sniff_avatar_format(await file.read(AVATAR_SIGNATURE_SIZE))
+            if image_format is None:
+                raise FileExtensionService
+            await file.seek(0)
+            try:
+                width, height = read_avatar_size(file.file, image_format)
+            except Image.DecompressionBombError as exc:
+                raise ImageTooLargeService from exc
+            except OSError as exc:
+                # Заголовок не разбирается как изображение заявленного формата
+                raise FileExtensionService from exc
+            if width * height > get_env_settings().avatar_max_pixels:
+                raise ImageTooLargeService
+            await file.seek(0)
+
+            contents = await file.read(max_bytes + 1)
+            if len(contents) > max_bytes:
+                raise FileTooLargeService
 
-            image.save(fp=file_path, quality=85)
+            # Декодирование и уменьшение идут в пуле процессов, варианты сохраняются под хешем содержимого
+            try:
+                file_path = await self._avatar_processor.process(contents)
+            except (OSError, ValueError, Image.DecompressionBombError) as exc:
+                # Заголовок верный, но тело обрезано или повреждено: PIL падает уже при декодировании в пуле
+                raise FileExtensionService from exc
 
-            # сохранение пути в модуль пользователя
-            updated_user = await self.update_user(user_update=UserUpdate(avatar=file_path), current_user_id=user_id)
-            return updated_user
+            # сохранение пути у пользователя и у его игроков в комнатах
+            try:
+                updated_user, players = await self._user_repository.update_avatar(user_id=user_id, avatar=file_path)
+            except UserNotFoundPostgres as exc:
+                raise UserNotFoundService from exc
+            if players:
+                # Аватар игрока виден в лобби: комнаты получают дельты, а кэш списка сбрасывается
+                await self._lobby_service.publish_players_updated(players)
+            return UpdatedUserResponse(**updated_user.model_dump())
 
         except FileNotUploadService:
             raise FileNotUploadError
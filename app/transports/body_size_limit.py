@@ -0,0 +1,47 @@
+from starlette import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.transports.handlers.users.exceptions import FileTooLargeError
+
+# Запас на границы и заголовки частей multipart сверх размера самого файла
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+
+class BodySizeLimitMiddleware:
+    """Ограничение размера тела запросов на загрузку файлов.
+
+    Запрос с большим Content-Length отклоняется до чтения тела, а тело без него
+    считается по мере поступления и обрывается, как только превысит лимит. Так
+    загрузка не копит на диске и в памяти больше лимита, что бы ни прислал клиент.
+    """
+
+    def __init__(self, app: ASGIApp, path_suffix: str, max_bytes: int) -> None:
+        self._app = app
+        self._path_suffix = path_suffix
+        self._max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not scope['path'].endswith(self._path_suffix):
+            await self._app(scope, receive, send)
+            return
+
+        content_length = dict(scope['headers']).get(b'content-length')
+        if content_length is not None and content_length.isdigit() and int(content_length) > self._max_bytes:
+            response = JSONResponse({'detail': FileTooLargeError.detail}, status_code=status.HTTP_413_CONTENT_TOO_LARGE)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > self._max_bytes:
+                    # Тело читается до вызова обработчика, исключение превращается в ответ 413
+                    raise FileTooLargeError
+            return message
+
+        await self._app(scope, limited_receive, send)
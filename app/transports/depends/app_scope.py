@@ -2,6 +2,8 @@ from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.websockets import WebSocket
 
+from app.integrations.redis.lobby_feed import LobbyFeed
+from app.integrations.redis.token_revocations import TokenRevocations
 from app.utils.models import AppRequest
 
 
@@ -11,5 +13,20 @@ def postgres_engine_depend(request: AppRequest = None, websocket: WebSocket = No
     return request.app.state.postgres_engine
 
 
-def redis_depend(websocket: WebSocket) -> AsyncEngine:
-    return websocket.app.state.redis
+def redis_depend(request: AppRequest = None, websocket: WebSocket = None) -> Redis:  # type: ignore
+    if websocket:
+        return websocket.app.state.redis
+    return request.app.state.redis
+
+
+def lobby_feed_depend(websocket: WebSocket) -> LobbyFeed:
+    return websocket.app.state.lobby_feed
+
+
+def token_revocations_depend(
+    request: AppRequest = None,  # type: ignore
+    websocket: WebSocket = None,  # type: ignore
+) -> TokenRevocations:
+    if websocket:
+        return websocket.app.state.token_revocations
+    return request.app.state.token_revocations
@@ -6,6 +6,7 @@ from fastapi.params import Depends
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_scoped_session
 
 from app.integrations.postgres.providers import session_factory_provide, session_provide
+from app.integrations.redis.profile_cache import invalidate_committed_profiles
 from app.transports.depends.app_scope import postgres_engine_depend
 
 
@@ -21,3 +22,5 @@ async def session_depend(
 ) -> AsyncGenerator[AsyncSession, None]:
     async with session_provide(session_factory, mode='runtime') as session:
         yield session
+    # Сюда доходим только после фиксации транзакции: при ошибке session_provide откатывает её и пробрасывает исключение
+    await invalidate_committed_profiles(session)
@@ -0,0 +1,13 @@
+from typing import Annotated
+
+from fastapi.params import Depends
+from redis.asyncio import Redis
+
+from app.integrations.redis.redis import RedisFacade
+from app.transports.depends.app_scope import redis_depend
+
+
+def redis_facade_depend(
+    redis: Annotated[Redis, Depends(redis_depend)],
+) -> RedisFacade:
+    return RedisFacade(redis)
@@ -35,4 +35,34 @@ class BlackListError(BaseExceptionTransport):
 
 class DeleteRoomNotAdminError(BaseExceptionTransport):
     detail = 'Вы не являетесь админом'
-    status_code = status.HTTP_403_FORBIDDEN
\ No newline at end of file
+    status_code = status.HTTP_403_FORBIDDEN
+
+
+class InvalidCursorError(BaseExceptionTransport):
+    detail = 'Некорректный курсор списка комнат'
+    status_code = status.HTTP_400_BAD_REQUEST
+
+
+class PlayerNotInRoomError(BaseExceptionTransport):
+    detail = 'Вы не находитесь в этой комнате'
+    status_code = status.HTTP_404_NOT_FOUND
+
+
+class NotRoomHostError(BaseExceptionTransport):
+    detail = 'Действие доступно только хосту комнаты'
+    status_code = status.HTTP_403_FORBIDDEN
+
+
+class MaxPlayersBelowCountError(BaseExceptionTransport):
+    detail = 'Число мест не может быть меньше числа игроков в комнате'
+    status_code = status.HTTP_409_CONFLICT
+
+
+class NoRoomForQuickJoinError(BaseExceptionTransport):
+    detail = 'Нет подходящих комнат для быстрого входа'
+    status_code = status.HTTP_404_NOT_FOUND
+
+
+class SearchTimeoutError(BaseExceptionTransport):
+    detail = 'Поиск комнат занял слишком много времени, уточните запрос'
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -1,12 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Response
 from starlette import status
 
 from app.services.exceptions import (
     UserInRoomService,
     UserNotFoundService, RoomNotFoundService, NoSlotService, PasswordRoomNotValidService, BlackListService,
-    TitleCreateRoomService, DeleteRoomNotAdminService,
+    TitleCreateRoomService, DeleteRoomNotAdminService, InvalidCursorService, PlayerNotInRoomService,
+    NotRoomHostService, MaxPlayersBelowCountService, NoRoomForQuickJoinService, SearchTimeoutService,
 )
 from app.services.lobby_service import LobbyService
 
@@ -18,13 +19,29 @@ from .exceptions import (
     PasswordRoomNotValidError,
     RoomNotFoundError,
     TitleCreateRoomError,
-    UserInRoomError, DeleteRoomNotAdminError,
+    UserInRoomError, DeleteRoomNotAdminError, InvalidCursorError, PlayerNotInRoomError,
+    NotRoomHostError, MaxPlayersBelowCountError, NoRoomForQuickJoinError, SearchTimeoutError,
 )
 from .schemas import (
     JoinRoomSchema,
+    LobbySnapshotResponse,
+    QuickJoinSchema,
     RoomCreateResponse,
     RoomCreateSchema,
+    RoomFilterSchema,
+    RoomPageResponse,
     RoomResponse,
+    RoomSummaryPageResponse,
+    RoomSummaryResponse,
+    RoomUpdateSchema,
+)
+from .utils import (
+    LOBBY_PAGE_DEFAULT_LIMIT,
+    LOBBY_PAGE_MAX_LIMIT,
+    LOBBY_SEARCH_DEFAULT_LIMIT,
+    LOBBY_SEARCH_MAX_LIMIT,
+    etag_matches,
+    lobby_etag,
 )
 
 router_lobby = APIRouter(
@@ -35,13 +52,75 @@ router_lobby = APIRouter(
 
 @router_lobby.get(
     '/',
+    response_model=RoomSummaryPageResponse | RoomPageResponse | list[RoomResponse],
     status_code=status.HTTP_200_OK,
+    responses={status.HTTP_304_NOT_MODIFIED: {'description': 'Список комнат не изменился'}},
 )
 async def list_lobby(
+    response: Response,
+    lobby_service: Annotated[LobbyService, Depends()],
+    filters: Annotated[RoomFilterSchema, Depends()],
+    cursor: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=LOBBY_PAGE_MAX_LIMIT)] = LOBBY_PAGE_DEFAULT_LIMIT,
+    summary: Annotated[bool, Query()] = False,
+    unpaginated: Annotated[bool, Query()] = False,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> RoomSummaryPageResponse | RoomPageResponse | list[RoomResponse] | Response:
+    """Получение списка комнат.
+
+    По умолчанию возвращает страницу комнат с курсором на следующую.
+    Флаг summary отдаёт вместо игроков их количество, свободные места и имя хоста.
+    Флаг unpaginated возвращает старый ответ со всеми комнатами без фильтров.
+    ETag ответа - версия лобби, при совпадении с If-None-Match возвращается 304 без обращения к БД.
+    """
+    version = await lobby_service.get_lobby_version()
+    if version is not None:
+        etag = lobby_etag(version)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    if unpaginated:
+        return await lobby_service.get_all_rooms()
+    try:
+        if summary:
+            return await lobby_service.get_rooms_summary_page(filters=filters, limit=limit, cursor=cursor)
+        return await lobby_service.get_rooms_page(filters=filters, limit=limit, cursor=cursor)
+    except InvalidCursorService:
+        raise InvalidCursorError
+
+
+@router_lobby.get(
+    '/search/',
+    response_model=list[RoomSummaryResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def search_rooms(
     lobby_service: Annotated[LobbyService, Depends()],
-) -> list[RoomResponse]:
-    """Получение списка комнат"""
-    return await lobby_service.get_all_rooms()
+    q: Annotated[str, Query(min_length=2, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=LOBBY_SEARCH_MAX_LIMIT)] = LOBBY_SEARCH_DEFAULT_LIMIT,
+) -> list[RoomSummaryResponse]:
+    """Поиск комнат по названию: сначала совпадения с начала названия, затем похожие."""
+    try:
+        return await lobby_service.search_rooms(query=q, limit=limit)
+    except SearchTimeoutService:
+        raise SearchTimeoutError
+
+
+@router_lobby.get(
+    '/snapshot/',
+    status_code=status.HTTP_200_OK,
+)
+async def lobby_snapshot(
+    lobby_service: Annotated[LobbyService, Depends()],
+    current_user_id: Annotated[int, Depends(get_current_user)],
+) -> LobbySnapshotResponse:
+    """Снимок лобби для WebSocket клиента, пропустившего дельты.
+
+    Клиент применяет снимок и затем только дельты с seq больше seq снимка.
+    """
+    return await lobby_service.get_lobby_snapshot()
 
 
 @router_lobby.post(
@@ -66,6 +145,27 @@ async def create_lobby(
         raise TitleCreateRoomError
 
 
+@router_lobby.post(
+    '/quick_join/',
+    response_model=RoomResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def quick_join(
+    join_data: QuickJoinSchema,
+    current_user_id: Annotated[int, Depends(get_current_user)],
+    lobby_service: Annotated[LobbyService, Depends()],
+) -> RoomResponse:
+    """Быстрый вход в самую заполненную открытую комнату, при необходимости с выбранной игрой."""
+    try:
+        return await lobby_service.quick_join(user_id=current_user_id, game_name=join_data.game_name)
+    except UserInRoomService:
+        raise UserInRoomError
+    except UserNotFoundService:
+        raise UserNotFoundError
+    except NoRoomForQuickJoinService:
+        raise NoRoomForQuickJoinError
+
+
 @router_lobby.post(
     '/{room_id}/join/',
     status_code=status.HTTP_200_OK,
@@ -111,3 +211,82 @@ async def delete_lobby(
     except UserNotFoundService:
         raise UserNotFoundError
 
+
+
+@router_lobby.post(
+    '/{room_id}/leave/',
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def leave_lobby(
+    room_id: int,
+    current_user_id: Annotated[int, Depends(get_current_user)],
+    lobby_service: Annotated[LobbyService, Depends()],
+) -> None:
+    """Выход пользователя из комнаты."""
+    try:
+        await lobby_service.leave_lobby(room_id=room_id, user_id=current_user_id)
+    except RoomNotFoundService:
+        raise RoomNotFoundError
+    except PlayerNotInRoomService:
+        raise PlayerNotInRoomError
+
+
+@router_lobby.post(
+    '/{room_id}/kick/{user_id}/',
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def kick_player(
+    room_id: int,
+    user_id: int,
+    current_user_id: Annotated[int, Depends(get_current_user)],
+    lobby_service: Annotated[LobbyService, Depends()],
+) -> None:
+    """Исключение игрока из комнаты с занесением в чёрный список (только хост)."""
+    try:
+        await lobby_service.kick_player(room_id=room_id, host_user_id=current_user_id, user_id=user_id)
+    except RoomNotFoundService:
+        raise RoomNotFoundError
+    except NotRoomHostService:
+        raise NotRoomHostError
+
+
+@router_lobby.post(
+    '/{room_id}/start/',
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def start_game(
+    room_id: int,
+    current_user_id: Annotated[int, Depends(get_current_user)],
+    lobby_service: Annotated[LobbyService, Depends()],
+) -> None:
+    """Начало игры в комнате (только хост)."""
+    try:
+        await lobby_service.start_game(room_id=room_id, host_user_id=current_user_id)
+    except RoomNotFoundService:
+        raise RoomNotFoundError
+    except NotRoomHostService:
+        raise NotRoomHostError
+
+
+@router_lobby.patch(
+    '/{room_id}/',
+    response_model=RoomSummaryResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def update_room_settings(
+    room_id: int,
+    settings: RoomUpdateSchema,
+    current_user_id: Annotated[int, Depends(get_current_user)],
+    lobby_service: Annotated[LobbyService, Depends()],
+) -> RoomSummaryResponse:
+    """Изменение настроек комнаты (только хост)."""
+    try:
+        return await lobby_service.update_room_settings(
+            room_id=room_id, host_user_id=current_user_id, settings=settings
+        )
+    except RoomNotFoundService:
+        raise RoomNotFoundError
+    except NotRoomHostService:
+        raise NotRoomHostError
+    except MaxPlayersBelowCountService:
+        raise MaxPlayersBelowCountError
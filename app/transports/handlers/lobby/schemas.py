@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from app.transports.handlers.users.schemas import BaseSchema
 
@@ -40,6 +41,44 @@ class RoomResponse(BaseSchema):
     is_private: bool
 
 
+class RoomFilterSchema(BaseModel):
+    """Схема фильтров списка комнат."""
+
+    game_name: str | None = None
+    started: bool | None = None
+    is_private: bool | None = None
+    has_free_seats: bool | None = None
+
+
+class RoomPageResponse(BaseSchema):
+    """Схема страницы списка комнат"""
+
+    items: list[RoomResponse]
+    next_cursor: str | None
+
+
+class RoomSummaryResponse(BaseSchema):
+    """Схема краткой информации о комнате"""
+
+    id: int
+    title: str
+    game_name: str
+    max_players: int
+    is_private: bool
+    started: bool
+    created_at: datetime
+    player_count: int
+    free_slots: int
+    host_name: str | None
+
+
+class RoomSummaryPageResponse(BaseSchema):
+    """Схема страницы списка комнат без игроков"""
+
+    items: list[RoomSummaryResponse]
+    next_cursor: str | None
+
+
 class RoomCreateResponse(BaseSchema):
     """Схема для лобби"""
 
@@ -53,6 +92,27 @@ class RoomCreateResponse(BaseSchema):
 
 
 
+class RoomUpdateSchema(BaseModel):
+    """Схема частичного изменения настроек комнаты.
+
+    Передаются только изменяемые поля, password=null снимает пароль и, если is_private не передан, открывает комнату.
+    """
+
+    is_private: bool | None = None
+    password: str | None = Field(None, max_length=50)
+    max_players: int | None = Field(None, ge=3, le=12)
+    game_name: str | None = Field(None, min_length=1)
+
+    @model_validator(mode='after')
+    def check_fields(self) -> 'RoomUpdateSchema':
+        if not self.model_fields_set:
+            raise ValueError('Не передано ни одной настройки комнаты')
+        for field in ('is_private', 'max_players', 'game_name'):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f'Поле {field} не может быть пустым')
+        return self
+
+
 class DeleteRoomSchema(BaseModel):
     """Схема для удаления комнат"""
 
@@ -64,3 +124,50 @@ class JoinRoomSchema(BaseModel):
 
     password: str | None
 
+
+class QuickJoinSchema(BaseModel):
+    """Схема быстрого входа в комнату"""
+
+    game_name: str | None = None
+
+
+
+LobbyDeltaType = Literal[
+    'room_created',
+    'room_removed',
+    'player_joined',
+    'player_left',
+    'player_updated',
+    'player_disconnected',
+    'player_reconnected',
+    'host_changed',
+    'started',
+    'room_updated',
+]
+
+
+class LobbyDeltaSchema(BaseModel):
+    """Схема изменения одной комнаты в WebSocket потоке лобби.
+
+    Данные содержат абсолютные значения (число игроков, новый хост),
+    поэтому повторное применение дельты после снимка ничего не ломает.
+    """
+
+    seq: int
+    type: LobbyDeltaType
+    room_id: int
+    data: dict[str, Any] = Field(default_factory=dict)
+
+
+class LobbyHeartbeatSchema(BaseModel):
+    """Схема heartbeat игрока комнаты, который клиент шлёт в WebSocket потоке лобби"""
+
+    type: Literal['heartbeat']
+    room_id: int
+
+
+class LobbySnapshotResponse(BaseSchema):
+    """Схема снимка лобби для восстановления после пропуска дельт"""
+
+    seq: int
+    rooms: list[RoomSummaryResponse]
@@ -0,0 +1,50 @@
+import base64
+from datetime import datetime
+import json
+
+from pydantic import ValidationError
+
+from app.integrations.postgres.dtos.lobby_dto import RoomCursorDTO
+
+LOBBY_PAGE_DEFAULT_LIMIT = 50
+LOBBY_PAGE_MAX_LIMIT = 100
+LOBBY_SEARCH_DEFAULT_LIMIT = 10
+LOBBY_SEARCH_MAX_LIMIT = 20
+
+
+def encode_room_cursor(
+    created_at: datetime,
+    room_id: int,
+) -> str:
+    """Функция кодирования курсора страницы комнат"""
+    payload = json.dumps({'created_at': created_at.isoformat(), 'id': room_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_room_cursor(
+    cursor: str,
+) -> RoomCursorDTO:
+    """Функция декодирования курсора страницы комнат"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        return RoomCursorDTO.model_validate(json.loads(payload))
+    except (ValueError, ValidationError) as exc:
+        raise ValueError('Некорректный курсор') from exc
+
+
+def lobby_etag(
+    version: int,
+) -> str:
+    """Функция получения ETag списка комнат по версии лобби"""
+    return f'"lobby-{version}"'
+
+
+def etag_matches(
+    if_none_match: str | None,
+    etag: str,
+) -> bool:
+    """Функция проверки заголовка If-None-Match"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+    return '*' in tags or etag in tags
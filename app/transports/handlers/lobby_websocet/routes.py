@@ -0,0 +1,106 @@
+import asyncio
+import contextlib
+import time
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+from starlette import status
+
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from app.integrations.redis.lobby_feed import LobbyFeed
+from app.integrations.redis.room_presence import RoomPresence
+from app.integrations.redis.token_revocations import TokenRevocations
+from app.transports.depends.app_scope import lobby_feed_depend, token_revocations_depend
+from app.transports.handlers.lobby.schemas import LobbyHeartbeatSchema
+from app.utils.config import get_env_settings
+
+from ..users.utils import get_current_ws_user
+
+router_lobby_ws = APIRouter(
+    prefix='/ws/lobby',
+    tags=['lobby'],
+)
+
+
+async def _send_events(websocket: WebSocket, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+    while (event := await queue.get()) is not None:
+        await websocket.send_json(event)
+    # Соединение не успевало читать события и было отключено от рассылки
+    await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+
+async def _is_room_player(
+    lobby_repository: LobbyRepository,
+    verified_rooms: dict[int, float],
+    room_id: int,
+    user_id: int,
+) -> bool:
+    """Проверить, что пользователь - игрок комнаты.
+
+    Подтверждение держится room_presence_grace секунд, поэтому heartbeat ходит в Postgres
+    не чаще раза за это время, а не на каждое сообщение.
+    """
+    verified_at = verified_rooms.get(room_id)
+    if verified_at is not None and time.monotonic() - verified_at < get_env_settings().room_presence_grace:
+        return True
+    is_player = bool(await lobby_repository.get_existing_players([(room_id, user_id)]))
+    # Транзакция закрывается сразу, чтобы соединение не простаивало в ней до закрытия сокета
+    await lobby_repository.commit()
+    if is_player:
+        verified_rooms[room_id] = time.monotonic()
+    else:
+        verified_rooms.pop(room_id, None)
+    return is_player
+
+
+async def _receive_messages(
+    websocket: WebSocket,
+    user_id: int,
+    room_presence: RoomPresence,
+    lobby_repository: LobbyRepository,
+) -> None:
+    verified_rooms: dict[int, float] = {}
+    with contextlib.suppress(WebSocketDisconnect):
+        while True:
+            message = await websocket.receive_text()
+            try:
+                heartbeat = LobbyHeartbeatSchema.model_validate_json(message)
+            except ValidationError:
+                continue
+            # Чужой heartbeat не должен держать на связи отключившегося игрока другой комнаты
+            if not await _is_room_player(lobby_repository, verified_rooms, heartbeat.room_id, user_id):
+                continue
+            # Только обновление оценки в Redis, в players пишет фоновая задача при смене состояния
+            await room_presence.heartbeat(room_id=heartbeat.room_id, user_id=user_id)
+
+
+@router_lobby_ws.websocket('/')
+async def lobby_feed(
+    websocket: WebSocket,
+    lobby_feed: Annotated[LobbyFeed, Depends(lobby_feed_depend)],
+    room_presence: Annotated[RoomPresence, Depends()],
+    lobby_repository: Annotated[LobbyRepository, Depends()],
+    token_revocations: Annotated[TokenRevocations, Depends(token_revocations_depend)],
+    token: Annotated[str, Query()],
+) -> None:
+    """Поток событий лобби вместо опроса списка комнат, также принимает heartbeat игроков комнат."""
+    try:
+        user_id = await get_current_ws_user(token, token_revocations)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    queue = lobby_feed.subscribe()
+    tasks = [
+        asyncio.create_task(_send_events(websocket, queue)),
+        asyncio.create_task(_receive_messages(websocket, user_id, room_presence, lobby_repository)),
+    ]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        lobby_feed.unsubscribe(queue)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
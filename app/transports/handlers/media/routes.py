@@ -0,0 +1,77 @@
+import hashlib
+import os
+from typing import Annotated
+
+from fastapi import APIRouter, Path, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+
+from app.utils.avatar_processor import AVATAR_DIR, default_avatar, is_hashed_avatar
+
+router_media = APIRouter(
+    prefix='/media',
+    tags=['media'],
+)
+
+# Файлы с хешем в имени не меняются, поэтому клиенты и CDN хранят их без перепроверки
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Старые имена вида {user_id}_avatar.png перезаписываются, их кэш перепроверяется по ETag
+REVALIDATE_CACHE_CONTROL = 'public, no-cache'
+# Аватар по умолчанию отдаётся вместо ещё не появившегося файла, поэтому кэшируется ненадолго
+DEFAULT_AVATAR_CACHE_CONTROL = 'public, max-age=300'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Совпадает ли ETag с одним из If-None-Match, сравнение слабое, как требует RFC 9110."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(candidate.strip().removeprefix('W/') == etag for candidate in if_none_match.split(','))
+
+
+def cached_response(request: Request, etag: str, cache_control: str) -> Response | None:
+    """Ответ 304, если у клиента уже есть эта версия файла."""
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag, 'Cache-Control': cache_control},
+        )
+    return None
+
+
+@router_media.get(
+    '/avatar/{filename}',
+    response_class=FileResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_avatar(
+    request: Request,
+    filename: Annotated[str, Path(pattern=r'^[\w-]+\.(?:webp|jpg|jpeg|png|gif)$')],
+) -> Response:
+    """Отдать файл аватара, а если его нет - аватар по умолчанию без запроса в базу"""
+    path = os.path.join(AVATAR_DIR, filename)
+    try:
+        stat_result = await run_in_threadpool(os.stat, path)
+    except FileNotFoundError:
+        content = default_avatar()
+        etag = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+        return cached_response(request, etag, DEFAULT_AVATAR_CACHE_CONTROL) or Response(
+            content=content,
+            media_type='image/webp',
+            headers={'ETag': etag, 'Cache-Control': DEFAULT_AVATAR_CACHE_CONTROL},
+        )
+
+    if is_hashed_avatar(filename):
+        # Имя уже вычислено из содержимого, поэтому служит сильным ETag без чтения файла
+        etag = f'"{filename}"'
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    else:
+        etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        cache_control = REVALIDATE_CACHE_CONTROL
+    # FileResponse сам отвечает на Range и If-Range и отдаёт файл через sendfile (pathsend), если сервер умеет
+    return cached_response(request, etag, cache_control) or FileResponse(
+        path,
+        stat_result=stat_result,
+        headers={'ETag': etag, 'Cache-Control': cache_control},
+    )
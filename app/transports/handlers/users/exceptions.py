@@ -53,6 +53,16 @@ class FileExtensionError(BaseExceptionTransport):
     status_code = status.HTTP_400_BAD_REQUEST
 
 
+class FileTooLargeError(BaseExceptionTransport):
+    detail = 'Файл слишком большой.'
+    status_code = status.HTTP_413_CONTENT_TOO_LARGE
+
+
+class ImageTooLargeError(BaseExceptionTransport):
+    detail = 'Слишком большое разрешение изображения.'
+    status_code = status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
 class FileNotUploadError(BaseExceptionTransport):
     detail = 'Файл не передан'
     status_code = status.HTTP_422_UNPROCESSABLE_CONTENT
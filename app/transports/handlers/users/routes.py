@@ -5,12 +5,15 @@ from jose import JWTError, jwt
 from pydantic import EmailStr
 
 from app.integrations.celery.tasks import send_confirmation_email_task
+from app.integrations.redis.token_revocations import TokenRevocations
 from app.services.code_service import CodeService
 from app.services.exceptions import (
     CodeNotFoundService,
     EmailAlreadyExistsService,
     FileExtensionService,
     FileNotUploadService,
+    FileTooLargeService,
+    ImageTooLargeService,
     InvalidIsActiveService,
     InvalidNewPasswordService,
     InvalidOldPasswordService,
@@ -22,6 +25,7 @@ from app.services.exceptions import (
     UserNotFoundService,
 )
 from app.services.user_service import UserService
+from app.transports.depends.app_scope import token_revocations_depend
 from app.utils.config import get_env_settings
 from app.utils.logger_config import user_lobby_logger
 
@@ -30,6 +34,8 @@ from .exceptions import (
     EmailAlreadyExistsError,
     FileExtensionError,
     FileNotUploadError,
+    FileTooLargeError,
+    ImageTooLargeError,
     InvalidIsActiveError,
     InvalidNewPasswordError,
     InvalidOldPasswordError,
@@ -56,12 +62,21 @@ from .schemas import (
     UpdatedUserResponse,
     UserCreate,
     UserCreateResponse,
+    UserPublicBatchResponse,
     UserPublicResponse,
     UserResponse,
     UserTempResponse,
     UserUpdate,
+    UsersBatchRequest,
+)
+from .utils import (
+    TokenClaims,
+    create_access_token,
+    create_refresh_token,
+    get_current_user,
+    get_token_claims,
+    verify_token,
 )
-from .utils import create_access_token, get_current_user, create_refresh_token
 
 router_user = APIRouter(
     prefix='/api/users',
@@ -86,6 +101,19 @@ async def get_user(
         raise UserNotFoundError
 
 
+@router_user.post(
+    '/batch/',
+    status_code=status.HTTP_200_OK,
+)
+async def get_users_batch(
+    users_batch: UsersBatchRequest,
+    user_service: Annotated[UserService, Depends()],
+) -> list[UserPublicBatchResponse]:
+    """Публичные профили нескольких пользователей, например для состава комнаты"""
+    user_lobby_logger.debug('Получена информация по пользователям {}', users_batch.user_ids)
+    return await user_service.get_users(user_ids=users_batch.user_ids)
+
+
 @router_user.get(
     '/personal_area/',
     status_code=status.HTTP_200_OK,
@@ -139,25 +167,18 @@ async def login(
 )
 async def refresh(
     refresh_data: RefreshForm,
+    token_revocations: Annotated[TokenRevocations, Depends(token_revocations_depend)],
 ) -> AccessToken:
     """Обновление токена"""
     try:
-        payload = jwt.decode(
-            refresh_data.refresh_token,
-            get_env_settings().secret_key.get_secret_value(),
-            algorithms=[get_env_settings().algorithm.get_secret_value()],
-        )
-        user_id: int | None = payload.get('user_id')
-        if user_id is None:
-            user_lobby_logger.error('Ошибка: Неверный refresh-токен.')
-            raise HTTPException(status_code=401, detail='Неверный refresh-токен')
-        access_token = create_access_token(data={'user_id': user_id})
-        refresh_token = create_refresh_token(data={'user_id': user_id})
-        user_lobby_logger.info('Токен обновлен')
-        return AccessToken(access=access_token, refresh=refresh_token)
-    except JWTError:
+        claims = await verify_token(refresh_data.refresh_token, 'refresh', token_revocations)
+    except HTTPException:
         user_lobby_logger.error('Ошибка: Неверный или истёкший refresh-токен.')
         raise HTTPException(status_code=401, detail='Неверный или истёкший refresh-токен')
+    access_token = create_access_token(data={'user_id': claims.user_id})  # type: ignore
+    refresh_token = create_refresh_token(data={'user_id': claims.user_id})  # type: ignore
+    user_lobby_logger.info('Токен обновлен')
+    return AccessToken(access=access_token, refresh=refresh_token)
 
 
 @router_user.post(
@@ -259,6 +280,30 @@ async def delete_user(
     await user_service.delete_user(user_id)
 
 
+@router_user.post(
+    '/logout/',
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def logout(
+    refresh_data: RefreshForm,
+    claims: Annotated[TokenClaims, Depends(get_token_claims)],
+    token_revocations: Annotated[TokenRevocations, Depends(token_revocations_depend)],
+    user_service: Annotated[UserService, Depends()],
+) -> None:
+    """Выход: текущий access токен и refresh токен сессии перестают приниматься до истечения срока"""
+    try:
+        refresh_claims = await verify_token(refresh_data.refresh_token, 'refresh', token_revocations)
+    except HTTPException:
+        # Неверный, истёкший или уже отозванный refresh токен и так не примут, отзывать нечего
+        user_lobby_logger.warning('Выход пользователя с id {} без действующего refresh-токена', claims.user_id)
+        refresh_claims = None
+    if refresh_claims is not None and refresh_claims.user_id != claims.user_id:
+        user_lobby_logger.error('Ошибка: refresh-токен другого пользователя при выходе {}', claims.user_id)
+        raise HTTPException(status_code=401, detail='Неверный refresh-токен')
+    user_lobby_logger.info('Выход пользователя с id {}', claims.user_id)
+    await user_service.logout_user(claims, refresh_claims)
+
+
 @router_user.post(
     '/generate_code/',
     status_code=status.HTTP_201_CREATED,
@@ -378,3 +423,12 @@ async def upload_user_avatar(
     except FileNotUploadService:
         user_lobby_logger.error('Ошибка: Файл не загружен.')
         raise FileNotUploadError
+    except FileTooLargeService:
+        user_lobby_logger.error('Ошибка: Файл {} слишком большой.', file.filename)
+        raise FileTooLargeError
+    except ImageTooLargeService:
+        user_lobby_logger.error('Ошибка: Слишком большое разрешение изображения {}.', file.filename)
+        raise ImageTooLargeError
+    except UserNotFoundService:
+        user_lobby_logger.error('Ошибка: Пользователь {} не найден.', user_id)
+        raise UserNotFoundError
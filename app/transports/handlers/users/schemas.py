@@ -4,6 +4,8 @@ import re
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
+USERS_BATCH_MAX_SIZE = 50
+
 
 class BaseSchema(BaseModel):
     """Базовый класс для схем"""
@@ -69,6 +71,18 @@ class UserPublicResponse(BaseSchema):
     achievements: list[UserAchievementsResponse]
 
 
+class UserPublicBatchResponse(UserPublicResponse):
+    """Схема публичного профиля пользователя в пакетном ответе"""
+
+    id: int
+
+
+class UsersBatchRequest(BaseModel):
+    """Схема запроса публичных профилей нескольких пользователей"""
+
+    user_ids: list[int] = Field(..., min_length=1, max_length=USERS_BATCH_MAX_SIZE)
+
+
 class GenerateCode(BaseModel):
     """Схема кода доступа"""
 
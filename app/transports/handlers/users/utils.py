@@ -1,21 +1,26 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from email.message import EmailMessage
-from io import BytesIO
+from functools import lru_cache
+import hashlib
 import random
 import smtplib
 import string
-from typing import Annotated, Any
+import threading
+import time
+from typing import Annotated, Any, NamedTuple
 from uuid import uuid4
 
-from PIL import Image
-from PIL.Image import Image as PILImage
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwt
 from pydantic import EmailStr
 
+from app.integrations.redis.token_revocations import TokenRevocations
+from app.transports.depends.app_scope import token_revocations_depend
 from app.utils.config import get_env_settings
 from app.utils.logger_config import user_lobby_logger
+from app.utils.metrics import TOKEN_CACHE_REQUESTS
 
 oauth2_scheme = HTTPBearer()
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
@@ -106,40 +111,109 @@ def generate_token(
     )
 
 
-def get_current_user(
-    token: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
-) -> int:
-    """Функция получения id пользователя"""
-    try:
-        jwt_token = token.credentials
-        payload = jwt.decode(
-            jwt_token,
-            get_env_settings().secret_key.get_secret_value(),
-            algorithms=[get_env_settings().algorithm.get_secret_value()],
+class TokenClaims(NamedTuple):
+    """Проверенные утверждения JWT, которые нужны обработчикам."""
+
+    user_id: int | None
+    jti: str | None
+    token_type: str | None
+    issued_at: float | None
+    expires_at: float | None
+
+
+class TokenVerifier:
+    """Проверка JWT с LRU-кэшем уже проверенных токенов.
+
+    Повторный запрос с тем же токеном не декодирует его и не проверяет подпись заново:
+    утверждения берутся из кэша по SHA-256 токена. Запись живёт не дольше exp токена,
+    а размер кэша ограничен max_size.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, max_size: int) -> None:
+        self._secret_key = secret_key
+        self._algorithms = [algorithm]
+        self._max_size = max_size
+        self._cache: OrderedDict[bytes, TokenClaims] = OrderedDict()
+        # Синхронные зависимости FastAPI выполняются в пуле потоков
+        self._lock = threading.Lock()
+
+    def verify(self, token: str) -> TokenClaims:
+        """Утверждения токена, JWTError если подпись неверна или срок истёк."""
+        key = hashlib.sha256(token.encode()).digest()
+        with self._lock:
+            claims = self._cache.get(key)
+            if claims is not None:
+                if claims.expires_at is not None and claims.expires_at <= time.time():
+                    del self._cache[key]
+                    raise ExpiredSignatureError('Signature has expired.')
+                self._cache.move_to_end(key)
+        if claims is not None:
+            TOKEN_CACHE_REQUESTS.labels(result='hit').inc()
+            return claims
+        TOKEN_CACHE_REQUESTS.labels(result='miss').inc()
+        payload = jwt.decode(token, self._secret_key, algorithms=self._algorithms)
+        claims = TokenClaims(
+            user_id=payload.get('user_id'),
+            jti=payload.get('jti'),
+            token_type=payload.get('token_type'),
+            issued_at=payload.get('iat'),
+            expires_at=payload.get('exp'),
         )
-        _id: int | None = payload.get('user_id')
-        if _id is None:
-            raise HTTPException(status_code=401, detail='Неверный токен')
-        return _id
-    except JWTError:
-        raise HTTPException(status_code=401, detail='Неверный или истёкший токен')
+        with self._lock:
+            self._cache[key] = claims
+            if len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+        return claims
+
+
+@lru_cache
+def get_token_verifier() -> TokenVerifier:
+    """Проверка токенов с ключом подписи, прочитанным из настроек один раз."""
+    settings = get_env_settings()
+    return TokenVerifier(
+        secret_key=settings.secret_key.get_secret_value(),
+        algorithm=settings.algorithm.get_secret_value(),
+        max_size=settings.token_cache_size,
+    )
 
 
-def get_current_ws_user(
+async def verify_token(
     token: str,
-) -> int:
+    token_type: str,
+    token_revocations: TokenRevocations,
+) -> TokenClaims:
+    """Утверждения неотозванного токена пользователя нужного типа, иначе 401."""
     try:
-        payload = jwt.decode(
-            token,
-            get_env_settings().secret_key.get_secret_value(),
-            algorithms=[get_env_settings().algorithm.get_secret_value()],
-        )
-        _id: int | None = payload.get('user_id')
-        if _id is None:
-            raise HTTPException(status_code=401, detail='Неверный токен')
-        return _id
+        claims = get_token_verifier().verify(token)
     except JWTError:
         raise HTTPException(status_code=401, detail='Неверный или истёкший токен')
+    if claims.token_type != token_type or claims.user_id is None:
+        raise HTTPException(status_code=401, detail='Неверный токен')
+    if await token_revocations.is_revoked(claims.jti, claims.user_id, claims.issued_at):
+        raise HTTPException(status_code=401, detail='Токен отозван')
+    return claims
+
+
+async def get_token_claims(
+    token: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
+    token_revocations: Annotated[TokenRevocations, Depends(token_revocations_depend)],
+) -> TokenClaims:
+    """Утверждения access токена из заголовка Authorization"""
+    return await verify_token(token.credentials, 'access', token_revocations)
+
+
+def get_current_user(
+    claims: Annotated[TokenClaims, Depends(get_token_claims)],
+) -> int:
+    """Функция получения id пользователя"""
+    return claims.user_id  # type: ignore
+
+
+async def get_current_ws_user(
+    token: str,
+    token_revocations: TokenRevocations,
+) -> int:
+    return (await verify_token(token, 'access', token_revocations)).user_id  # type: ignore
 
 
 def create_access_token(
@@ -167,14 +241,3 @@ def generate_link_for_confirm_email(url: str, token: str) -> str:
     """Функция генерирует ссылку для подтверждения регистрации."""
     return f'{url}access_email/{token}/'
 
-
-def resize_user_avatar(max_size: int, contents: bytes) -> PILImage:
-    """Функция обрезки аватара по максимальному размеру"""
-    image: PILImage = Image.open(BytesIO(contents))
-    if max(image.width, image.height) > max_size:
-        user_lobby_logger.warning('Изображение слишком большое, будет уменьшено!')
-        ratio = max_size / max(image.width, image.height)
-        new_size = (round(image.width * ratio), round(image.height * ratio))
-        user_lobby_logger.info('Изменяем размер рисунка на {}', new_size)
-        image = image.resize(new_size, Image.Resampling.LANCZOS)
-    return image
@@ -1,5 +1,6 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import Any
 
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,13 +9,25 @@ from redis.asyncio import Redis
 from sqladmin import Admin
 from app.integrations.postgres.providers import postgres_engine_provide
 from app.integrations.redis.config import async_redis_context
+from app.integrations.redis.deadlines import DeadlineRunner, Deadlines
+from app.integrations.redis.lobby_feed import LobbyFeed
+from app.integrations.redis.redis import RedisFacade
+from app.integrations.redis.token_revocations import TokenRevocations
 from app.integrations.sqladmin.models.code_admin import CodeAdmin
 from app.integrations.sqladmin.models.room_admin import RoomAdmin
 from app.integrations.sqladmin.models.user_admin import UserAdmin
+from app.services.background_jobs import expire_disconnected_players
+from app.transports.body_size_limit import MULTIPART_OVERHEAD_BYTES, BodySizeLimitMiddleware
 from app.transports.handlers.admins.sqladmin_authentication import AdminAuth
 from app.transports.handlers.lobby.routes import router_lobby
+from app.transports.handlers.lobby_websocet.routes import router_lobby_ws
+from app.transports.handlers.media.routes import router_media
 from app.transports.handlers.users.routes import router_user
+from app.transports.handlers.users.utils import ACCESS_TOKEN_EXPIRE_MINUTES, get_token_verifier
+from app.utils.avatar_processor import get_avatar_processor
 from app.utils.config import AppSettings, get_app_settings, get_env_settings
+from app.utils.logger_config import user_lobby_logger
+from app.utils.password_hasher import get_password_hasher
 
 
 
@@ -62,9 +75,22 @@ class AppFactory:
             lifespan=cls.lifespan,
         )
         cls._setup_cors(app)
+        cls._setup_body_size_limit(app)
         cls.include_routers(app)
         return app
 
+    @classmethod
+    def _setup_body_size_limit(
+        cls,
+        app: FastAPI,
+    ) -> None:
+        """Ограничение тела загрузки аватара с запасом на обёртку multipart."""
+        app.add_middleware(
+            BodySizeLimitMiddleware,
+            path_suffix='/upload_avatar/',
+            max_bytes=get_env_settings().avatar_max_bytes + MULTIPART_OVERHEAD_BYTES,
+        )
+
     @classmethod
     def include_routers(
         cls,
@@ -72,6 +98,8 @@ class AppFactory:
     ) -> None:
         app.include_router(router_user)
         app.include_router(router_lobby)
+        app.include_router(router_lobby_ws)
+        app.include_router(router_media)
 
     @classmethod
     @asynccontextmanager
@@ -86,16 +114,54 @@ class AppFactory:
         ):
             app.state.redis = redis
             app.state.postgres_engine = engine
+            app.state.lobby_feed = LobbyFeed(redis, queue_size=get_env_settings().lobby_ws_queue_size)
+            await app.state.lobby_feed.start()
+            await cls.setup_password_hasher()
+            # Ключ подписи JWT читается из настроек один раз, до первого запроса
+            get_token_verifier()
+            app.state.token_revocations = TokenRevocations(
+                redis,
+                token_lifetime_seconds=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                capacity=get_env_settings().token_revocations_capacity,
+                error_rate=get_env_settings().token_revocations_error_rate,
+                rebuild_interval=get_env_settings().token_revocations_rebuild_interval,
+            )
+            await app.state.token_revocations.start()
+            app.state.deadline_runner = DeadlineRunner(
+                Deadlines(RedisFacade(redis)),
+                handler=partial(expire_disconnected_players, engine),
+                batch_size=get_env_settings().deadlines_batch_size,
+                poll_interval=get_env_settings().deadlines_poll_interval,
+            )
+            await app.state.deadline_runner.start()
             admin_auth = AdminAuth(secret_key=get_env_settings().secret_key.get_secret_value())
             admin = Admin(app=app, engine=engine, authentication_backend=admin_auth)
             cls.include_admin_routers(admin)
 
-            yield {
-                'app_settings': get_app_settings(),
-                'env_settings': get_env_settings(),
-                'redis': redis,
-                'postgres_engine': engine,
-            }
+            try:
+                yield {
+                    'app_settings': get_app_settings(),
+                    'env_settings': get_env_settings(),
+                    'redis': redis,
+                    'postgres_engine': engine,
+                }
+            finally:
+                await app.state.deadline_runner.stop()
+                await app.state.token_revocations.stop()
+                await app.state.lobby_feed.stop()
+                get_avatar_processor().shutdown()
+
+    @classmethod
+    async def setup_password_hasher(
+        cls,
+    ) -> None:
+        """Выставить стоимость bcrypt из настроек или подобрать её под целевое время на этом железе."""
+        password_hasher = get_password_hasher()
+        rounds = get_env_settings().password_hash_rounds
+        if rounds is None:
+            rounds = await password_hasher.calibrate(get_env_settings().password_hash_target_ms / 1000)
+        password_hasher.set_rounds(rounds)
+        user_lobby_logger.info(f'Стоимость bcrypt для паролей: {rounds}')
 
     @classmethod
     def include_admin_routers(
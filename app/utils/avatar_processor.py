@@ -0,0 +1,148 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+import hashlib
+from io import BytesIO
+import multiprocessing
+import os
+import re
+from typing import BinaryIO
+
+from PIL import Image
+from PIL.Image import Image as PILImage
+
+from app.utils.config import get_env_settings
+from app.utils.logger_config import user_lobby_logger
+
+AVATAR_DIR = '/media/avatar'
+AVATAR_SIZES = (200, 64, 32)
+# Расширение файла варианта и формат PIL: WebP для браузеров, JPEG для клиентов без его поддержки
+AVATAR_FORMATS = {'webp': 'WEBP', 'jpg': 'JPEG'}
+AVATAR_QUALITY = 85
+# Сигнатуры в начале файла поддерживаемых форматов, по ним определяется настоящий формат загрузки
+AVATAR_SIGNATURES = {
+    b'\xff\xd8\xff': 'JPEG',
+    b'\x89PNG\r\n\x1a\n': 'PNG',
+    b'GIF87a': 'GIF',
+    b'GIF89a': 'GIF',
+}
+AVATAR_SIGNATURE_SIZE = max(len(signature) for signature in AVATAR_SIGNATURES)
+# Имя варианта из хеша содержимого: по такому имени файл никогда не меняется
+HASHED_AVATAR_NAME = re.compile(r'[0-9a-f]{32}_\d+\.(?:webp|jpg)')
+DEFAULT_AVATAR_COLOR = '#9e9e9e'
+
+
+def avatar_path(digest: str, size: int = AVATAR_SIZES[0], extension: str = 'webp', directory: str = AVATAR_DIR) -> str:
+    """Путь к варианту аватара с хешем содержимого digest."""
+    return f'{directory}/{digest}_{size}.{extension}'
+
+
+def is_hashed_avatar(filename: str) -> bool:
+    """Назван ли файл аватара по хешу содержимого."""
+    return HASHED_AVATAR_NAME.fullmatch(filename) is not None
+
+
+@lru_cache
+def default_avatar() -> bytes:
+    """Аватар по умолчанию в WebP, рисуется один раз на процесс."""
+    buffer = BytesIO()
+    Image.new('RGB', (AVATAR_SIZES[0], AVATAR_SIZES[0]), DEFAULT_AVATAR_COLOR).save(buffer, format='WEBP')
+    return buffer.getvalue()
+
+
+def sniff_avatar_format(header: bytes) -> str | None:
+    """Формат изображения по сигнатуре в начале файла, None для неподдерживаемых."""
+    for signature, image_format in AVATAR_SIGNATURES.items():
+        if header.startswith(signature):
+            return image_format
+    return None
+
+
+def read_avatar_size(fp: BinaryIO, image_format: str) -> tuple[int, int]:
+    """Размер изображения в пикселях из заголовка, без декодирования самого изображения."""
+    with Image.open(fp, formats=[image_format]) as image:
+        return image.size
+
+
+def render_avatar_variants(contents: bytes, directory: str = AVATAR_DIR) -> str:
+    """Сохранить все варианты аватара и вернуть хеш исходного файла, под которым они лежат.
+
+    Выполняется в процессе пула, поэтому принимает и возвращает только сериализуемые значения.
+    Одинаковые файлы получают один хеш, и уже сохранённые варианты повторно не считаются.
+    """
+    digest = hashlib.sha256(contents).hexdigest()[:32]
+    paths = [avatar_path(digest, size, extension, directory) for size in AVATAR_SIZES for extension in AVATAR_FORMATS]
+    if all(os.path.exists(path) for path in paths):
+        return digest
+
+    image: PILImage = Image.open(BytesIO(contents))
+    # JPEG сразу декодируется с уменьшением в 2-8 раз, не разворачивая в памяти полное изображение
+    image.draft('RGB', (AVATAR_SIZES[0], AVATAR_SIZES[0]))
+    image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
+    os.makedirs(directory, exist_ok=True)
+    # Варианты уменьшаются по цепочке от большего к меньшему, каждый шаг работает с уже малым изображением
+    for size in AVATAR_SIZES:
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        for extension, image_format in AVATAR_FORMATS.items():
+            variant = image
+            if image_format == 'JPEG' and image.mode == 'RGBA':
+                variant = Image.new('RGB', image.size, 'white')
+                variant.paste(image, mask=image.getchannel('A'))
+            path = avatar_path(digest, size, extension, directory)
+            # Запись через временный файл, чтобы параллельная загрузка того же файла не увидела его недописанным
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            variant.save(temp_path, format=image_format, quality=AVATAR_QUALITY)
+            os.replace(temp_path, path)
+    return digest
+
+
+class AvatarProcessor:
+    """Декодирование и уменьшение аватаров в пуле процессов.
+
+    Декодирование PIL держит GIL, поэтому большие изображения обрабатываются в отдельных
+    процессах, а цикл событий воркера продолжает обслуживать остальные запросы. Число
+    процессов ограничивает одновременные обработки, остальные ждут в очереди пула.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._executor = self._create_executor()
+
+    async def process(self, contents: bytes, directory: str = AVATAR_DIR) -> str:
+        """Сохранить варианты аватара и вернуть путь к основному.
+
+        Если процесс пула аварийно завершился (например, его убили по памяти), пул
+        становится непригодным целиком: он пересоздаётся, и обработка повторяется один раз.
+        """
+        executor = self._executor
+        try:
+            digest = await self._render(executor, contents, directory)
+        except BrokenProcessPool:
+            user_lobby_logger.warning('Пул обработки аватаров сломан, пересоздаём его и повторяем обработку')
+            digest = await self._render(self._restart(executor), contents, directory)
+        return avatar_path(digest, directory=directory)
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn вместо fork: дочерний процесс не наследует потоки и соединения цикла событий
+        return ProcessPoolExecutor(max_workers=self._max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def _restart(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Заменить сломанный пул новым, если его ещё не заменил параллельный запрос."""
+        if self._executor is broken:
+            self._executor = self._create_executor()
+            broken.shutdown(wait=False, cancel_futures=True)
+        return self._executor
+
+    @staticmethod
+    async def _render(executor: ProcessPoolExecutor, contents: bytes, directory: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(executor, render_avatar_variants, contents, directory)
+
+    def shutdown(self) -> None:
+        """Остановить процессы пула."""
+        self._executor.shutdown(cancel_futures=True)
+
+
+@lru_cache
+def get_avatar_processor() -> AvatarProcessor:
+    return AvatarProcessor(max_workers=get_env_settings().avatar_workers)
@@ -0,0 +1,30 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Фильтр Блума над строками: без ложных отрицаний, с долей ложных срабатываний около error_rate.
+
+    Позиции битов получаются двойным хешированием одного BLAKE2b, поэтому проверка стоит
+    один хеш независимо от числа хеш-функций.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def add(self, item: str) -> None:
+        """Добавить элемент."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(first + index * second) % self._size for index in range(self._hash_count)]
@@ -30,6 +30,31 @@ class EnvSettings(
     redis_password: SecretStr
     postgres_main: SecretStr
     allowed_origins: SecretStr
+    lobby_cache_ttl: int = 5
+    lobby_ws_queue_size: int = 100
+    room_seats_reconcile_interval: int = 60
+    idle_rooms_purge_interval: int = 60
+    idle_room_timeout: int = 60 * 60
+    idle_rooms_purge_batch_size: int = 100
+    room_presence_grace: int = 15
+    room_presence_sweep_interval: int = 5
+    room_presence_sweep_batch_size: int = 500
+    player_disconnect_timeout: int = 60
+    deadlines_batch_size: int = 100
+    deadlines_poll_interval: float = 0.5
+    quick_join_candidates: int = 5
+    lobby_search_timeout_ms: int = 500
+    user_profile_cache_ttl: int = 60
+    password_hash_workers: int = 4
+    password_hash_target_ms: int = 250
+    password_hash_rounds: int | None = None
+    token_cache_size: int = 10_000
+    token_revocations_capacity: int = 100_000
+    token_revocations_error_rate: float = 0.01
+    token_revocations_rebuild_interval: int = 600
+    avatar_workers: int = 2
+    avatar_max_bytes: int = 5 * 1024 * 1024
+    avatar_max_pixels: int = 40_000_000
 
 
 @lru_cache
@@ -0,0 +1,71 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+LOBBY_CACHE_REQUESTS = Counter(
+    'lobby_cache_requests_total',
+    'Обращения к кэшу списка комнат в Redis',
+    ['result'],
+)
+
+LOBBY_WS_CONNECTIONS = Gauge(
+    'lobby_ws_connections',
+    'Открытые WebSocket соединения лобби в воркере',
+)
+
+LOBBY_WS_DROPPED = Counter(
+    'lobby_ws_dropped_total',
+    'WebSocket соединения лобби, отключённые из-за переполнения очереди отправки',
+)
+
+LOBBY_DEADLINES_DEPTH = Gauge(
+    'lobby_deadlines_depth',
+    'Запланированные сроки лобби в очереди Redis',
+)
+
+LOBBY_DEADLINES_LATENESS = Histogram(
+    'lobby_deadlines_lateness_seconds',
+    'Опоздание выполнения срока лобби относительно запланированного момента',
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+USER_PROFILE_CACHE_REQUESTS = Counter(
+    'user_profile_cache_requests_total',
+    'Обращения к кэшу публичных профилей пользователей в Redis',
+    ['result'],
+)
+
+PASSWORD_HASH_QUEUE = Gauge(
+    'password_hash_queue',
+    'Вычисления bcrypt, ожидающие свободного потока пула хеширования',
+)
+
+PASSWORD_HASH_WAIT = Histogram(
+    'password_hash_wait_seconds',
+    'Время ожидания вычисления bcrypt в очереди пула хеширования',
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    'password_hash_duration_seconds',
+    'Длительность хеширования и проверки пароля bcrypt',
+    ['operation'],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+TOKEN_CACHE_REQUESTS = Counter(
+    'token_cache_requests_total',
+    'Обращения к кэшу проверенных JWT в воркере',
+    ['result'],
+)
+
+__all__ = [
+    'LOBBY_CACHE_REQUESTS',
+    'LOBBY_DEADLINES_DEPTH',
+    'LOBBY_DEADLINES_LATENESS',
+    'LOBBY_WS_CONNECTIONS',
+    'LOBBY_WS_DROPPED',
+    'PASSWORD_HASH_DURATION',
+    'PASSWORD_HASH_QUEUE',
+    'PASSWORD_HASH_WAIT',
+    'TOKEN_CACHE_REQUESTS',
+    'USER_PROFILE_CACHE_REQUESTS',
+]
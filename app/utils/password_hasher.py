@@ -0,0 +1,107 @@
+import asyncio
+import math
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
+import time
+from typing import TypeVar
+
+from passlib.context import CryptContext
+
+from app.utils.config import get_env_settings
+from app.utils.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_QUEUE, PASSWORD_HASH_WAIT
+
+T = TypeVar('T')
+
+# Единственный контекст паролей приложения, стоимость bcrypt выставляется при старте
+pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+CALIBRATION_ROUNDS = 8
+CALIBRATION_SAMPLES = 3
+
+
+def calibrate_bcrypt_rounds(target_seconds: float) -> int:
+    """Подобрать стоимость bcrypt, при которой хеш на этом железе считается около target_seconds.
+
+    Каждый шаг стоимости удваивает время, поэтому достаточно замерить дешёвый хеш
+    и экстраполировать по log2.
+    """
+    handler = pwd_context.handler('bcrypt').using(rounds=CALIBRATION_ROUNDS)
+    elapsed = math.inf
+    # Лучший из нескольких замеров отбрасывает случайные задержки планировщика
+    for _ in range(CALIBRATION_SAMPLES):
+        started_at = time.perf_counter()
+        handler.hash('calibration')
+        elapsed = min(elapsed, time.perf_counter() - started_at)
+    rounds = CALIBRATION_ROUNDS + round(math.log2(target_seconds / elapsed))
+    return max(BCRYPT_MIN_ROUNDS, min(BCRYPT_MAX_ROUNDS, rounds))
+
+
+class PasswordHasher:
+    """Хеширование и проверка паролей bcrypt в ограниченном пуле потоков.
+
+    bcrypt отпускает GIL на время вычисления, поэтому потоки считают хеши параллельно,
+    а цикл событий воркера продолжает обслуживать остальные запросы. Число потоков
+    ограничивает одновременные вычисления, остальные ждут в очереди пула.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='password-hasher')
+
+    async def hash(self, raw_password: str) -> str:
+        """Захешировать пароль."""
+        return await self._run('hash', pwd_context.hash, raw_password)
+
+    async def verify(self, raw_password: str, hash_password: str) -> bool:
+        """Проверить пароль по хешу."""
+        return await self._run('verify', pwd_context.verify, raw_password, hash_password)
+
+    def needs_update(self, hash_password: str) -> bool:
+        """Нужно ли перехешировать пароль под текущую стоимость."""
+        return pwd_context.needs_update(hash_password)
+
+    async def calibrate(self, target_seconds: float) -> int:
+        """Подобрать стоимость bcrypt в пуле хеширования, не блокируя цикл событий."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, calibrate_bcrypt_rounds, target_seconds)
+
+    @staticmethod
+    def set_rounds(rounds: int) -> None:
+        """Хешировать пароли со стоимостью rounds и считать устаревшими хеши другой стоимости.
+
+        Хеши на один шаг дороже не перехешируются, чтобы воркеры, откалиброванные
+        с разницей в шаг, не перезаписывали хеши друг друга при каждом входе.
+        """
+        pwd_context.update(bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds, bcrypt__max_rounds=rounds + 1)
+
+    async def _run(self, operation: str, func: Callable[..., T], *args: str) -> T:
+        queued_at = time.perf_counter()
+        queued = True
+        lock = threading.Lock()
+
+        def leave_queue() -> None:
+            # Из очереди выходит либо начавшееся вычисление, либо отменённый до его начала запрос
+            nonlocal queued
+            with lock:
+                if queued:
+                    queued = False
+                    PASSWORD_HASH_QUEUE.dec()
+
+        def call() -> T:
+            leave_queue()
+            PASSWORD_HASH_WAIT.observe(time.perf_counter() - queued_at)
+            with PASSWORD_HASH_DURATION.labels(operation=operation).time():
+                return func(*args)
+
+        PASSWORD_HASH_QUEUE.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+        finally:
+            leave_queue()
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    return PasswordHasher(max_workers=get_env_settings().password_hash_workers)
@@ -33,3 +33,14 @@ async def test_add_black_list(
 
     await fake_session.refresh(room, ['blacklisted_players'])
     assert room.blacklisted_players == [blacklist_entry]
+
+
+async def test_add_black_list_idempotent(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+    await lobby_repository.add_black_list(room_id=room.id, user_id=1)
+    await lobby_repository.add_black_list(room_id=room.id, user_id=1)
+    assert await fake_session.scalar(select(count(BlackListORM.id))) == 1
@@ -0,0 +1,31 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.rank_orm import RankORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_add_player_to_room(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    rank = await orm_factories[RankORM].acreate(users=[])
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id, in_room=False)
+    old_room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+    await orm_factories[PlayerORM].acreate(room_id=old_room.id, room=old_room, user_id=user.id)
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+
+    player = await lobby_repository.add_player_to_room(room_id=room.id, user_id=user.id)
+    fake_session.expire_all()
+
+    assert player.room_id == room.id
+    assert player.name == user.username
+    assert player.is_host is False
+    players = (await fake_session.scalars(select(PlayerORM).where(PlayerORM.user_id == user.id))).all()
+    assert [stored.room_id for stored in players] == [room.id]
+    assert (await fake_session.get(UserORM, user.id)).in_room is True
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import count
+
+from app.integrations.postgres.exceptions import TitleCreateRoomPostgres
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.rank_orm import RankORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from app.transports.handlers.lobby.schemas import RoomCreateSchema
+from tests.conftest_utils import DTOFactoryDict, ORMFactoryDict
+
+
+async def test_create_room_with_host(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    rank = await orm_factories[RankORM].acreate(users=[])
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id, in_room=False)
+    room_data = dto_factories[RoomCreateSchema].build()
+
+    created = await lobby_repository.create_room_with_host(room_data=room_data, user_id=user.id)
+    fake_session.expire_all()
+
+    assert created.room.title == room_data.title
+    assert created.host.user_id == user.id
+    assert created.host.room_id == created.room.id
+    assert created.host.is_host is True
+    assert created.host.name == user.name
+    assert (await fake_session.get(UserORM, user.id)).in_room is True
+    assert await fake_session.scalar(select(count(PlayerORM.id)).where(PlayerORM.room_id == created.room.id)) == 1
+
+
+async def test_user_in_room(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    rank = await orm_factories[RankORM].acreate(users=[])
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id, in_room=True)
+
+    assert await lobby_repository.create_room_with_host(
+        room_data=dto_factories[RoomCreateSchema].build(), user_id=user.id
+    ) is None
+    assert await fake_session.scalar(select(count(RoomORM.id))) == 0
+
+
+async def test_user_not_found(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    assert await lobby_repository.create_room_with_host(
+        room_data=dto_factories[RoomCreateSchema].build(), user_id=1
+    ) is None
+    assert await fake_session.scalar(select(count(RoomORM.id))) == 0
+
+
+async def test_title_already_exists(
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    rank = await orm_factories[RankORM].acreate(users=[])
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id, in_room=False)
+    room_data = dto_factories[RoomCreateSchema].build()
+    await lobby_repository.create_room(room_data=room_data)
+
+    with pytest.raises(TitleCreateRoomPostgres):
+        await lobby_repository.create_room_with_host(room_data=room_data, user_id=user.id)
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import count
+
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.rank_orm import RankORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_delete_idle_rooms(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+    rank = await orm_factories[RankORM].acreate(users=[])
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id, in_room=True)
+    idle_room = await orm_factories[RoomORM].acreate(
+        players=[], blacklisted_players=[], started=False, afk_time=long_ago
+    )
+    started_room = await orm_factories[RoomORM].acreate(
+        players=[], blacklisted_players=[], started=True, afk_time=long_ago
+    )
+    active_room = await orm_factories[RoomORM].acreate(
+        players=[], blacklisted_players=[], started=False, afk_time=datetime.now(timezone.utc)
+    )
+    await orm_factories[PlayerORM].acreate(room_id=idle_room.id, room=idle_room, user_id=user.id)
+
+    assert await lobby_repository.delete_idle_rooms(idle_seconds=3600, limit=10) == [idle_room.id]
+    fake_session.expire_all()
+
+    remaining = await fake_session.scalars(select(RoomORM.id).order_by(RoomORM.id))
+    assert list(remaining) == sorted([started_room.id, active_room.id])
+    assert await fake_session.scalar(select(count(PlayerORM.id))) == 0
+    assert (await fake_session.get(UserORM, user.id)).in_room is False
+
+
+async def test_batch_limit(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+    for _ in range(3):
+        await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], started=False, afk_time=long_ago)
+
+    assert len(await lobby_repository.delete_idle_rooms(idle_seconds=3600, limit=2)) == 2
+    assert await fake_session.scalar(select(count(RoomORM.id))) == 1
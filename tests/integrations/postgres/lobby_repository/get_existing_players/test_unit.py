@@ -0,0 +1,16 @@
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_get_existing_players(
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+    player = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room)
+
+    assert await lobby_repository.get_existing_players(
+        players=[(room.id, player.user_id), (room.id + 1, player.user_id)]
+    ) == [(room.id, player.user_id)]
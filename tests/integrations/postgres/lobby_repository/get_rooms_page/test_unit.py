@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.dtos.lobby_dto import RoomCursorDTO, RoomFilterDTO
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_get_rooms_page(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    now = datetime.now(timezone.utc)
+    rooms = [
+        await orm_factories[RoomORM].acreate(
+            players=[],
+            blacklisted_players=[],
+            created_at=now - timedelta(minutes=index),
+        )
+        for index in range(3)
+    ]
+
+    first_page = await lobby_repository.get_rooms_page(filters=RoomFilterDTO(), limit=2)
+    assert [room.id for room in first_page] == [rooms[0].id, rooms[1].id]
+
+    second_page = await lobby_repository.get_rooms_page(
+        filters=RoomFilterDTO(),
+        limit=2,
+        cursor=RoomCursorDTO(created_at=first_page[-1].created_at, id=first_page[-1].id),
+    )
+    assert [room.id for room in second_page] == [rooms[2].id]
+
+
+async def test_get_rooms_page_filters(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    full_room = await orm_factories[RoomORM].acreate(
+        players=[],
+        blacklisted_players=[],
+        game_name='Black Jokes',
+        started=False,
+        is_private=False,
+        max_players=3,
+    )
+    for _ in range(3):
+        await orm_factories[PlayerORM].acreate(room_id=full_room.id, room=full_room)
+    free_room = await orm_factories[RoomORM].acreate(
+        players=[],
+        blacklisted_players=[],
+        game_name='Black Jokes',
+        started=False,
+        is_private=False,
+        max_players=3,
+    )
+    await orm_factories[RoomORM].acreate(
+        players=[],
+        blacklisted_players=[],
+        game_name='Fools',
+        started=True,
+        is_private=True,
+    )
+
+    free_rooms = await lobby_repository.get_rooms_page(
+        filters=RoomFilterDTO(game_name='Black Jokes', started=False, has_free_seats=True),
+        limit=10,
+    )
+    assert [room.id for room in free_rooms] == [free_room.id]
+
+    full_rooms = await lobby_repository.get_rooms_page(filters=RoomFilterDTO(has_free_seats=False), limit=10)
+    assert [room.id for room in full_rooms] == [full_room.id]
+    assert len(full_rooms[0].players) == 3
+
+
+async def test_get_rooms_page_zero(
+    lobby_repository: LobbyRepository,
+) -> None:
+    assert await lobby_repository.get_rooms_page(filters=RoomFilterDTO(), limit=10) == []
@@ -0,0 +1,36 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_get_rooms_seats(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], max_players=4)
+    await orm_factories[PlayerORM].acreate(room_id=room.id, room=room)
+    await orm_factories[PlayerORM].acreate(room_id=room.id, room=room)
+    empty_room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], max_players=6)
+
+    result = {seats.id: seats for seats in await lobby_repository.get_rooms_seats()}
+
+    assert (result[room.id].player_count, result[room.id].max_players) == (2, 4)
+    assert (result[empty_room.id].player_count, result[empty_room.id].max_players) == (0, 6)
+
+
+async def test_password_room_is_private(
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(
+        players=[], blacklisted_players=[], is_private=False, password='secret', started=False
+    )
+
+    result = {seats.id: seats for seats in await lobby_repository.get_rooms_seats()}
+
+    assert result[room.id].is_private is True
+    assert result[room.id].started is False
@@ -0,0 +1,41 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.dtos.lobby_dto import RoomFilterDTO
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_get_rooms_summary_page(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], max_players=5)
+    await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=True, name='host')
+    await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=False, name='guest')
+    empty_room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], max_players=3)
+
+    result = await lobby_repository.get_rooms_summary_page(filters=RoomFilterDTO(), limit=10)
+    summaries = {summary.id: summary for summary in result}
+
+    assert summaries[room.id].player_count == 2
+    assert summaries[room.id].free_slots == 3
+    assert summaries[room.id].host_name == 'host'
+    assert summaries[empty_room.id].player_count == 0
+    assert summaries[empty_room.id].free_slots == 3
+    assert summaries[empty_room.id].host_name is None
+
+
+async def test_get_rooms_summary_page_free_seats(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    full_room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], max_players=1)
+    await orm_factories[PlayerORM].acreate(room_id=full_room.id, room=full_room, is_host=True)
+    free_room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], max_players=3)
+
+    result = await lobby_repository.get_rooms_summary_page(filters=RoomFilterDTO(has_free_seats=True), limit=10)
+    assert [summary.id for summary in result] == [free_room.id]
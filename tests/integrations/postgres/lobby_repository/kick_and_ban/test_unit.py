@@ -0,0 +1,42 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.functions import count
+
+from app.integrations.postgres.orms.blacklis_orm import BlackListORM
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.rank_orm import RankORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_kick_and_ban(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    rank = await orm_factories[RankORM].acreate(users=[])
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id, in_room=True)
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+    player = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, user_id=user.id)
+
+    kicked_player = await lobby_repository.kick_and_ban(user_id=user.id, room_id=room.id)
+    fake_session.expire_all()
+
+    assert kicked_player.id == player.id
+    assert await fake_session.scalar(select(count(PlayerORM.id)).where(PlayerORM.room_id == room.id)) == 0
+    assert (await fake_session.get(UserORM, user.id)).in_room is False
+    assert await fake_session.scalar(select(count(BlackListORM.id)).where(BlackListORM.room_id == room.id)) == 1
+
+
+async def test_kick_and_ban_twice(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+
+    assert await lobby_repository.kick_and_ban(user_id=1, room_id=room.id) is None
+    assert await lobby_repository.kick_and_ban(user_id=1, room_id=room.id) is None
+    assert await fake_session.scalar(select(count(BlackListORM.id)).where(BlackListORM.room_id == room.id)) == 1
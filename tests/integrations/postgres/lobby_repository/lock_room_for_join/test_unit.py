@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.integrations.postgres.orms.blacklis_orm import BlackListORM
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.rank_orm import RankORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_lock_room_for_join(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    rank = await orm_factories[RankORM].acreate(users=[])
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id, in_room=False)
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+    await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=True)
+    await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=False)
+    await orm_factories[BlackListORM].acreate(room_id=room.id, user_id=user.id, room=room)
+
+    result = await lobby_repository.lock_room_for_join(room_id=room.id, user_id=user.id)
+
+    assert result.room.id == room.id
+    assert len(result.room.players) == 2
+    assert result.user_in_room is False
+    assert result.banned_user_ids == [user.id]
+
+
+async def test_lock_room_for_join_unknown_user(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+
+    result = await lobby_repository.lock_room_for_join(room_id=room.id, user_id=-1)
+
+    assert result.room.players == []
+    assert result.user_in_room is None
+    assert result.banned_user_ids == []
+
+
+async def test_lock_room_for_join_not_found(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+) -> None:
+    with pytest.raises(RoomNotFoundPostgres):
+        await lobby_repository.lock_room_for_join(room_id=-1, user_id=1)
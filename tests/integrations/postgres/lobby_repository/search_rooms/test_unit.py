@@ -0,0 +1,33 @@
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_search_rooms(
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    prefix_room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], title='Мафия у Пети')
+    similar_room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], title='Вечерняя мафия')
+    await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], title='Блэкджек')
+    await orm_factories[PlayerORM].acreate(room_id=prefix_room.id, room=prefix_room, is_host=True, name='Петя')
+
+    rooms = await lobby_repository.search_rooms(query='мафия', limit=10, timeout_ms=1000)
+
+    assert [room.id for room in rooms] == [prefix_room.id, similar_room.id]
+    assert rooms[0].player_count == 1
+    assert rooms[0].host_name == 'Петя'
+
+
+async def test_limit_and_wildcards(
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    for title in ('100% fun', '100 fun', '100% win'):
+        await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], title=title)
+
+    rooms = await lobby_repository.search_rooms(query='100%', limit=1, timeout_ms=1000)
+
+    assert len(rooms) == 1
+    assert rooms[0].title.startswith('100%')
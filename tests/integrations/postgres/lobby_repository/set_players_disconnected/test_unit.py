@@ -0,0 +1,31 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_set_players_disconnected(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[])
+    player = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_disconnect=False)
+    other_player = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_disconnect=False)
+
+    written = await lobby_repository.set_players_disconnected(
+        players=[(room.id, player.user_id), (room.id, -1)], is_disconnect=True
+    )
+    fake_session.expire_all()
+
+    assert written == [(room.id, player.user_id)]
+    assert (await fake_session.get(PlayerORM, player.id)).is_disconnect is True
+    assert (await fake_session.get(PlayerORM, other_player.id)).is_disconnect is False
+
+
+async def test_empty(
+    lobby_repository: LobbyRepository,
+) -> None:
+    assert await lobby_repository.set_players_disconnected(players=[], is_disconnect=True) == []
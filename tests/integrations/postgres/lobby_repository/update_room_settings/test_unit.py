@@ -0,0 +1,105 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.orms.player_orm import PlayerORM
+from app.integrations.postgres.orms.room_orm import RoomORM
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from app.transports.handlers.lobby.schemas import RoomUpdateSchema
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_update_room_settings(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(
+        players=[], blacklisted_players=[], max_players=12, is_private=False, password=None
+    )
+    host = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=True)
+    await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=False)
+
+    updated = await lobby_repository.update_room_settings(
+        room_id=room.id,
+        host_user_id=host.user_id,
+        settings=RoomUpdateSchema(max_players=4, password='secret', game_name='Мафия'),
+    )
+    fake_session.expire_all()
+
+    assert updated.max_players == 4
+    assert updated.player_count == 2
+    assert updated.free_slots == 2
+    assert updated.is_private is True
+    assert updated.game_name == 'Мафия'
+    assert updated.host_name == host.name
+    assert updated.password == 'secret'
+    assert (await fake_session.get(RoomORM, room.id)).password == 'secret'
+
+
+async def test_clear_password(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(
+        players=[], blacklisted_players=[], max_players=12, is_private=True, password='secret'
+    )
+    host = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=True)
+
+    updated = await lobby_repository.update_room_settings(
+        room_id=room.id, host_user_id=host.user_id, settings=RoomUpdateSchema(password=None)
+    )
+    fake_session.expire_all()
+
+    assert updated.is_private is False
+    assert updated.password is None
+    assert (await fake_session.get(RoomORM, room.id)).is_private is False
+
+
+async def test_clear_password_keeps_explicit_private(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(
+        players=[], blacklisted_players=[], max_players=12, is_private=True, password='secret'
+    )
+    host = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=True)
+
+    updated = await lobby_repository.update_room_settings(
+        room_id=room.id, host_user_id=host.user_id, settings=RoomUpdateSchema(password=None, is_private=True)
+    )
+
+    assert updated.is_private is True
+    assert updated.password is None
+
+
+async def test_not_host(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], game_name='Идет выбор')
+    player = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=False)
+
+    assert await lobby_repository.update_room_settings(
+        room_id=room.id, host_user_id=player.user_id, settings=RoomUpdateSchema(game_name='Мафия')
+    ) is None
+    fake_session.expire_all()
+    assert (await fake_session.get(RoomORM, room.id)).game_name == 'Идет выбор'
+
+
+async def test_max_players_below_count(
+    fake_session: AsyncSession,
+    lobby_repository: LobbyRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    room = await orm_factories[RoomORM].acreate(players=[], blacklisted_players=[], max_players=12)
+    host = await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=True)
+    for _ in range(3):
+        await orm_factories[PlayerORM].acreate(room_id=room.id, room=room, is_host=False)
+
+    assert await lobby_repository.update_room_settings(
+        room_id=room.id, host_user_id=host.user_id, settings=RoomUpdateSchema(max_players=3)
+    ) is None
+    fake_session.expire_all()
+    assert (await fake_session.get(RoomORM, room.id)).max_players == 12
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.dtos.user_dto import (
+    AchievementDTO,
+    PlayerStatisticDTO,
+    UserAchievementsDTO,
+    UserDetailDTO,
+    UserProfileDTO,
+)
+from app.integrations.postgres.exceptions import UserNotFoundPostgres
+from app.integrations.postgres.orms.achievement_orm import AchievementORM
+from app.integrations.postgres.orms.games_achievements_orm import GameAchievementsORM
+from app.integrations.postgres.orms.player_game_statistics_orm import UserGameStatisticsORM
+from app.integrations.postgres.orms.rank_orm import RankORM
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.user_repository import UserRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_get_profile(
+    fake_session: AsyncSession,
+    user_repository: UserRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    rank = await orm_factories[RankORM].acreate(users=[])
+    achievement = await orm_factories[AchievementORM].acreate()
+    user = await orm_factories[UserORM].acreate(rank_id=rank.id)
+    statistics = [
+        await orm_factories[UserGameStatisticsORM].acreate(user_id=user.id, game_name=game_name)
+        for game_name in ('first', 'second')
+    ]
+    user_achievement = await orm_factories[GameAchievementsORM].acreate(
+        game_name='test',
+        user_id=user.id,
+        achievement_id=achievement.id,
+    )
+    await fake_session.refresh(user, ['rank'])
+    assert await user_repository.get_profile(user_id=user.id) == UserProfileDTO(
+        **UserDetailDTO.model_validate(user).model_dump(),
+        statistics=[PlayerStatisticDTO.model_validate(statistic) for statistic in statistics],
+        achievements=[
+            UserAchievementsDTO(
+                achievement=AchievementDTO.model_validate(achievement),
+                game_name=user_achievement.game_name,
+                receiving_cond=user_achievement.receiving_cond,
+            )
+        ],
+    )
+
+
+async def test_without_statistics_and_achievements(
+    user_repository: UserRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    user = await orm_factories[UserORM].acreate(rank_id=None)
+    profile = await user_repository.get_profile(user_id=user.id)
+    assert profile.rank is None
+    assert profile.statistics == []
+    assert profile.achievements == []
+
+
+async def test_nonexistent_user(
+    user_repository: UserRepository,
+) -> None:
+    with pytest.raises(UserNotFoundPostgres):
+        await user_repository.get_profile(user_id=1)
+
@@ -0,0 +1,48 @@
+from app.integrations.postgres.dtos.user_dto import UserAchievementsDTO, UserPublicDTO, UserPublicProfileDTO
+from app.integrations.postgres.orms.achievement_orm import AchievementORM
+from app.integrations.postgres.orms.games_achievements_orm import GameAchievementsORM
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.user_repository import UserRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_get_public_profiles(
+    user_repository: UserRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    achievement = await orm_factories[AchievementORM].acreate()
+    first_user = await orm_factories[UserORM].acreate(rank_id=None)
+    second_user = await orm_factories[UserORM].acreate(rank_id=None)
+    await orm_factories[UserORM].acreate(rank_id=None)
+    user_achievement = await orm_factories[GameAchievementsORM].acreate(
+        game_name='test',
+        user_id=second_user.id,
+        achievement_id=achievement.id,
+    )
+    profiles = await user_repository.get_public_profiles(user_ids=[second_user.id, first_user.id])
+    assert profiles == [
+        UserPublicProfileDTO(
+            **UserPublicDTO.model_validate(first_user).model_dump(),
+            id=first_user.id,
+            achievements=[],
+        ),
+        UserPublicProfileDTO(
+            **UserPublicDTO.model_validate(second_user).model_dump(),
+            id=second_user.id,
+            achievements=[
+                UserAchievementsDTO.model_validate(
+                    {
+                        'achievement': achievement,
+                        'game_name': user_achievement.game_name,
+                        'receiving_cond': user_achievement.receiving_cond,
+                    }
+                )
+            ],
+        ),
+    ]
+
+
+async def test_nonexistent_users(
+    user_repository: UserRepository,
+) -> None:
+    assert await user_repository.get_public_profiles(user_ids=[1, 2]) == []
@@ -0,0 +1,28 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.postgres.orms.user_orm import UserORM
+from app.integrations.postgres.repositories.user_repository import UserRepository
+from tests.conftest_utils import ORMFactoryDict
+
+
+async def test_happy_path(
+    fake_session: AsyncSession,
+    user_repository: UserRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    user = await orm_factories[UserORM].acreate(rank_id=None, hash_password='old')
+    assert await user_repository.update_hash_password(user.id, 'old', 'new')
+    stmt = select(UserORM.hash_password).where(UserORM.id == user.id)
+    assert await fake_session.scalar(stmt) == 'new'
+
+
+async def test_password_changed(
+    fake_session: AsyncSession,
+    user_repository: UserRepository,
+    orm_factories: ORMFactoryDict,
+) -> None:
+    user = await orm_factories[UserORM].acreate(rank_id=None, hash_password='changed')
+    assert not await user_repository.update_hash_password(user.id, 'old', 'new')
+    stmt = select(UserORM.hash_password).where(UserORM.id == user.id)
+    assert await fake_session.scalar(stmt) == 'changed'
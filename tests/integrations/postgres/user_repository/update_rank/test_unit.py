@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import count
@@ -5,6 +7,7 @@ from sqlalchemy.sql.functions import count
 from app.integrations.postgres.orms.rank_orm import RankORM
 from app.integrations.postgres.orms.user_orm import UserORM
 from app.integrations.postgres.repositories.user_repository import UserRepository
+from app.integrations.redis.profile_cache import ProfileCache, invalidate_committed_profiles
 from tests.conftest_utils import ORMFactoryDict
 
 
@@ -30,3 +33,17 @@ async def test_happy_path(
         rank=rank1.id,
     )
     assert await fake_session.scalar(stmt) == 1
+
+
+async def test_invalidate_profile(
+        fake_session: AsyncSession,
+        orm_factories: ORMFactoryDict,
+) -> None:
+    mock_profile_cache = AsyncMock(spec=ProfileCache)
+    rank = await orm_factories[RankORM].acreate(
+        users=[],
+    )
+    user = await orm_factories[UserORM].acreate(rank_id=None)
+    await UserRepository(fake_session, mock_profile_cache).update_rank(user_id=user.id, rank=rank.id)
+    mock_profile_cache.invalidate_after_commit.assert_called_once_with(fake_session, user.id)
+    mock_profile_cache.invalidate.assert_not_awaited()
@@ -0,0 +1,80 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.integrations.redis.profile_cache import (
+    ProfileCache,
+    discard_pending_profiles,
+    invalidate_committed_profiles,
+)
+from app.integrations.redis.redis import RedisFacade
+
+
+@pytest.fixture
+def mock_redis() -> AsyncMock:
+    return AsyncMock(spec=RedisFacade)
+
+
+@pytest.fixture
+def fake_session() -> MagicMock:
+    session = MagicMock()
+    session.info = {}
+    return session
+
+
+async def test_invalidate_after_commit(
+    mock_redis: AsyncMock,
+    fake_session: MagicMock,
+) -> None:
+    profile_cache = ProfileCache(mock_redis)
+    profile_cache.invalidate_after_commit(fake_session, 1)
+    profile_cache.invalidate_after_commit(fake_session, 1)
+    profile_cache.invalidate_after_commit(fake_session, 2)
+    mock_redis.incr.assert_not_awaited()
+
+    await invalidate_committed_profiles(fake_session)
+
+    assert [call.args[0] for call in mock_redis.incr.await_args_list] == [
+        'user:1:profile:version',
+        'user:2:profile:version',
+    ]
+    await invalidate_committed_profiles(fake_session)
+    assert mock_redis.incr.await_count == 2
+
+
+async def test_discard_after_rollback(
+    mock_redis: AsyncMock,
+    fake_session: MagicMock,
+) -> None:
+    ProfileCache(mock_redis).invalidate_after_commit(fake_session, 1)
+
+    discard_pending_profiles(fake_session)
+    await invalidate_committed_profiles(fake_session)
+
+    mock_redis.incr.assert_not_awaited()
+
+
+async def test_get_versions_creates_missing_in_one_pipeline(
+    mock_redis: AsyncMock,
+) -> None:
+    mock_redis.get_many.return_value = ['10', None, None]
+    mock_redis.set_many_if_absent.return_value = ['500', '600']
+
+    versions = await ProfileCache(mock_redis).get_versions([1, 2, 3])
+
+    assert versions == {1: 10, 2: 500, 3: 600}
+    mock_redis.set_many_if_absent.assert_awaited_once()
+    assert list(mock_redis.set_many_if_absent.await_args.args[0]) == [
+        'user:2:profile:version',
+        'user:3:profile:version',
+    ]
+    mock_redis.get.assert_not_awaited()
+
+
+async def test_get_versions_without_missing(
+    mock_redis: AsyncMock,
+) -> None:
+    mock_redis.get_many.return_value = ['10', '20']
+
+    assert await ProfileCache(mock_redis).get_versions([1, 2]) == {1: 10, 2: 20}
+    mock_redis.set_many_if_absent.assert_not_awaited()
@@ -0,0 +1,57 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.integrations.redis.token_revocations import REVOCATIONS_CHANNEL, TokenRevocations
+
+
+@pytest.fixture
+def mock_redis() -> MagicMock:
+    redis = MagicMock()
+    redis.set = AsyncMock()
+    redis.publish = AsyncMock()
+    redis.mget = AsyncMock(return_value=[None, None])
+    return redis
+
+
+@pytest.fixture
+def token_revocations(mock_redis: MagicMock) -> TokenRevocations:
+    return TokenRevocations(mock_redis, token_lifetime_seconds=3600, capacity=100, error_rate=0.01, rebuild_interval=60)
+
+
+async def test_not_revoked_without_redis_call(
+    token_revocations: TokenRevocations,
+    mock_redis: MagicMock,
+) -> None:
+    assert not await token_revocations.is_revoked('jti', user_id=1, issued_at=time.time())
+    mock_redis.mget.assert_not_awaited()
+
+
+async def test_revoked_token(
+    token_revocations: TokenRevocations,
+    mock_redis: MagicMock,
+) -> None:
+    await token_revocations.revoke_token('jti', expires_at=time.time() + 60)
+    mock_redis.publish.assert_awaited_once_with(REVOCATIONS_CHANNEL, 'jti:jti')
+    mock_redis.mget.return_value = ['1', None]
+    assert await token_revocations.is_revoked('jti', user_id=1, issued_at=time.time())
+
+
+async def test_revoked_user(
+    token_revocations: TokenRevocations,
+    mock_redis: MagicMock,
+) -> None:
+    await token_revocations.revoke_user(1)
+    revoked_before = mock_redis.set.await_args.args[1]
+    mock_redis.mget.return_value = [None, str(revoked_before)]
+    assert await token_revocations.is_revoked('old', user_id=1, issued_at=revoked_before - 10)
+    assert not await token_revocations.is_revoked('new', user_id=1, issued_at=revoked_before + 10)
+
+
+async def test_expired_token_not_stored(
+    token_revocations: TokenRevocations,
+    mock_redis: MagicMock,
+) -> None:
+    await token_revocations.revoke_token('jti', expires_at=time.time() - 60)
+    mock_redis.set.assert_not_awaited()
@@ -3,8 +3,12 @@ from unittest.mock import AsyncMock
 import pytest
 
 from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
-from app.integrations.postgres.repositories.settings_repository import SettingsRepository
 from app.integrations.postgres.repositories.user_repository import UserRepository
+from app.integrations.redis.lobby_cache import LobbyCache
+from app.integrations.redis.redis import RedisFacade
+from app.integrations.redis.room_bans import RoomBans
+from app.integrations.redis.room_matchmaking import RoomMatchmaking
+from app.integrations.redis.room_seats import SEAT_RESERVED, RoomSeats
 from app.services.lobby_service import LobbyService
 
 
@@ -19,16 +23,55 @@ def mock_user_repository() -> AsyncMock:
 
 
 @pytest.fixture
-def mock_settings_repository() -> AsyncMock:
-    return AsyncMock(spec=SettingsRepository)
+def mock_lobby_cache() -> AsyncMock:
+    lobby_cache = AsyncMock(spec=LobbyCache)
+    lobby_cache.get_version.return_value = 0
+    lobby_cache.get_snapshot.return_value = None
+    return lobby_cache
+
+
+@pytest.fixture
+def mock_redis() -> AsyncMock:
+    return AsyncMock(spec=RedisFacade)
+
+
+@pytest.fixture
+def mock_room_seats() -> AsyncMock:
+    room_seats = AsyncMock(spec=RoomSeats)
+    room_seats.reserve.return_value = SEAT_RESERVED
+    return room_seats
+
+
+@pytest.fixture
+def mock_room_bans() -> AsyncMock:
+    room_bans = AsyncMock(spec=RoomBans)
+    room_bans.is_banned.return_value = False
+    return room_bans
+
+
+@pytest.fixture
+def mock_room_matchmaking() -> AsyncMock:
+    room_matchmaking = AsyncMock(spec=RoomMatchmaking)
+    room_matchmaking.candidates.return_value = []
+    return room_matchmaking
 
 
 @pytest.fixture
 def fake_lobby_service(
     mock_lobby_repository: AsyncMock,
     mock_user_repository: AsyncMock,
-    mock_settings_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    mock_room_seats: AsyncMock,
+    mock_room_bans: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
 ) -> LobbyService:
-    return LobbyService(lobby_repository=mock_lobby_repository,
-                        user_repository=mock_user_repository,
-                        settings_repository=mock_settings_repository)
+    return LobbyService(
+        lobby_repository=mock_lobby_repository,
+        user_repository=mock_user_repository,
+        lobby_cache=mock_lobby_cache,
+        redis=mock_redis,
+        room_seats=mock_room_seats,
+        room_bans=mock_room_bans,
+        room_matchmaking=mock_room_matchmaking,
+    )
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO, RoomCreateDTO
+from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO, RoomCreateDTO, RoomWithHostDTO
 from app.integrations.postgres.dtos.user_dto import UserByIdDTO
 from app.integrations.postgres.exceptions import TitleCreateRoomPostgres, UserNotFoundPostgres
 from app.services.exceptions import TitleCreateRoomService, UserInRoomService, UserNotFoundService
@@ -15,63 +15,82 @@ async def test_happy_path(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    mock_room_seats: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
+    mock_lobby_cache.invalidate.return_value = 3
     lobby = dto_factories[RoomCreateDTO].build()
-    mock_lobby_repository.create_room.return_value = lobby
-    player = dto_factories[PlayerSchemaDTO].build()
-    mock_lobby_repository.create_player.return_value = player
-    result = await fake_lobby_service.create_room(
-        room_data=dto_factories[RoomCreateSchema].build(), current_user_id=user.id
-    )
+    player = dto_factories[PlayerSchemaDTO].build(room_id=lobby.id)
+    mock_lobby_repository.create_room_with_host.return_value = RoomWithHostDTO(room=lobby, host=player)
+    room_data = dto_factories[RoomCreateSchema].build()
+    result = await fake_lobby_service.create_room(room_data=room_data, current_user_id=player.user_id)
+
     assert result == RoomCreateResponse(**lobby.model_dump(), players=[PlayerSchemaResponse(**player.model_dump())])
+    mock_lobby_repository.create_room_with_host.assert_awaited_once_with(
+        room_data=room_data, user_id=player.user_id
+    )
+    assert mock_user_repository.get_one_by_id.await_count == 0
+    mock_lobby_repository.commit.assert_awaited_once()
+    mock_room_seats.init.assert_awaited_once_with(lobby.id, taken=1, max_players=lobby.max_players)
+    mock_room_matchmaking.update.assert_awaited_once_with(
+        lobby.id, free_slots=lobby.max_players - 1, game_name=lobby.game_name, is_open=not lobby.is_private
+    )
+    delta = mock_redis.publish_ws_event.await_args.args[0]
+    assert delta['seq'] == 3
+    assert delta['type'] == 'room_created'
+    assert delta['room_id'] == lobby.id
+    assert delta['data']['room']['host_name'] == player.name
 
 
 async def test_user_not_found(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_redis: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
+    mock_lobby_repository.create_room_with_host.return_value = None
     mock_user_repository.get_one_by_id.side_effect = UserNotFoundPostgres
     with pytest.raises(UserNotFoundService):
         await fake_lobby_service.create_room(room_data=dto_factories[RoomCreateSchema].build(), current_user_id=1)
 
     mock_user_repository.get_one_by_id.assert_awaited_once_with(user_id=1)
-    assert mock_lobby_repository.create_room.await_count == 0
-    assert mock_lobby_repository.create_player.await_count == 0
+    assert mock_redis.publish_ws_event.await_count == 0
 
 
 async def test_title_create_room(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
-    mock_lobby_repository.create_room.side_effect = TitleCreateRoomPostgres
+    mock_lobby_repository.create_room_with_host.side_effect = TitleCreateRoomPostgres
     room_data = dto_factories[RoomCreateSchema].build()
     with pytest.raises(TitleCreateRoomService):
-        await fake_lobby_service.create_room(room_data=room_data, current_user_id=user.id)
+        await fake_lobby_service.create_room(room_data=room_data, current_user_id=1)
 
-    mock_lobby_repository.create_room.assert_awaited_once_with(room_data=room_data)
-    assert mock_lobby_repository.create_player.await_count == 0
+    mock_lobby_repository.create_room_with_host.assert_awaited_once_with(room_data=room_data, user_id=1)
+    assert mock_user_repository.get_one_by_id.await_count == 0
+    assert mock_room_seats.init.await_count == 0
 
 
 async def test_user_in_room(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
     user = dto_factories[UserByIdDTO].build(in_room=True)
     mock_user_repository.get_one_by_id.return_value = user
-    room_data = dto_factories[RoomCreateSchema].build()
+    mock_lobby_repository.create_room_with_host.return_value = None
     with pytest.raises(UserInRoomService):
-        await fake_lobby_service.create_room(room_data=room_data, current_user_id=user.id)
+        await fake_lobby_service.create_room(room_data=dto_factories[RoomCreateSchema].build(), current_user_id=user.id)
 
-    assert mock_lobby_repository.create_player.await_count == 0
-    mock_lobby_repository.create_room.assert_awaited_once_with(room_data=room_data)
+    mock_user_repository.get_one_by_id.assert_awaited_once_with(user_id=user.id)
+    assert mock_lobby_repository.commit.await_count == 0
+    assert mock_room_seats.init.await_count == 0
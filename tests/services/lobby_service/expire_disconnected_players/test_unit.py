@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSchemaDTO
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.services.lobby_service import LobbyService
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_host_migrates_to_connected_player(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(
+        players=[
+            {'id': 1, 'user_id': 10, 'is_host': True, 'is_disconnect': True},
+            {'id': 2, 'user_id': 20, 'is_host': False, 'is_disconnect': True},
+            {'id': 3, 'user_id': 30, 'is_host': False, 'is_disconnect': False},
+        ],
+    )
+    mock_lobby_repository.get_one_room.return_value = lobby
+
+    assert await fake_lobby_service.expire_disconnected_players(players=[(lobby.id, 10)]) == 1
+
+    mock_lobby_repository.delete_player.assert_awaited_once_with(user_id=10)
+    mock_lobby_repository.change_host.assert_awaited_once_with(player_id=3, is_host=True)
+    deltas = [call.args[0] for call in mock_redis.publish_ws_event.await_args_list]
+    assert [delta['type'] for delta in deltas] == ['player_left', 'host_changed']
+    assert mock_lobby_cache.invalidate.await_count == 2
+
+
+async def test_reconnected_player_kept(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(
+        players=[{'id': 1, 'user_id': 10, 'is_host': True, 'is_disconnect': False}],
+    )
+    mock_lobby_repository.get_one_room.return_value = lobby
+
+    assert await fake_lobby_service.expire_disconnected_players(players=[(lobby.id, 10), (lobby.id, 20)]) == 0
+    assert mock_lobby_repository.delete_player.await_count == 0
+
+
+async def test_room_not_found(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.get_one_room.side_effect = RoomNotFoundPostgres
+
+    assert await fake_lobby_service.expire_disconnected_players(players=[(1, 10)]) == 0
+    assert mock_lobby_repository.delete_player.await_count == 0
@@ -0,0 +1,22 @@
+from unittest.mock import AsyncMock
+
+from app.integrations.postgres.dtos.lobby_dto import RoomFilterDTO, RoomSummaryDTO
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomSummaryResponse
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    rooms = [dto_factories[RoomSummaryDTO].build() for _ in range(2)]
+    mock_lobby_repository.get_rooms_summary_page.return_value = rooms
+    mock_lobby_cache.get_version.return_value = 15
+    result = await fake_lobby_service.get_lobby_snapshot()
+
+    assert result.seq == 15
+    assert result.rooms == [RoomSummaryResponse(**room.model_dump()) for room in rooms]
+    mock_lobby_repository.get_rooms_summary_page.assert_awaited_once_with(filters=RoomFilterDTO(), limit=None)
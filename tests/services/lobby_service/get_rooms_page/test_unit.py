@@ -0,0 +1,112 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import RoomFilterDTO, RoomSchemaDTO
+from app.services.exceptions import InvalidCursorService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomFilterSchema, RoomResponse
+from app.transports.handlers.lobby.utils import decode_room_cursor, encode_room_cursor
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobbies = [dto_factories[RoomSchemaDTO].build() for _ in range(2)]
+    mock_lobby_repository.get_rooms_page.return_value = lobbies
+    result = await fake_lobby_service.get_rooms_page(filters=RoomFilterSchema(started=False), limit=2)
+
+    assert result.items == [RoomResponse(**room.model_dump()) for room in lobbies]
+    assert result.next_cursor is None
+    mock_lobby_repository.get_rooms_page.assert_awaited_once_with(
+        filters=RoomFilterDTO(started=False),
+        limit=3,
+        cursor=None,
+    )
+
+
+async def test_next_cursor(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobbies = [dto_factories[RoomSchemaDTO].build() for _ in range(3)]
+    mock_lobby_repository.get_rooms_page.return_value = lobbies
+    result = await fake_lobby_service.get_rooms_page(filters=RoomFilterSchema(), limit=2)
+
+    assert result.items == [RoomResponse(**room.model_dump()) for room in lobbies[:2]]
+    cursor = decode_room_cursor(result.next_cursor)
+    assert cursor.id == lobbies[1].id
+    assert cursor.created_at == lobbies[1].created_at
+
+
+async def test_with_cursor(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = dto_factories[RoomSchemaDTO].build()
+    mock_lobby_repository.get_rooms_page.return_value = []
+    cursor = encode_room_cursor(created_at=room.created_at, room_id=room.id)
+    result = await fake_lobby_service.get_rooms_page(filters=RoomFilterSchema(), limit=10, cursor=cursor)
+
+    assert result.items == []
+    assert result.next_cursor is None
+    assert mock_lobby_repository.get_rooms_page.await_args.kwargs['cursor'] == decode_room_cursor(cursor)
+
+
+async def test_invalid_cursor(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    with pytest.raises(InvalidCursorService):
+        await fake_lobby_service.get_rooms_page(filters=RoomFilterSchema(), limit=10, cursor='not-a-cursor')
+    assert mock_lobby_repository.get_rooms_page.await_count == 0
+
+
+async def test_cache_hit(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = RoomResponse(**dto_factories[RoomSchemaDTO].build().model_dump())
+    mock_lobby_cache.get_snapshot.return_value = {'items': [room.model_dump(mode='json')], 'next_cursor': None}
+    result = await fake_lobby_service.get_rooms_page(filters=RoomFilterSchema(), limit=10)
+
+    assert result.items == [room]
+    assert mock_lobby_repository.get_rooms_page.await_count == 0
+    assert mock_lobby_cache.set_snapshot.await_count == 0
+
+
+async def test_cache_miss_stores_snapshot(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_lobby_cache.get_version.return_value = 7
+    mock_lobby_repository.get_rooms_page.return_value = [dto_factories[RoomSchemaDTO].build()]
+    result = await fake_lobby_service.get_rooms_page(filters=RoomFilterSchema(), limit=10)
+
+    version, params, data = mock_lobby_cache.set_snapshot.await_args.args
+    assert version == 7
+    assert params == mock_lobby_cache.get_snapshot.await_args.args[1]
+    assert data == result.model_dump(mode='json')
+
+
+async def test_cache_unavailable(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+) -> None:
+    mock_lobby_cache.get_version.return_value = None
+    mock_lobby_repository.get_rooms_page.return_value = []
+    result = await fake_lobby_service.get_rooms_page(filters=RoomFilterSchema(), limit=10)
+
+    assert result.items == []
+    assert mock_lobby_cache.get_snapshot.await_count == 0
+    assert mock_lobby_cache.set_snapshot.await_count == 0
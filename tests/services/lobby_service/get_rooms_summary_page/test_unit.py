@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import RoomFilterDTO, RoomSummaryDTO
+from app.services.exceptions import InvalidCursorService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomFilterSchema, RoomSummaryResponse
+from app.transports.handlers.lobby.utils import decode_room_cursor
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobbies = [dto_factories[RoomSummaryDTO].build() for _ in range(3)]
+    mock_lobby_repository.get_rooms_summary_page.return_value = lobbies
+    result = await fake_lobby_service.get_rooms_summary_page(filters=RoomFilterSchema(is_private=False), limit=2)
+
+    assert result.items == [RoomSummaryResponse(**room.model_dump()) for room in lobbies[:2]]
+    assert decode_room_cursor(result.next_cursor).id == lobbies[1].id
+    mock_lobby_repository.get_rooms_summary_page.assert_awaited_once_with(
+        filters=RoomFilterDTO(is_private=False),
+        limit=3,
+        cursor=None,
+    )
+    assert mock_lobby_repository.get_rooms_page.await_count == 0
+
+
+async def test_invalid_cursor(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    with pytest.raises(InvalidCursorService):
+        await fake_lobby_service.get_rooms_summary_page(filters=RoomFilterSchema(), limit=10, cursor='???')
+    assert mock_lobby_repository.get_rooms_summary_page.await_count == 0
@@ -2,18 +2,18 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.integrations.postgres.dtos.lobby_dto import RoomSchemaDTO
-from app.integrations.postgres.dtos.user_dto import UserByIdDTO
-from app.integrations.postgres.exceptions import RoomNotFoundPostgres, UserNotFoundPostgres
+from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO, RoomJoinDTO, RoomSchemaDTO
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.integrations.redis.room_seats import SEAT_FULL, SEAT_UNKNOWN
 from app.services.exceptions import (
     BlackListService,
     NoSlotService,
+    PasswordRoomNotValidService,
     RoomNotFoundService,
     UserInRoomService,
     UserNotFoundService,
 )
 from app.services.lobby_service import LobbyService
-from app.transports.handlers.lobby.exceptions import PasswordRoomNotValidError
 from app.transports.handlers.lobby.schemas import JoinRoomSchema, RoomResponse
 from tests.conftest_utils import DTOFactoryDict
 
@@ -21,138 +21,210 @@ from tests.conftest_utils import DTOFactoryDict
 async def test_happy_path(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
-    lobby = dto_factories[RoomSchemaDTO].build()
-    mock_lobby_repository.get_one_room.return_value = lobby
-    mock_lobby_repository.black_list.return_value = False
+    lobby = dto_factories[RoomSchemaDTO].build(max_players=3, players=[{'id': 1, 'user_id': 10}])
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=False, banned_user_ids=[]
+    )
+    player = dto_factories[PlayerSchemaDTO].build(id=2, user_id=20, room_id=lobby.id)
+    mock_lobby_repository.add_player_to_room.return_value = player
+    mock_lobby_cache.invalidate.return_value = 11
     result = await fake_lobby_service.join_lobby(
-        join_data=JoinRoomSchema(password=lobby.password), user_id=user.id, room_id=lobby.id
+        join_data=JoinRoomSchema(password=lobby.password), user_id=20, room_id=lobby.id
     )
 
-    assert result == RoomResponse(**lobby.model_dump())
+    assert [joined.id for joined in result.players] == [1, 2]
+    mock_lobby_repository.lock_room_for_join.assert_awaited_once_with(room_id=lobby.id, user_id=20)
+    mock_lobby_repository.add_player_to_room.assert_awaited_once_with(room_id=lobby.id, user_id=20)
+    mock_lobby_repository.commit.assert_awaited_once()
+    delta = mock_redis.publish_ws_event.await_args.args[0]
+    assert delta['seq'] == 11
+    assert delta['type'] == 'player_joined'
+    assert delta['data']['player']['id'] == 2
+    assert delta['data']['player_count'] == 2
 
 
 async def test_user_not_found(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    mock_user_repository.get_one_by_id.side_effect = UserNotFoundPostgres
+    lobby = dto_factories[RoomSchemaDTO].build()
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=None, banned_user_ids=[]
+    )
     with pytest.raises(UserNotFoundService):
-        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=1, room_id=1)
+        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=1, room_id=lobby.id)
 
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
     assert mock_lobby_repository.user_in_room.await_count == 0
-    assert mock_lobby_repository.find_player.await_count == 0
-    assert mock_lobby_repository.get_one_room.await_count == 0
-    mock_user_repository.get_one_by_id.assert_awaited_once_with(1)
 
 
 async def test_user_in_room(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=True)
-    mock_user_repository.get_one_by_id.return_value = user
+    lobby = dto_factories[RoomSchemaDTO].build()
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=True, banned_user_ids=[]
+    )
     with pytest.raises(UserInRoomService):
-        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=user.id, room_id=1)
-    assert mock_lobby_repository.user_in_room.await_count == 0
+        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=1, room_id=lobby.id)
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
 
 
 async def test_room_not_found(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
-    dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
-    mock_lobby_repository.get_one_room.side_effect = RoomNotFoundPostgres
+    mock_lobby_repository.lock_room_for_join.side_effect = RoomNotFoundPostgres
     with pytest.raises(RoomNotFoundService):
-        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=user.id, room_id=1)
+        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=1, room_id=1)
 
-    assert mock_lobby_repository.user_in_room.await_count == 0
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
 
 
 async def test_no_slot(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
     lobby = dto_factories[RoomSchemaDTO].build(
         max_players=2,
-        players=[{'id': 1, 'name': 'Player1'}, {'id': 2, 'name': 'Player2'}, {'id': 3, 'name': 'Player3'}],
+        players=[{'id': 1, 'user_id': 10}, {'id': 2, 'user_id': 11}],
+    )
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=False, banned_user_ids=[]
     )
-    mock_lobby_repository.get_one_room.return_value = lobby
     with pytest.raises(NoSlotService):
         await fake_lobby_service.join_lobby(
-            join_data=JoinRoomSchema(password=lobby.password), user_id=user.id, room_id=lobby.id
+            join_data=JoinRoomSchema(password=lobby.password), user_id=20, room_id=lobby.id
         )
-    assert mock_lobby_repository.user_in_room.await_count == 0
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
 
 
-async def test_equals_slot(
+async def test_already_player(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
     lobby = dto_factories[RoomSchemaDTO].build(
         max_players=2,
-        players=[{'id': 1, 'name': 'Player1'}, {'id': 2, 'name': 'Player2'}],
+        players=[{'id': 1, 'user_id': 10}, {'id': 2, 'user_id': 20}],
+    )
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=False, banned_user_ids=[]
     )
-    mock_lobby_repository.get_one_room.return_value = lobby
-    mock_lobby_repository.black_list.return_value = False
     result = await fake_lobby_service.join_lobby(
-        join_data=JoinRoomSchema(password=lobby.password), user_id=user.id, room_id=lobby.id
+        join_data=JoinRoomSchema(password=lobby.password), user_id=20, room_id=lobby.id
     )
 
     assert result == RoomResponse(**lobby.model_dump())
-    assert mock_lobby_repository.user_in_room.await_count == 1
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
+    mock_lobby_repository.user_in_room.assert_awaited_once_with(user_id=20, in_room=True)
+    mock_room_seats.release.assert_awaited_once_with(lobby.id)
 
 
-async def test_password_room_not_valid_error(
+async def test_password_room_not_valid(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
-    lobby = dto_factories[RoomSchemaDTO].build(password='1254')
-    mock_lobby_repository.get_one_room.return_value = lobby
-    with pytest.raises(PasswordRoomNotValidError):
+    lobby = dto_factories[RoomSchemaDTO].build(password='1254', max_players=12, players=[])
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=False, banned_user_ids=[]
+    )
+    with pytest.raises(PasswordRoomNotValidService):
         await fake_lobby_service.join_lobby(
-            join_data=JoinRoomSchema(password='fjgkldfjgk'), user_id=user.id, room_id=lobby.id
+            join_data=JoinRoomSchema(password='fjgkldfjgk'), user_id=1, room_id=lobby.id
         )
 
-    assert mock_lobby_repository.user_in_room.await_count == 0
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
 
 
 async def test_black_list(
     fake_lobby_service: LobbyService,
     mock_lobby_repository: AsyncMock,
-    mock_user_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    user = dto_factories[UserByIdDTO].build(in_room=False)
-    mock_user_repository.get_one_by_id.return_value = user
-    lobby = dto_factories[RoomSchemaDTO].build()
-    mock_lobby_repository.get_one_room.return_value = lobby
-    mock_lobby_repository.black_list.return_value = True
+    lobby = dto_factories[RoomSchemaDTO].build(max_players=12, players=[])
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=False, banned_user_ids=[1]
+    )
     with pytest.raises(BlackListService):
         await fake_lobby_service.join_lobby(
-            join_data=JoinRoomSchema(password=lobby.password), user_id=user.id, room_id=lobby.id
+            join_data=JoinRoomSchema(password=lobby.password), user_id=1, room_id=lobby.id
         )
-    assert mock_lobby_repository.user_in_room.await_count == 0
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
+    mock_room_seats.release.assert_awaited_once_with(lobby.id)
+
+
+async def test_seats_full(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
+) -> None:
+    mock_room_seats.reserve.return_value = SEAT_FULL
+    with pytest.raises(NoSlotService):
+        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=1, room_id=1)
+
+    assert mock_lobby_repository.lock_room_for_join.await_count == 0
+    assert mock_room_seats.release.await_count == 0
+
+
+async def test_seats_unknown(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_room_seats.reserve.return_value = SEAT_UNKNOWN
+    lobby = dto_factories[RoomSchemaDTO].build(max_players=4, players=[{'id': 1, 'user_id': 10}])
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=False, banned_user_ids=[]
+    )
+    mock_lobby_repository.add_player_to_room.return_value = dto_factories[PlayerSchemaDTO].build(
+        id=2, user_id=20, room_id=lobby.id
+    )
+    await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=lobby.password), user_id=20, room_id=lobby.id)
+
+    mock_room_seats.init.assert_awaited_once_with(lobby.id, taken=2, max_players=4)
+    assert mock_room_seats.release.await_count == 0
+
+
+async def test_black_list_cached(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_bans: AsyncMock,
+    mock_room_seats: AsyncMock,
+) -> None:
+    mock_room_bans.is_banned.return_value = True
+    with pytest.raises(BlackListService):
+        await fake_lobby_service.join_lobby(join_data=JoinRoomSchema(password=None), user_id=1, room_id=1)
+
+    assert mock_lobby_repository.lock_room_for_join.await_count == 0
+    assert mock_room_seats.reserve.await_count == 0
+
+
+async def test_black_list_loaded(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_bans: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_room_bans.is_banned.return_value = None
+    lobby = dto_factories[RoomSchemaDTO].build(max_players=12, players=[])
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=lobby, user_in_room=False, banned_user_ids=[1, 2]
+    )
+    with pytest.raises(BlackListService):
+        await fake_lobby_service.join_lobby(
+            join_data=JoinRoomSchema(password=lobby.password), user_id=1, room_id=lobby.id
+        )
+    mock_room_bans.load.assert_awaited_once_with(lobby.id, [1, 2])
@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO, RoomSchemaDTO
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.services.exceptions import NotRoomHostService, RoomNotFoundService
+from app.services.lobby_service import LobbyService
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_bans: AsyncMock,
+    mock_room_seats: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(
+        players=[{'id': 1, 'user_id': 10, 'is_host': True}, {'id': 2, 'user_id': 20, 'is_host': False}],
+    )
+    mock_lobby_repository.get_one_room.return_value = lobby
+    mock_lobby_repository.kick_and_ban.return_value = dto_factories[PlayerSchemaDTO].build(id=2, user_id=20)
+    await fake_lobby_service.kick_player(room_id=lobby.id, host_user_id=10, user_id=20)
+
+    mock_lobby_repository.kick_and_ban.assert_awaited_once_with(user_id=20, room_id=lobby.id)
+    mock_room_seats.release.assert_awaited_once_with(lobby.id)
+    mock_room_bans.add.assert_awaited_once_with(lobby.id, 20)
+    delta = mock_redis.publish_ws_event.await_args.args[0]
+    assert delta['type'] == 'player_left'
+    assert delta['data'] == {'player_id': 2, 'player_count': 1}
+    mock_lobby_cache.invalidate.assert_awaited_once()
+
+
+async def test_user_not_in_room(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_bans: AsyncMock,
+    mock_room_seats: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(players=[{'id': 1, 'user_id': 10, 'is_host': True}])
+    mock_lobby_repository.get_one_room.return_value = lobby
+    mock_lobby_repository.kick_and_ban.return_value = None
+    await fake_lobby_service.kick_player(room_id=lobby.id, host_user_id=10, user_id=20)
+
+    mock_room_bans.add.assert_awaited_once_with(lobby.id, 20)
+    assert mock_room_seats.release.await_count == 0
+    assert mock_redis.publish_ws_event.await_count == 0
+
+
+async def test_not_host(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(
+        players=[{'id': 1, 'user_id': 10, 'is_host': False}, {'id': 2, 'user_id': 20, 'is_host': True}],
+    )
+    mock_lobby_repository.get_one_room.return_value = lobby
+    with pytest.raises(NotRoomHostService):
+        await fake_lobby_service.kick_player(room_id=lobby.id, host_user_id=10, user_id=20)
+    assert mock_lobby_repository.kick_and_ban.await_count == 0
+
+
+async def test_room_not_found(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.get_one_room.side_effect = RoomNotFoundPostgres
+    with pytest.raises(RoomNotFoundService):
+        await fake_lobby_service.kick_player(room_id=1, host_user_id=10, user_id=20)
+    assert mock_lobby_repository.kick_and_ban.await_count == 0
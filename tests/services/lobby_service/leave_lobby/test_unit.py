@@ -0,0 +1,86 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSchemaDTO
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.services.exceptions import PlayerNotInRoomService, RoomNotFoundService
+from app.services.lobby_service import LobbyService
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(
+        players=[{'id': 1, 'user_id': 10, 'is_host': False}, {'id': 2, 'user_id': 20, 'is_host': True}],
+    )
+    mock_lobby_repository.get_one_room.return_value = lobby
+    await fake_lobby_service.leave_lobby(room_id=lobby.id, user_id=10)
+
+    mock_lobby_repository.delete_player.assert_awaited_once_with(user_id=10)
+    mock_lobby_repository.user_in_room.assert_awaited_once_with(user_id=10, in_room=False)
+    assert mock_lobby_repository.change_host.await_count == 0
+    delta = mock_redis.publish_ws_event.await_args.args[0]
+    assert delta['type'] == 'player_left'
+    assert delta['data'] == {'player_id': 1, 'player_count': 1}
+    mock_lobby_repository.commit.assert_awaited_once()
+    mock_lobby_cache.invalidate.assert_awaited_once()
+
+
+async def test_host_left(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(
+        players=[{'id': 1, 'user_id': 10, 'is_host': True}, {'id': 2, 'user_id': 20, 'is_host': False}],
+    )
+    mock_lobby_repository.get_one_room.return_value = lobby
+    await fake_lobby_service.leave_lobby(room_id=lobby.id, user_id=10)
+
+    mock_lobby_repository.change_host.assert_awaited_once_with(player_id=2, is_host=True)
+    deltas = [call.args[0] for call in mock_redis.publish_ws_event.await_args_list]
+    assert [delta['type'] for delta in deltas] == ['player_left', 'host_changed']
+    assert deltas[1]['data']['player_id'] == 2
+
+
+async def test_last_player_left(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(players=[{'id': 1, 'user_id': 10, 'is_host': True}])
+    mock_lobby_repository.get_one_room.return_value = lobby
+    await fake_lobby_service.leave_lobby(room_id=lobby.id, user_id=10)
+
+    mock_lobby_repository.delete_room.assert_awaited_once_with(room_id=lobby.id)
+    assert mock_redis.publish_ws_event.await_args.args[0]['type'] == 'room_removed'
+
+
+async def test_room_not_found(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.get_one_room.side_effect = RoomNotFoundPostgres
+    with pytest.raises(RoomNotFoundService):
+        await fake_lobby_service.leave_lobby(room_id=1, user_id=10)
+    assert mock_lobby_repository.delete_player.await_count == 0
+
+
+async def test_player_not_in_room(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(players=[{'id': 1, 'user_id': 20}])
+    mock_lobby_repository.get_one_room.return_value = lobby
+    with pytest.raises(PlayerNotInRoomService):
+        await fake_lobby_service.leave_lobby(room_id=lobby.id, user_id=10)
+    assert mock_lobby_repository.delete_player.await_count == 0
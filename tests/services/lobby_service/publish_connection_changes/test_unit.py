@@ -0,0 +1,32 @@
+from unittest.mock import AsyncMock
+
+from app.services.lobby_service import LobbyService
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+) -> None:
+    await fake_lobby_service.publish_connection_changes(disconnected=[(5, 10), (6, 20)], reconnected=[(5, 30)])
+
+    mock_lobby_repository.commit.assert_awaited_once()
+    assert mock_lobby_cache.invalidate.await_count == 3
+    deltas = [call.args[0] for call in mock_redis.publish_ws_event.await_args_list]
+    assert [(delta['type'], delta['room_id'], delta['data']) for delta in deltas] == [
+        ('player_disconnected', 5, {'user_id': 10, 'is_disconnect': True}),
+        ('player_disconnected', 6, {'user_id': 20, 'is_disconnect': True}),
+        ('player_reconnected', 5, {'user_id': 30, 'is_disconnect': False}),
+    ]
+
+
+async def test_no_changes(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+) -> None:
+    await fake_lobby_service.publish_connection_changes(disconnected=[], reconnected=[])
+
+    mock_lobby_repository.commit.assert_awaited_once()
+    mock_lobby_cache.invalidate.assert_not_awaited()
@@ -0,0 +1,26 @@
+from unittest.mock import AsyncMock
+
+from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO
+from app.services.lobby_service import LobbyService
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    players = [
+        dto_factories[PlayerSchemaDTO].build(id=1, user_id=10, room_id=5, avatar='/media/avatar/new_200.webp'),
+        dto_factories[PlayerSchemaDTO].build(id=2, user_id=10, room_id=6, avatar='/media/avatar/new_200.webp'),
+    ]
+
+    await fake_lobby_service.publish_players_updated(players)
+
+    mock_lobby_repository.commit.assert_awaited_once()
+    assert mock_lobby_cache.invalidate.await_count == 2
+    deltas = [call.args[0] for call in mock_redis.publish_ws_event.await_args_list]
+    assert [(delta['type'], delta['room_id']) for delta in deltas] == [('player_updated', 5), ('player_updated', 6)]
+    assert deltas[0]['data']['player']['avatar'] == '/media/avatar/new_200.webp'
@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock, call
+
+from app.services.lobby_service import LobbyService
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    mock_room_seats: AsyncMock,
+    mock_room_bans: AsyncMock,
+) -> None:
+    mock_lobby_cache.invalidate.side_effect = [1, 2, 3]
+    mock_lobby_repository.delete_idle_rooms.side_effect = [[1, 2], [3]]
+
+    assert await fake_lobby_service.purge_idle_rooms(idle_seconds=60, batch_size=2) == 3
+
+    assert mock_lobby_repository.delete_idle_rooms.await_args_list == [
+        call(idle_seconds=60, limit=2),
+        call(idle_seconds=60, limit=2),
+    ]
+    assert mock_lobby_repository.commit.await_count == 2
+    deltas = [args.args[0] for args in mock_redis.publish_ws_event.await_args_list]
+    assert [(delta['seq'], delta['type'], delta['room_id']) for delta in deltas] == [
+        (1, 'room_removed', 1),
+        (2, 'room_removed', 2),
+        (3, 'room_removed', 3),
+    ]
+    assert mock_room_seats.drop.await_args_list == [call(1), call(2), call(3)]
+    assert mock_room_bans.drop.await_args_list == [call(1), call(2), call(3)]
+
+
+async def test_full_batches(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.delete_idle_rooms.side_effect = [[1, 2], []]
+
+    assert await fake_lobby_service.purge_idle_rooms(idle_seconds=60, batch_size=2) == 2
+    assert mock_lobby_repository.delete_idle_rooms.await_count == 2
+
+
+async def test_nothing_to_purge(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_redis: AsyncMock,
+) -> None:
+    mock_lobby_repository.delete_idle_rooms.return_value = []
+
+    assert await fake_lobby_service.purge_idle_rooms(idle_seconds=60, batch_size=100) == 0
+    assert mock_lobby_repository.commit.await_count == 0
+    assert mock_redis.publish_ws_event.await_count == 0
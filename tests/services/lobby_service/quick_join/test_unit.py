@@ -0,0 +1,113 @@
+from unittest.mock import AsyncMock, call
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO, RoomJoinDTO, RoomSchemaDTO
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.services.exceptions import NoRoomForQuickJoinService, UserInRoomService
+from app.services.lobby_service import LobbyService
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = dto_factories[RoomSchemaDTO].build(
+        id=7, max_players=4, password=None, is_private=False, started=False, players=[{'id': 1, 'user_id': 10}]
+    )
+    mock_room_matchmaking.candidates.return_value = [7]
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=room, user_in_room=False, banned_user_ids=[]
+    )
+    mock_lobby_repository.add_player_to_room.return_value = dto_factories[PlayerSchemaDTO].build(
+        id=2, user_id=20, room_id=7
+    )
+
+    result = await fake_lobby_service.quick_join(user_id=20, game_name='Мафия')
+
+    assert result.id == 7
+    mock_room_matchmaking.candidates.assert_awaited_once_with('Мафия', limit=5)
+    mock_room_matchmaking.update.assert_awaited_once_with(7, free_slots=2, game_name=room.game_name, is_open=True)
+
+
+async def test_skips_unavailable_rooms(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    full_room = dto_factories[RoomSchemaDTO].build(
+        id=8, max_players=3, password=None, players=[{'id': i, 'user_id': i * 10} for i in range(1, 4)]
+    )
+    mock_room_matchmaking.candidates.return_value = [7, 8]
+    mock_lobby_repository.lock_room_for_join.side_effect = [
+        RoomNotFoundPostgres,
+        RoomJoinDTO(room=full_room, user_in_room=False, banned_user_ids=[]),
+    ]
+
+    with pytest.raises(NoRoomForQuickJoinService):
+        await fake_lobby_service.quick_join(user_id=50, game_name=None)
+
+    assert mock_room_matchmaking.remove.await_args_list == [call(7)]
+    assert mock_lobby_repository.add_player_to_room.await_count == 0
+    mock_lobby_repository.rollback.assert_awaited_once()
+
+
+async def test_releases_lock_before_next_room(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    full_room = dto_factories[RoomSchemaDTO].build(
+        id=7, max_players=2, password=None, players=[{'id': i, 'user_id': i * 10} for i in range(1, 3)]
+    )
+    open_room = dto_factories[RoomSchemaDTO].build(id=8, max_players=4, password=None, players=[])
+    mock_room_matchmaking.candidates.return_value = [7, 8]
+    calls: list[tuple] = []
+
+    def lock_room_for_join(room_id: int, user_id: int) -> RoomJoinDTO:
+        calls.append(('lock', room_id))
+        return RoomJoinDTO(room=full_room if room_id == 7 else open_room, user_in_room=False, banned_user_ids=[])
+
+    def rollback() -> None:
+        calls.append(('rollback',))
+
+    mock_lobby_repository.lock_room_for_join.side_effect = lock_room_for_join
+    mock_lobby_repository.rollback.side_effect = rollback
+    mock_lobby_repository.add_player_to_room.return_value = dto_factories[PlayerSchemaDTO].build(
+        id=3, user_id=50, room_id=8
+    )
+
+    result = await fake_lobby_service.quick_join(user_id=50, game_name=None)
+
+    assert result.id == 8
+    assert calls == [('lock', 7), ('rollback',), ('lock', 8)]
+
+
+async def test_no_candidates(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    with pytest.raises(NoRoomForQuickJoinService):
+        await fake_lobby_service.quick_join(user_id=50, game_name=None)
+    assert mock_lobby_repository.lock_room_for_join.await_count == 0
+
+
+async def test_user_in_room(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_room_matchmaking.candidates.return_value = [7, 8]
+    mock_lobby_repository.lock_room_for_join.return_value = RoomJoinDTO(
+        room=dto_factories[RoomSchemaDTO].build(id=7, players=[]), user_in_room=True, banned_user_ids=[]
+    )
+
+    with pytest.raises(UserInRoomService):
+        await fake_lobby_service.quick_join(user_id=50, game_name=None)
+    assert mock_lobby_repository.lock_room_for_join.await_count == 1
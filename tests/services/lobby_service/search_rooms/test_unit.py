@@ -0,0 +1,33 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSummaryDTO
+from app.integrations.postgres.exceptions import SearchTimeoutPostgres
+from app.services.exceptions import SearchTimeoutService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomSummaryResponse
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    rooms = dto_factories[RoomSummaryDTO].batch(2)
+    mock_lobby_repository.search_rooms.return_value = rooms
+
+    result = await fake_lobby_service.search_rooms(query='  мафия ', limit=10)
+
+    assert result == [RoomSummaryResponse(**room.model_dump()) for room in rooms]
+    mock_lobby_repository.search_rooms.assert_awaited_once_with(query='мафия', limit=10, timeout_ms=500)
+
+
+async def test_timeout(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.search_rooms.side_effect = SearchTimeoutPostgres
+    with pytest.raises(SearchTimeoutService):
+        await fake_lobby_service.search_rooms(query='мафия', limit=10)
@@ -0,0 +1,71 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSchemaDTO
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.services.exceptions import NotRoomHostService, RoomNotFoundService
+from app.services.lobby_service import LobbyService
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(started=False, players=[{'id': 1, 'user_id': 10, 'is_host': True}])
+    mock_lobby_repository.get_one_room.return_value = lobby
+
+    await fake_lobby_service.start_game(room_id=lobby.id, host_user_id=10)
+
+    mock_lobby_repository.game_started.assert_awaited_once_with(room_id=lobby.id, started=True)
+    mock_lobby_cache.invalidate.assert_awaited_once()
+    mock_room_matchmaking.remove.assert_awaited_once_with(lobby.id)
+    delta = mock_redis.publish_ws_event.await_args.args[0]
+    assert delta['type'] == 'started'
+    assert delta['data'] == {'started': True}
+
+
+async def test_already_started(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(started=True, players=[{'id': 1, 'user_id': 10, 'is_host': True}])
+    mock_lobby_repository.get_one_room.return_value = lobby
+
+    await fake_lobby_service.start_game(room_id=lobby.id, host_user_id=10)
+
+    assert mock_lobby_repository.game_started.await_count == 0
+    assert mock_redis.publish_ws_event.await_count == 0
+
+
+async def test_not_host(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    lobby = dto_factories[RoomSchemaDTO].build(
+        started=False,
+        players=[{'id': 1, 'user_id': 10, 'is_host': True}, {'id': 2, 'user_id': 20, 'is_host': False}],
+    )
+    mock_lobby_repository.get_one_room.return_value = lobby
+
+    with pytest.raises(NotRoomHostService):
+        await fake_lobby_service.start_game(room_id=lobby.id, host_user_id=20)
+    assert mock_lobby_repository.game_started.await_count == 0
+
+
+async def test_room_not_found(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.get_one_room.side_effect = RoomNotFoundPostgres
+
+    with pytest.raises(RoomNotFoundService):
+        await fake_lobby_service.start_game(room_id=1, host_user_id=10)
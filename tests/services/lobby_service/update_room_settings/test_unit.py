@@ -0,0 +1,117 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSchemaDTO, RoomSettingsDTO
+from app.integrations.postgres.exceptions import RoomNotFoundPostgres
+from app.services.exceptions import MaxPlayersBelowCountService, NotRoomHostService, RoomNotFoundService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomSummaryResponse, RoomUpdateSchema
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
+    mock_lobby_cache: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = dto_factories[RoomSettingsDTO].build(
+        max_players=6, player_count=2, is_private=False, started=False, password=None, game_name='Мафия'
+    )
+    mock_lobby_repository.update_room_settings.return_value = room
+    settings = RoomUpdateSchema(max_players=6, game_name='Мафия')
+
+    result = await fake_lobby_service.update_room_settings(room_id=room.id, host_user_id=10, settings=settings)
+
+    assert result == RoomSummaryResponse(**room.model_dump(exclude={'password'}))
+    mock_lobby_repository.update_room_settings.assert_awaited_once_with(
+        room_id=room.id, host_user_id=10, settings=settings
+    )
+    assert mock_lobby_repository.get_one_room.await_count == 0
+    mock_room_seats.resize.assert_awaited_once_with(room.id, max_players=6)
+    assert mock_redis.publish_ws_event.await_count == 1
+    delta = mock_redis.publish_ws_event.await_args.args[0]
+    assert delta['type'] == 'room_updated'
+    assert delta['data']['room']['max_players'] == 6
+    assert 'password' not in delta['data']['room']
+    mock_lobby_cache.invalidate.assert_awaited_once()
+    mock_room_matchmaking.update.assert_awaited_once_with(room.id, free_slots=4, game_name='Мафия', is_open=True)
+
+
+async def test_password_closes_room_for_quick_join(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_matchmaking: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = dto_factories[RoomSettingsDTO].build(is_private=False, started=False, password='secret')
+    mock_lobby_repository.update_room_settings.return_value = room
+
+    await fake_lobby_service.update_room_settings(
+        room_id=room.id, host_user_id=10, settings=RoomUpdateSchema(is_private=False)
+    )
+
+    assert mock_room_matchmaking.update.await_args.kwargs['is_open'] is False
+
+
+async def test_seats_untouched_without_max_players(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_lobby_repository.update_room_settings.return_value = dto_factories[RoomSettingsDTO].build()
+    await fake_lobby_service.update_room_settings(
+        room_id=1, host_user_id=10, settings=RoomUpdateSchema(is_private=False)
+    )
+    assert mock_room_seats.resize.await_count == 0
+
+
+async def test_room_not_found(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.update_room_settings.return_value = None
+    mock_lobby_repository.get_one_room.side_effect = RoomNotFoundPostgres
+    with pytest.raises(RoomNotFoundService):
+        await fake_lobby_service.update_room_settings(
+            room_id=1, host_user_id=10, settings=RoomUpdateSchema(is_private=True)
+        )
+
+
+async def test_not_host(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_redis: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_lobby_repository.update_room_settings.return_value = None
+    mock_lobby_repository.get_one_room.return_value = dto_factories[RoomSchemaDTO].build(
+        players=[{'id': 1, 'user_id': 10, 'is_host': False}, {'id': 2, 'user_id': 20, 'is_host': True}],
+    )
+    with pytest.raises(NotRoomHostService):
+        await fake_lobby_service.update_room_settings(
+            room_id=1, host_user_id=10, settings=RoomUpdateSchema(is_private=True)
+        )
+    assert mock_redis.publish_ws_event.await_count == 0
+
+
+async def test_max_players_below_count(
+    fake_lobby_service: LobbyService,
+    mock_lobby_repository: AsyncMock,
+    mock_room_seats: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_lobby_repository.update_room_settings.return_value = None
+    mock_lobby_repository.get_one_room.return_value = dto_factories[RoomSchemaDTO].build(
+        players=[{'id': i, 'user_id': i * 10, 'is_host': i == 1} for i in range(1, 6)],
+    )
+    with pytest.raises(MaxPlayersBelowCountService):
+        await fake_lobby_service.update_room_settings(
+            room_id=1, host_user_id=10, settings=RoomUpdateSchema(max_players=3)
+        )
+    assert mock_room_seats.resize.await_count == 0
@@ -2,13 +2,20 @@ from io import BytesIO
 import os
 import shutil
 from typing import Callable
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from PIL import Image
+from fastapi import BackgroundTasks, UploadFile
 import pytest
+from starlette.datastructures import Headers
 
 from app.integrations.postgres.repositories.user_repository import UserRepository
+from app.integrations.redis.profile_cache import ProfileCache
+from app.integrations.redis.token_revocations import TokenRevocations
+from app.services.lobby_service import LobbyService
 from app.services.user_service import UserService
+from app.utils.avatar_processor import AvatarProcessor
+from app.utils.password_hasher import BCRYPT_MIN_ROUNDS, PasswordHasher, pwd_context
 
 
 @pytest.fixture
@@ -16,25 +23,70 @@ def mock_user_repository() -> AsyncMock:
     return AsyncMock(spec=UserRepository)
 
 
+@pytest.fixture
+def mock_profile_cache() -> AsyncMock:
+    profile_cache = AsyncMock(spec=ProfileCache)
+    profile_cache.get_version.return_value = 1
+    profile_cache.get_profile.return_value = None
+    return profile_cache
+
+
+@pytest.fixture
+def mock_token_revocations() -> AsyncMock:
+    return AsyncMock(spec=TokenRevocations)
+
+
+@pytest.fixture
+def mock_lobby_service() -> AsyncMock:
+    return AsyncMock(spec=LobbyService)
+
+
+@pytest.fixture
+def fake_background_tasks() -> BackgroundTasks:
+    return BackgroundTasks()
+
+
+@pytest.fixture(scope='session')
+def avatar_processor() -> AvatarProcessor:
+    avatar_processor = AvatarProcessor(max_workers=1)
+    yield avatar_processor
+    avatar_processor.shutdown()
+
+
 @pytest.fixture
 def fake_user_service(
     mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
+    fake_background_tasks: BackgroundTasks,
+    mock_token_revocations: AsyncMock,
+    avatar_processor: AvatarProcessor,
+    mock_lobby_service: AsyncMock,
 ) -> UserService:
-    return UserService(user_repository=mock_user_repository)
+    return UserService(
+        user_repository=mock_user_repository,
+        profile_cache=mock_profile_cache,
+        password_hasher=PasswordHasher(max_workers=1),
+        postgres_engine=MagicMock(),
+        background_tasks=fake_background_tasks,
+        token_revocations=mock_token_revocations,
+        avatar_processor=avatar_processor,
+        lobby_service=mock_lobby_service,
+    )
 
 
 @pytest.fixture
-def create_mock_image() -> Callable[[str, str], AsyncMock]:
-    def _create_mock_image(filename: str, format_: str = 'png') -> AsyncMock:
-        img = Image.new('RGB', (200, 200), color='red')
+def create_mock_image() -> Callable[..., UploadFile]:
+    def _create_mock_image(filename: str, format_: str = 'png', size: tuple[int, int] = (200, 200)) -> UploadFile:
+        img = Image.new('RGB', size, color='red')
         img_byte_arr = BytesIO()
         img.save(img_byte_arr, format=format_)
         img_byte_arr.seek(0)
-        mock_file = AsyncMock()
-        mock_file.read = AsyncMock(return_value=img_byte_arr.getvalue())
-        mock_file.content_type = f'image/{format_}'
-        mock_file.filename = filename
-        return mock_file
+        return UploadFile(
+            img_byte_arr,
+            filename=filename,
+            size=len(img_byte_arr.getvalue()),
+            headers=Headers({'content-type': f'image/{format_}'}),
+        )
 
     return _create_mock_image
 
@@ -45,3 +97,12 @@ def setup_directory() -> None:
     os.makedirs(temp_dir, exist_ok=True)
     yield
     shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def password_rounds() -> None:
+    # Стоимость bcrypt выставляется на весь процесс, поэтому каждый тест начинает с одной и той же
+    saved_context = pwd_context.to_string()
+    PasswordHasher.set_rounds(BCRYPT_MIN_ROUNDS)
+    yield
+    pwd_context.load(saved_context)
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.integrations.postgres.dtos.user_dto import PlayerStatisticDTO, UserAchievementsDTO, UserDetailDTO
+from app.integrations.postgres.dtos.user_dto import PlayerStatisticDTO, UserAchievementsDTO, UserProfileDTO
 from app.integrations.postgres.exceptions import UserNotFoundPostgres
 from app.services.exceptions import UserNotFoundService
 from app.services.user_service import UserService
@@ -15,15 +15,17 @@ async def test_happy_path(
     mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    expected_user = dto_factories[UserDetailDTO].build()
     expected_statistics = [dto_factories[PlayerStatisticDTO].build()]
     expected_achievements = [dto_factories[UserAchievementsDTO].build()]
-    mock_user_repository.get_one_with_rank.return_value = expected_user
-    mock_user_repository.get_user_statistics.return_value = expected_statistics
-    mock_user_repository.get_user_achievements.return_value = expected_achievements
+    expected_user = dto_factories[UserProfileDTO].build(
+        statistics=expected_statistics,
+        achievements=expected_achievements,
+    )
+    mock_user_repository.get_profile.return_value = expected_user
     result = await fake_user_service.get_current_user(user_id=1)
+    assert mock_user_repository.get_profile.await_count == 1
     assert result == UserResponse(
-        **expected_user.model_dump(),
+        **expected_user.model_dump(exclude={'statistics', 'achievements'}),
         statistics=[PlayerStatisticResponse(**statistic.model_dump()) for statistic in expected_statistics],
         achievements=[UserAchievementsResponse(**achievement.model_dump()) for achievement in expected_achievements],
     )
@@ -33,44 +35,33 @@ async def test_nonexistent_user(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
 ) -> None:
-    mock_user_repository.get_one_with_rank.side_effect = UserNotFoundPostgres
+    mock_user_repository.get_profile.side_effect = UserNotFoundPostgres
     with pytest.raises(UserNotFoundService):
         await fake_user_service.get_current_user(user_id=1)
 
 
-async def test_empty_statistics(
+async def test_empty_statistics_and_achievements(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    expected_user = dto_factories[UserDetailDTO].build()
-    expected_statistics = []
-    expected_achievements = [dto_factories[UserAchievementsDTO].build()]
-    mock_user_repository.get_one_with_rank.return_value = expected_user
-    mock_user_repository.get_user_statistics.return_value = expected_statistics
-    mock_user_repository.get_user_achievements.return_value = expected_achievements
+    expected_user = dto_factories[UserProfileDTO].build(statistics=[], achievements=[])
+    mock_user_repository.get_profile.return_value = expected_user
     result = await fake_user_service.get_current_user(user_id=1)
     assert result == UserResponse(
-        **expected_user.model_dump(),
+        **expected_user.model_dump(exclude={'statistics', 'achievements'}),
         statistics=[],
-        achievements=[UserAchievementsResponse(**achievement.model_dump()) for achievement in expected_achievements],
+        achievements=[],
     )
 
 
-async def test_empty_achievements(
+async def test_not_cached(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    expected_user = dto_factories[UserDetailDTO].build()
-    expected_statistics = [dto_factories[PlayerStatisticDTO].build()]
-    expected_achievements = []
-    mock_user_repository.get_one_with_rank.return_value = expected_user
-    mock_user_repository.get_user_statistics.return_value = expected_statistics
-    mock_user_repository.get_user_achievements.return_value = expected_achievements
-    result = await fake_user_service.get_current_user(user_id=1)
-    assert result == UserResponse(
-        **expected_user.model_dump(),
-        statistics=[PlayerStatisticResponse(**statistic.model_dump()) for statistic in expected_statistics],
-        achievements=[],
-    )
+    mock_user_repository.get_profile.return_value = dto_factories[UserProfileDTO].build()
+    await fake_user_service.get_current_user(user_id=1)
+    mock_profile_cache.get_profile.assert_not_awaited()
+    mock_profile_cache.set_profile.assert_not_awaited()
@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.integrations.postgres.dtos.user_dto import UserAchievementsDTO, UserPublicDTO
+from app.integrations.postgres.dtos.user_dto import UserAchievementsDTO, UserProfileDTO
 from app.integrations.postgres.exceptions import UserNotFoundPostgres
 from app.services.exceptions import UserNotFoundService
 from app.services.user_service import UserService
@@ -13,26 +13,34 @@ from tests.conftest_utils import DTOFactoryDict
 async def test_happy_path(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    expected_user = dto_factories[UserPublicDTO].build()
     expected_achievements = [dto_factories[UserAchievementsDTO].build()]
-    mock_user_repository.get_one_with_rank_public.return_value = expected_user
-    mock_user_repository.get_user_achievements.return_value = expected_achievements
+    expected_user = dto_factories[UserProfileDTO].build(achievements=expected_achievements)
+    mock_user_repository.get_profile.return_value = expected_user
     result = await fake_user_service.get_user(user_id=1)
-    assert result == UserPublicResponse(
-        **expected_user.model_dump(),
+    expected_response = UserPublicResponse(
+        username=expected_user.username,
+        avatar=expected_user.avatar,
+        rank=expected_user.rank.model_dump() if expected_user.rank else None,
+        date_joined=expected_user.date_joined,
+        nickname_color=expected_user.nickname_color,
         achievements=[UserAchievementsResponse(**achievement.model_dump()) for achievement in expected_achievements],
     )
+    assert result == expected_response
+    mock_profile_cache.set_profile.assert_awaited_once_with(1, 1, expected_response.model_dump(mode='json'))
 
 
 async def test_nonexistent_user(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
 ) -> None:
-    mock_user_repository.get_one_with_rank_public.side_effect = UserNotFoundPostgres
+    mock_user_repository.get_profile.side_effect = UserNotFoundPostgres
     with pytest.raises(UserNotFoundService):
         await fake_user_service.get_user(user_id=1)
+    mock_profile_cache.set_profile.assert_not_awaited()
 
 
 async def test_empty_achievements(
@@ -40,9 +48,39 @@ async def test_empty_achievements(
     mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    expected_user = dto_factories[UserPublicDTO].build()
-    mock_user_repository.get_one_with_rank_public.return_value = expected_user
-    mock_user_repository.get_user_achievements.return_value = []
+    expected_user = dto_factories[UserProfileDTO].build(achievements=[])
+    mock_user_repository.get_profile.return_value = expected_user
     result = await fake_user_service.get_user(user_id=1)
-    assert mock_user_repository.get_user_achievements.await_count == 1
-    assert result == UserPublicResponse(**expected_user.model_dump(), achievements=[])
+    assert mock_user_repository.get_profile.await_count == 1
+    assert result.achievements == []
+
+
+async def test_cached_profile(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    expected_user = dto_factories[UserProfileDTO].build()
+    cached = UserPublicResponse.model_validate(expected_user)
+    mock_profile_cache.get_profile.return_value = cached.model_dump(mode='json')
+    result = await fake_user_service.get_user(user_id=1)
+    assert result == cached
+    mock_profile_cache.get_profile.assert_awaited_once_with(1, 1)
+    mock_user_repository.get_profile.assert_not_awaited()
+    mock_profile_cache.set_profile.assert_not_awaited()
+
+
+async def test_redis_unavailable(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_profile_cache.get_version.return_value = None
+    expected_user = dto_factories[UserProfileDTO].build()
+    mock_user_repository.get_profile.return_value = expected_user
+    result = await fake_user_service.get_user(user_id=1)
+    assert result == UserPublicResponse.model_validate(expected_user)
+    mock_profile_cache.get_profile.assert_not_awaited()
+    mock_profile_cache.set_profile.assert_not_awaited()
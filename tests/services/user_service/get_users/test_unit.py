@@ -0,0 +1,59 @@
+from unittest.mock import AsyncMock
+
+from app.integrations.postgres.dtos.user_dto import UserPublicProfileDTO
+from app.services.user_service import UserService
+from app.transports.handlers.users.schemas import UserPublicBatchResponse, UserPublicResponse
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_loads_missing_profiles(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    cached_profile = UserPublicResponse.model_validate(dto_factories[UserPublicProfileDTO].build())
+    loaded_profile = dto_factories[UserPublicProfileDTO].build(id=2)
+    mock_profile_cache.get_versions.return_value = {1: 10, 2: 20, 3: 30}
+    mock_profile_cache.get_profiles.return_value = {1: cached_profile.model_dump(mode='json')}
+    mock_user_repository.get_public_profiles.return_value = [loaded_profile]
+    result = await fake_user_service.get_users(user_ids=[2, 1, 3, 2])
+    mock_user_repository.get_public_profiles.assert_awaited_once_with(user_ids=[2, 3])
+    loaded_response = UserPublicResponse.model_validate(loaded_profile)
+    mock_profile_cache.set_profiles.assert_awaited_once_with(
+        {1: 10, 2: 20, 3: 30},
+        {2: loaded_response.model_dump(mode='json')},
+    )
+    assert result == [
+        UserPublicBatchResponse(**loaded_response.model_dump(), id=2),
+        UserPublicBatchResponse(**cached_profile.model_dump(), id=1),
+    ]
+
+
+async def test_all_cached(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    profile = UserPublicResponse.model_validate(dto_factories[UserPublicProfileDTO].build())
+    mock_profile_cache.get_versions.return_value = {1: 10}
+    mock_profile_cache.get_profiles.return_value = {1: profile.model_dump(mode='json')}
+    result = await fake_user_service.get_users(user_ids=[1])
+    assert result == [UserPublicBatchResponse(**profile.model_dump(), id=1)]
+    mock_user_repository.get_public_profiles.assert_not_awaited()
+    mock_profile_cache.set_profiles.assert_not_awaited()
+
+
+async def test_redis_unavailable(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    mock_profile_cache: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    profiles = [dto_factories[UserPublicProfileDTO].build(id=user_id) for user_id in (1, 2)]
+    mock_profile_cache.get_versions.return_value = {}
+    mock_user_repository.get_public_profiles.return_value = profiles
+    result = await fake_user_service.get_users(user_ids=[1, 2])
+    mock_profile_cache.get_profiles.assert_not_awaited()
+    assert [user.id for user in result] == [1, 2]
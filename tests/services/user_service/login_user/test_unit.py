@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock
+
+from fastapi import BackgroundTasks
+import pytest
+
+from app.integrations.postgres.dtos.user_dto import UserByEmailDTO
+from app.services.background_jobs import rehash_password
+from app.services.exceptions import InvalidPasswordService, MissCredentialsService
+from app.services.user_service import UserService
+from app.transports.handlers.users.schemas import LoginRequest
+from app.utils.password_hasher import PasswordHasher, pwd_context
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_user_repository.get_one_by_email.return_value = dto_factories[UserByEmailDTO].build(
+        hash_password=pwd_context.hash('Stringst1'),
+        status=True,
+        is_active=True,
+    )
+    result = await fake_user_service.login_user(LoginRequest(email='user@example.com', password='Stringst1'))
+    assert result.access
+    assert result.refresh
+
+
+async def test_invalid_password(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_user_repository.get_one_by_email.return_value = dto_factories[UserByEmailDTO].build(
+        hash_password=pwd_context.hash('Stringst1'),
+    )
+    with pytest.raises(InvalidPasswordService):
+        await fake_user_service.login_user(LoginRequest(email='user@example.com', password='Stringst2'))
+
+
+async def test_miss_credentials(
+    fake_user_service: UserService,
+) -> None:
+    with pytest.raises(MissCredentialsService):
+        await fake_user_service.login_user(LoginRequest(email='user@example.com', password=''))
+
+
+async def test_rehash_outdated_hash(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    fake_background_tasks: BackgroundTasks,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    outdated_hash_password = pwd_context.handler('bcrypt').using(rounds=4).hash('Stringst1')
+    user = dto_factories[UserByEmailDTO].build(hash_password=outdated_hash_password, status=True, is_active=True)
+    mock_user_repository.get_one_by_email.return_value = user
+    await fake_user_service.login_user(LoginRequest(email='user@example.com', password='Stringst1'))
+    assert len(fake_background_tasks.tasks) == 1
+    assert fake_background_tasks.tasks[0].func is rehash_password
+    assert fake_background_tasks.tasks[0].args[1:] == (user.id, 'Stringst1', outdated_hash_password)
+
+
+async def test_current_hash_not_rehashed(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    fake_background_tasks: BackgroundTasks,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    mock_user_repository.get_one_by_email.return_value = dto_factories[UserByEmailDTO].build(
+        hash_password=await PasswordHasher(max_workers=1).hash('Stringst1'),
+        status=True,
+        is_active=True,
+    )
+    await fake_user_service.login_user(LoginRequest(email='user@example.com', password='Stringst1'))
+    assert fake_background_tasks.tasks == []
@@ -0,0 +1,32 @@
+from unittest.mock import AsyncMock, call
+
+from app.services.user_service import UserService
+from app.transports.handlers.users.utils import TokenClaims
+
+
+async def test_happy_path(
+    fake_user_service: UserService,
+    mock_token_revocations: AsyncMock,
+) -> None:
+    claims = TokenClaims(user_id=1, jti='jti', token_type='access', issued_at=100.0, expires_at=200.0)
+    await fake_user_service.logout_user(claims)
+    mock_token_revocations.revoke_token.assert_awaited_once_with('jti', 200.0)
+
+
+async def test_token_without_jti(
+    fake_user_service: UserService,
+    mock_token_revocations: AsyncMock,
+) -> None:
+    claims = TokenClaims(user_id=1, jti=None, token_type='access', issued_at=100.0, expires_at=200.0)
+    await fake_user_service.logout_user(claims)
+    mock_token_revocations.revoke_token.assert_not_awaited()
+
+
+async def test_revokes_refresh_token(
+    fake_user_service: UserService,
+    mock_token_revocations: AsyncMock,
+) -> None:
+    claims = TokenClaims(user_id=1, jti='access', token_type='access', issued_at=100.0, expires_at=200.0)
+    refresh_claims = TokenClaims(user_id=1, jti='refresh', token_type='refresh', issued_at=100.0, expires_at=900.0)
+    await fake_user_service.logout_user(claims, refresh_claims)
+    assert mock_token_revocations.revoke_token.await_args_list == [call('access', 200.0), call('refresh', 900.0)]
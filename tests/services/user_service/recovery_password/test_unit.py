@@ -13,6 +13,7 @@ from tests.conftest_utils import DTOFactoryDict
 async def test_happy_path(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
+    mock_token_revocations: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
     expected_user = dto_factories[UserByEmailDTO].build()
@@ -24,6 +25,7 @@ async def test_happy_path(
         access='Пароль для пользователя был изменен!',
         username=expected_user.username,
     )
+    mock_token_revocations.revoke_user.assert_awaited_once_with(expected_user.id)
 
 
 async def test_nonexistent_user(
@@ -7,6 +7,7 @@ from app.integrations.postgres.exceptions import UserNotFoundPostgres
 from app.services.exceptions import InvalidNewPasswordService, InvalidOldPasswordService, UserNotFoundService
 from app.services.user_service import UserService
 from app.transports.handlers.users.schemas import AccessResetPasswordResponse, ResetPassword
+from app.utils.password_hasher import pwd_context
 from tests.conftest_utils import DTOFactoryDict
 
 
@@ -29,10 +30,11 @@ async def test_nonexistent_user(
 async def test_happy_path(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
+    mock_token_revocations: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
     reset_password_data = dto_factories[ResetPassword].build(new_password='Stringst1')
-    hash_password = fake_user_service.set_password(reset_password_data.old_password)
+    hash_password = pwd_context.hash(reset_password_data.old_password)
     expected_user = dto_factories[UserByIdDTO].build(
         email='test@example.com',
         hash_password=hash_password,
@@ -47,6 +49,7 @@ async def test_happy_path(
         username=expected_user.username,
         email=expected_user.email,
     )
+    mock_token_revocations.revoke_user.assert_awaited_once_with(expected_user.id)
 
 
 async def test_invalid_old_password(
@@ -54,7 +57,7 @@ async def test_invalid_old_password(
     mock_user_repository: AsyncMock,
     dto_factories: DTOFactoryDict,
 ) -> None:
-    hash_password = fake_user_service.set_password('Test123qwe')
+    hash_password = pwd_context.hash('Test123qwe')
     expected_user = dto_factories[UserByIdDTO].build(hash_password=hash_password)
     mock_user_repository.get_one_by_id.return_value = expected_user
     with pytest.raises(InvalidOldPasswordService):
@@ -72,7 +75,7 @@ async def test_invalid_new_password(
         old_password='Stringst1',
         new_password='Stringst1',
     )
-    hash_password = fake_user_service.set_password(reset_password_data.new_password)
+    hash_password = pwd_context.hash(reset_password_data.new_password)
     expected_user = dto_factories[UserByIdDTO].build(hash_password=hash_password)
     mock_user_repository.get_one_by_id.return_value = expected_user
     with pytest.raises(InvalidNewPasswordService):
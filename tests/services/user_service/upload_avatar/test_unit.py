@@ -1,28 +1,88 @@
 import os
+from io import BytesIO
 from unittest.mock import AsyncMock
 
+from PIL import Image
+from fastapi import UploadFile
+
 import pytest
+from starlette.datastructures import Headers
 
-from app.services.exceptions import FileExtensionService
+from app.integrations.postgres.dtos.lobby_dto import PlayerSchemaDTO
+from app.integrations.postgres.exceptions import UserNotFoundPostgres
+from app.services.exceptions import (
+    FileExtensionService,
+    FileTooLargeService,
+    ImageTooLargeService,
+    UserNotFoundService,
+)
 from app.services.user_service import UserService
 from app.transports.handlers.users.exceptions import FileNotUploadError
 from app.transports.handlers.users.schemas import UpdatedUserResponse
+from app.utils.config import get_env_settings
 from tests.conftest_utils import DTOFactoryDict
 
 
 async def test_happy_path(
     fake_user_service: UserService,
     mock_user_repository: AsyncMock,
+    mock_lobby_service: AsyncMock,
     dto_factories: DTOFactoryDict,
     create_mock_image: AsyncMock,
 ) -> None:
     expected_user = dto_factories[UpdatedUserResponse].build()
-    mock_user_repository.update.return_value = expected_user
+    mock_user_repository.update_avatar.return_value = expected_user, []
     mock_file = create_mock_image('avatar.png')
 
     result = await fake_user_service.upload_user_avatar(user_id=1, file=mock_file)
     assert result == expected_user
-    assert os.path.exists('/media/avatar/1_avatar.png')
+    avatar = mock_user_repository.update_avatar.await_args.kwargs['avatar']
+    assert avatar.startswith('/media/avatar/') and avatar.endswith('_200.webp')
+    assert os.path.exists(avatar)
+    assert os.path.exists(avatar.replace('_200.webp', '_32.jpg'))
+    mock_lobby_service.publish_players_updated.assert_not_awaited()
+
+
+async def test_players_updated_in_rooms(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    mock_lobby_service: AsyncMock,
+    dto_factories: DTOFactoryDict,
+    create_mock_image: AsyncMock,
+) -> None:
+    players = dto_factories[PlayerSchemaDTO].batch(2, user_id=1)
+    mock_user_repository.update_avatar.return_value = dto_factories[UpdatedUserResponse].build(), players
+
+    await fake_user_service.upload_user_avatar(user_id=1, file=create_mock_image('avatar.png'))
+
+    mock_lobby_service.publish_players_updated.assert_awaited_once_with(players)
+
+
+async def test_same_image_same_path(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    dto_factories: DTOFactoryDict,
+    create_mock_image: AsyncMock,
+) -> None:
+    mock_user_repository.update_avatar.return_value = dto_factories[UpdatedUserResponse].build(), []
+
+    await fake_user_service.upload_user_avatar(user_id=1, file=create_mock_image('first.png'))
+    await fake_user_service.upload_user_avatar(user_id=2, file=create_mock_image('second.png'))
+    first_call, second_call = mock_user_repository.update_avatar.await_args_list
+    assert first_call.kwargs['avatar'] == second_call.kwargs['avatar']
+
+
+async def test_user_not_found(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    mock_lobby_service: AsyncMock,
+    create_mock_image: AsyncMock,
+) -> None:
+    mock_user_repository.update_avatar.side_effect = UserNotFoundPostgres
+
+    with pytest.raises(UserNotFoundService):
+        await fake_user_service.upload_user_avatar(user_id=1, file=create_mock_image('avatar.png'))
+    mock_lobby_service.publish_players_updated.assert_not_awaited()
 
 
 async def test_invalid_file_extension(
@@ -43,7 +103,7 @@ async def test_file_not_uploaded(
     dto_factories: DTOFactoryDict,
     create_mock_image: AsyncMock,
 ) -> None:
-    mock_user_repository.update.side_effect = FileNotUploadError
+    mock_user_repository.update_avatar.side_effect = FileNotUploadError
     mock_file = create_mock_image('avatar.png')
 
     with pytest.raises(FileNotUploadError):
@@ -60,3 +120,69 @@ async def test_file_without_name(
 
     with pytest.raises(ValueError, match='Файл не имеет имени'):
         await fake_user_service.upload_user_avatar(user_id=1, file=mock_file)
+
+
+def upload_file(contents: bytes, content_type: str = 'image/png') -> UploadFile:
+    return UploadFile(
+        BytesIO(contents),
+        filename='avatar.png',
+        size=len(contents),
+        headers=Headers({'content-type': content_type}),
+    )
+
+
+@pytest.mark.parametrize(
+    'contents',
+    [
+        b'<?php echo 1; ?>',
+        b'\x89PNG\r\n\x1a\n' + b'\x00' * 32,
+    ],
+    ids=['not_image', 'broken_header'],
+)
+async def test_content_not_matching_type(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    contents: bytes,
+) -> None:
+    with pytest.raises(FileExtensionService):
+        await fake_user_service.upload_user_avatar(user_id=1, file=upload_file(contents))
+    mock_user_repository.update_avatar.assert_not_awaited()
+
+
+async def test_truncated_image(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+) -> None:
+    buffer = BytesIO()
+    Image.effect_noise((300, 300), 64).save(buffer, format='PNG')
+    contents = buffer.getvalue()
+
+    with pytest.raises(FileExtensionService):
+        await fake_user_service.upload_user_avatar(user_id=1, file=upload_file(contents[: len(contents) // 2]))
+    mock_user_repository.update_avatar.assert_not_awaited()
+
+
+async def test_file_too_large(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    create_mock_image: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(get_env_settings(), 'avatar_max_bytes', 100)
+
+    with pytest.raises(FileTooLargeService):
+        await fake_user_service.upload_user_avatar(user_id=1, file=create_mock_image('avatar.png'))
+    mock_user_repository.update_avatar.assert_not_awaited()
+
+
+async def test_too_many_pixels(
+    fake_user_service: UserService,
+    mock_user_repository: AsyncMock,
+    create_mock_image: AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(get_env_settings(), 'avatar_max_pixels', 200 * 200)
+
+    with pytest.raises(ImageTooLargeService):
+        await fake_user_service.upload_user_avatar(user_id=1, file=create_mock_image('avatar.png', size=(201, 200)))
+    mock_user_repository.update_avatar.assert_not_awaited()
@@ -0,0 +1,15 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.redis.token_revocations import TokenRevocations
+from app.transports.depends.app_scope import token_revocations_depend
+from tests.conftest import ExplicitFastAPI
+
+
+@pytest.fixture(autouse=True)
+def mock_token_revocations(app: ExplicitFastAPI) -> AsyncMock:
+    token_revocations = AsyncMock(spec=TokenRevocations)
+    token_revocations.is_revoked.return_value = False
+    app.dependency_overrides[token_revocations_depend] = lambda: token_revocations
+    return token_revocations
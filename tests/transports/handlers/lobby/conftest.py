@@ -7,4 +7,6 @@ from app.services.lobby_service import LobbyService
 
 @pytest.fixture
 def mock_lobby_service() -> AsyncMock:
-    return AsyncMock(spec=LobbyService)
+    lobby_service = AsyncMock(spec=LobbyService)
+    lobby_service.get_lobby_version.return_value = None
+    return lobby_service
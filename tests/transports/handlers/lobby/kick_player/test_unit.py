@@ -0,0 +1,33 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.services.exceptions import NotRoomHostService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.users.utils import get_current_user
+from tests.conftest import ExplicitFastAPI
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.post(f'/api/lobby/5/kick/7/')
+    assert result.status_code == status.HTTP_204_NO_CONTENT
+    mock_lobby_service.kick_player.assert_awaited_once_with(room_id=5, host_user_id=1, user_id=7)
+
+
+async def test_not_host(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.kick_player.side_effect = NotRoomHostService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.post(f'/api/lobby/5/kick/7/')
+    assert result.status_code == status.HTTP_403_FORBIDDEN
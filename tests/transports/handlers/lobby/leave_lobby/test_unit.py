@@ -0,0 +1,45 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.services.exceptions import PlayerNotInRoomService, RoomNotFoundService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.users.utils import get_current_user
+from tests.conftest import ExplicitFastAPI
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.post(f'/api/lobby/5/leave/')
+    assert result.status_code == status.HTTP_204_NO_CONTENT
+    mock_lobby_service.leave_lobby.assert_awaited_once_with(room_id=5, user_id=1)
+
+
+async def test_room_not_found(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.leave_lobby.side_effect = RoomNotFoundService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.post(f'/api/lobby/5/leave/')
+    assert result.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_player_not_in_room(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.leave_lobby.side_effect = PlayerNotInRoomService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.post(f'/api/lobby/5/leave/')
+    assert result.status_code == status.HTTP_404_NOT_FOUND
@@ -3,8 +3,14 @@ from unittest.mock import AsyncMock
 from httpx import AsyncClient
 from starlette import status
 
+from app.services.exceptions import InvalidCursorService
 from app.services.lobby_service import LobbyService
-from app.transports.handlers.lobby.schemas import RoomResponse
+from app.transports.handlers.lobby.schemas import (
+    RoomPageResponse,
+    RoomResponse,
+    RoomSummaryPageResponse,
+    RoomSummaryResponse,
+)
 from tests.conftest import ExplicitFastAPI
 from tests.conftest_utils import DTOFactoryDict
 
@@ -14,11 +20,120 @@ async def test_happy_path(
     app: ExplicitFastAPI,
     dto_factories: DTOFactoryDict,
     mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.get_rooms_page.return_value = dto_factories[RoomPageResponse].build()
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get(
+        f'/api/lobby/',
+        params={'game_name': 'Black Jokes', 'has_free_seats': True, 'limit': 20},
+    )
+    assert result.status_code == status.HTTP_200_OK
+    assert mock_lobby_service.get_rooms_page.await_count == 1
+    assert mock_lobby_service.get_all_rooms.await_count == 0
+    filters = mock_lobby_service.get_rooms_page.await_args.kwargs['filters']
+    assert filters.game_name == 'Black Jokes'
+    assert filters.has_free_seats is True
+    assert filters.started is None
+    assert mock_lobby_service.get_rooms_page.await_args.kwargs['limit'] == 20
+
+
+async def test_summary(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    dto_factories: DTOFactoryDict,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.get_rooms_summary_page.return_value = dto_factories[RoomSummaryPageResponse].build(
+        items=[dto_factories[RoomSummaryResponse].build()],
+    )
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get(
+        f'/api/lobby/',
+        params={'summary': True},
+    )
+    assert result.status_code == status.HTTP_200_OK
+    assert 'players' not in result.json()['items'][0]
+    assert mock_lobby_service.get_rooms_summary_page.await_count == 1
+    assert mock_lobby_service.get_rooms_page.await_count == 0
+
+
+async def test_unpaginated(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    dto_factories: DTOFactoryDict,
+    mock_lobby_service: AsyncMock,
 ) -> None:
     mock_lobby_service.get_all_rooms.return_value = [dto_factories[RoomResponse].build()]
     app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
     result = await client.get(
         f'/api/lobby/',
+        params={'unpaginated': True},
     )
     assert result.status_code == status.HTTP_200_OK
+    assert isinstance(result.json(), list)
     assert mock_lobby_service.get_all_rooms.await_count == 1
+    assert mock_lobby_service.get_rooms_page.await_count == 0
+
+
+async def test_invalid_cursor(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.get_rooms_page.side_effect = InvalidCursorService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get(
+        f'/api/lobby/',
+        params={'cursor': 'broken'},
+    )
+    assert result.status_code == status.HTTP_400_BAD_REQUEST
+    assert mock_lobby_service.get_rooms_page.await_count == 1
+
+
+async def test_limit_too_big(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get(
+        f'/api/lobby/',
+        params={'limit': 1000},
+    )
+    assert result.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert mock_lobby_service.get_rooms_page.await_count == 0
+
+
+async def test_etag(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    dto_factories: DTOFactoryDict,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.get_lobby_version.return_value = 42
+    mock_lobby_service.get_rooms_page.return_value = dto_factories[RoomPageResponse].build()
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get(
+        f'/api/lobby/',
+        headers={'If-None-Match': '"lobby-41"'},
+    )
+    assert result.status_code == status.HTTP_200_OK
+    assert result.headers['ETag'] == '"lobby-42"'
+    assert mock_lobby_service.get_rooms_page.await_count == 1
+
+
+async def test_not_modified(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.get_lobby_version.return_value = 42
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get(
+        f'/api/lobby/',
+        headers={'If-None-Match': 'W/"lobby-42"'},
+    )
+    assert result.status_code == status.HTTP_304_NOT_MODIFIED
+    assert result.headers['ETag'] == '"lobby-42"'
+    assert result.content == b''
+    assert mock_lobby_service.get_rooms_page.await_count == 0
@@ -0,0 +1,41 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSchemaDTO
+from app.services.exceptions import NoRoomForQuickJoinService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomResponse
+from app.transports.handlers.users.utils import get_current_user
+from tests.conftest import ExplicitFastAPI
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = dto_factories[RoomSchemaDTO].build(players=[])
+    mock_lobby_service.quick_join.return_value = RoomResponse(**room.model_dump())
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.post('/api/lobby/quick_join/', json={'game_name': 'Мафия'})
+    assert result.status_code == status.HTTP_200_OK
+    assert result.json()['id'] == room.id
+    mock_lobby_service.quick_join.assert_awaited_once_with(user_id=1, game_name='Мафия')
+
+
+async def test_no_room(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.quick_join.side_effect = NoRoomForQuickJoinService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.post('/api/lobby/quick_join/', json={})
+    assert result.status_code == status.HTTP_404_NOT_FOUND
+    mock_lobby_service.quick_join.assert_awaited_once_with(user_id=1, game_name=None)
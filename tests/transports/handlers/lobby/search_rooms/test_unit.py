@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSummaryDTO
+from app.services.exceptions import SearchTimeoutService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomSummaryResponse
+from tests.conftest import ExplicitFastAPI
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = RoomSummaryResponse(**dto_factories[RoomSummaryDTO].build().model_dump())
+    mock_lobby_service.search_rooms.return_value = [room]
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get('/api/lobby/search/', params={'q': 'мафия', 'limit': 5})
+    assert result.status_code == status.HTTP_200_OK
+    assert [item['id'] for item in result.json()] == [room.id]
+    mock_lobby_service.search_rooms.assert_awaited_once_with(query='мафия', limit=5)
+
+
+async def test_short_query(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get('/api/lobby/search/', params={'q': 'м'})
+    assert result.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert mock_lobby_service.search_rooms.await_count == 0
+
+
+async def test_timeout(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.search_rooms.side_effect = SearchTimeoutService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    result = await client.get('/api/lobby/search/', params={'q': 'мафия'})
+    assert result.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
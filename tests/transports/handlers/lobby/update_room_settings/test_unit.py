@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.integrations.postgres.dtos.lobby_dto import RoomSummaryDTO
+from app.services.exceptions import MaxPlayersBelowCountService, NotRoomHostService
+from app.services.lobby_service import LobbyService
+from app.transports.handlers.lobby.schemas import RoomSummaryResponse, RoomUpdateSchema
+from app.transports.handlers.users.utils import get_current_user
+from tests.conftest import ExplicitFastAPI
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+    dto_factories: DTOFactoryDict,
+) -> None:
+    room = RoomSummaryResponse(**dto_factories[RoomSummaryDTO].build().model_dump())
+    mock_lobby_service.update_room_settings.return_value = room
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.patch('/api/lobby/5/', json={'max_players': 8, 'password': None})
+    assert result.status_code == status.HTTP_200_OK
+    assert result.json()['id'] == room.id
+    settings = mock_lobby_service.update_room_settings.await_args.kwargs['settings']
+    assert settings == RoomUpdateSchema(max_players=8, password=None)
+    assert settings.model_fields_set == {'max_players', 'password'}
+
+
+async def test_empty_payload(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.patch('/api/lobby/5/', json={})
+    assert result.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert mock_lobby_service.update_room_settings.await_count == 0
+
+
+async def test_not_host(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.update_room_settings.side_effect = NotRoomHostService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.patch('/api/lobby/5/', json={'is_private': True})
+    assert result.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_max_players_below_count(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_lobby_service: AsyncMock,
+) -> None:
+    mock_lobby_service.update_room_settings.side_effect = MaxPlayersBelowCountService
+    app.dependency_overrides[LobbyService] = lambda: mock_lobby_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    result = await client.patch('/api/lobby/5/', json={'max_players': 3})
+    assert result.status_code == status.HTTP_409_CONFLICT
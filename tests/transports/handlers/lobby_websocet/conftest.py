@@ -0,0 +1,22 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.postgres.repositories.lobby_repository import LobbyRepository
+from app.integrations.redis.room_presence import RoomPresence
+from tests.conftest import ExplicitFastAPI
+
+
+@pytest.fixture
+def mock_room_presence(app: ExplicitFastAPI) -> AsyncMock:
+    room_presence = AsyncMock(spec=RoomPresence)
+    app.dependency_overrides[RoomPresence] = lambda: room_presence
+    return room_presence
+
+
+@pytest.fixture(autouse=True)
+def mock_lobby_repository(app: ExplicitFastAPI) -> AsyncMock:
+    lobby_repository = AsyncMock(spec=LobbyRepository)
+    lobby_repository.get_existing_players.return_value = [(5, 1)]
+    app.dependency_overrides[LobbyRepository] = lambda: lobby_repository
+    return lobby_repository
@@ -0,0 +1,112 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette import status
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.integrations.redis.lobby_feed import LobbyFeed
+from app.transports.handlers.users.utils import create_access_token
+from tests.conftest import ExplicitFastAPI
+
+
+def test_happy_path(
+    app: ExplicitFastAPI,
+    mock_room_presence: AsyncMock,
+) -> None:
+    event = {'type': 'room_created', 'room_id': 1, 'version': 2}
+    queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    queue.put_nowait(event)
+    lobby_feed = MagicMock(spec=LobbyFeed)
+    lobby_feed.subscribe.return_value = queue
+    app.state.lobby_feed = lobby_feed
+    token = create_access_token({'user_id': 1})
+
+    with TestClient(app).websocket_connect(f'/ws/lobby/?token={token}') as websocket:
+        assert websocket.receive_json() == event
+        queue.put_nowait(None)
+        with pytest.raises(WebSocketDisconnect) as exc:
+            websocket.receive_json()
+
+    assert exc.value.code == status.WS_1013_TRY_AGAIN_LATER
+    lobby_feed.unsubscribe.assert_called_once_with(queue)
+
+
+def test_invalid_token(
+    app: ExplicitFastAPI,
+    mock_room_presence: AsyncMock,
+) -> None:
+    lobby_feed = MagicMock(spec=LobbyFeed)
+    app.state.lobby_feed = lobby_feed
+
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with TestClient(app).websocket_connect('/ws/lobby/?token=broken') as websocket:
+            websocket.receive_json()
+
+    assert exc.value.code == status.WS_1008_POLICY_VIOLATION
+    assert lobby_feed.subscribe.call_count == 0
+
+
+def test_heartbeat(
+    app: ExplicitFastAPI,
+    mock_room_presence: AsyncMock,
+) -> None:
+    queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    lobby_feed = MagicMock(spec=LobbyFeed)
+    lobby_feed.subscribe.return_value = queue
+    app.state.lobby_feed = lobby_feed
+    token = create_access_token({'user_id': 1})
+
+    with TestClient(app).websocket_connect(f'/ws/lobby/?token={token}') as websocket:
+        websocket.send_text('not json')
+        websocket.send_json({'type': 'heartbeat', 'room_id': 5})
+        queue.put_nowait(None)
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
+
+    mock_room_presence.heartbeat.assert_awaited_once_with(room_id=5, user_id=1)
+
+
+def test_heartbeat_checks_membership_once(
+    app: ExplicitFastAPI,
+    mock_room_presence: AsyncMock,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    lobby_feed = MagicMock(spec=LobbyFeed)
+    lobby_feed.subscribe.return_value = queue
+    app.state.lobby_feed = lobby_feed
+    token = create_access_token({'user_id': 1})
+
+    with TestClient(app).websocket_connect(f'/ws/lobby/?token={token}') as websocket:
+        websocket.send_json({'type': 'heartbeat', 'room_id': 5})
+        websocket.send_json({'type': 'heartbeat', 'room_id': 5})
+        queue.put_nowait(None)
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
+
+    assert mock_room_presence.heartbeat.await_count == 2
+    mock_lobby_repository.get_existing_players.assert_awaited_once_with([(5, 1)])
+
+
+def test_heartbeat_not_room_player(
+    app: ExplicitFastAPI,
+    mock_room_presence: AsyncMock,
+    mock_lobby_repository: AsyncMock,
+) -> None:
+    mock_lobby_repository.get_existing_players.return_value = []
+    queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    lobby_feed = MagicMock(spec=LobbyFeed)
+    lobby_feed.subscribe.return_value = queue
+    app.state.lobby_feed = lobby_feed
+    token = create_access_token({'user_id': 1})
+
+    with TestClient(app).websocket_connect(f'/ws/lobby/?token={token}') as websocket:
+        websocket.send_json({'type': 'heartbeat', 'room_id': 7})
+        queue.put_nowait(None)
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
+
+    assert mock_room_presence.heartbeat.await_count == 0
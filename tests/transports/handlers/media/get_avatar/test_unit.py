@@ -0,0 +1,81 @@
+from pathlib import Path
+
+from httpx import AsyncClient
+import pytest
+from starlette import status
+
+from app.transports.handlers.media import routes
+from app.transports.handlers.media.routes import (
+    DEFAULT_AVATAR_CACHE_CONTROL,
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+)
+
+HASHED_NAME = f'{"a" * 32}_200.webp'
+CONTENT = b'avatar-content'
+
+
+@pytest.fixture(autouse=True)
+def avatar_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(routes, 'AVATAR_DIR', str(tmp_path))
+    (tmp_path / HASHED_NAME).write_bytes(CONTENT)
+    (tmp_path / '1_avatar.png').write_bytes(CONTENT)
+    return tmp_path
+
+
+async def test_hashed_avatar(client: AsyncClient) -> None:
+    result = await client.get(f'/media/avatar/{HASHED_NAME}')
+    assert result.status_code == status.HTTP_200_OK
+    assert result.content == CONTENT
+    assert result.headers['etag'] == f'"{HASHED_NAME}"'
+    assert result.headers['cache-control'] == IMMUTABLE_CACHE_CONTROL
+    assert result.headers['content-type'] == 'image/webp'
+
+
+async def test_not_modified(client: AsyncClient) -> None:
+    result = await client.get(
+        f'/media/avatar/{HASHED_NAME}',
+        headers={'If-None-Match': f'"other", W/"{HASHED_NAME}"'},
+    )
+    assert result.status_code == status.HTTP_304_NOT_MODIFIED
+    assert result.content == b''
+    assert result.headers['etag'] == f'"{HASHED_NAME}"'
+
+
+async def test_range(client: AsyncClient) -> None:
+    result = await client.get(f'/media/avatar/{HASHED_NAME}', headers={'Range': 'bytes=0-5'})
+    assert result.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert result.content == CONTENT[:6]
+    assert result.headers['content-range'] == f'bytes 0-5/{len(CONTENT)}'
+
+
+async def test_legacy_avatar_revalidated(client: AsyncClient, avatar_dir: Path) -> None:
+    result = await client.get('/media/avatar/1_avatar.png')
+    assert result.status_code == status.HTTP_200_OK
+    assert result.headers['cache-control'] == REVALIDATE_CACHE_CONTROL
+    etag = result.headers['etag']
+
+    cached = await client.get('/media/avatar/1_avatar.png', headers={'If-None-Match': etag})
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    (avatar_dir / '1_avatar.png').write_bytes(CONTENT * 2)
+    changed = await client.get('/media/avatar/1_avatar.png', headers={'If-None-Match': etag})
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.content == CONTENT * 2
+
+
+async def test_default_avatar(client: AsyncClient) -> None:
+    result = await client.get(f'/media/avatar/{"b" * 32}_200.webp')
+    assert result.status_code == status.HTTP_200_OK
+    assert result.headers['content-type'] == 'image/webp'
+    assert result.headers['cache-control'] == DEFAULT_AVATAR_CACHE_CONTROL
+    assert result.content.startswith(b'RIFF')
+
+    cached = await client.get('/media/avatar/missing.png', headers={'If-None-Match': result.headers['etag']})
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.parametrize('filename', ['secret.exe', '.hidden.png'])
+async def test_invalid_filename(client: AsyncClient, filename: str) -> None:
+    result = await client.get(f'/media/avatar/{filename}')
+    assert result.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
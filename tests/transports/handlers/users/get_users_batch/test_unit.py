@@ -0,0 +1,46 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.services.user_service import UserService
+from app.transports.handlers.users.schemas import USERS_BATCH_MAX_SIZE, UserPublicBatchResponse
+from tests.conftest import ExplicitFastAPI
+from tests.conftest_utils import DTOFactoryDict
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    dto_factories: DTOFactoryDict,
+    mock_user_service: AsyncMock,
+) -> None:
+    users = [dto_factories[UserPublicBatchResponse].build(id=user_id) for user_id in (1, 2)]
+    mock_user_service.get_users.return_value = users
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    result = await client.post('/api/users/batch/', json={'user_ids': [1, 2, 3]})
+    assert result.status_code == status.HTTP_200_OK
+    assert [user['id'] for user in result.json()] == [1, 2]
+    mock_user_service.get_users.assert_awaited_once_with(user_ids=[1, 2, 3])
+
+
+async def test_empty_user_ids(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    result = await client.post('/api/users/batch/', json={'user_ids': []})
+    assert result.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    mock_user_service.get_users.assert_not_awaited()
+
+
+async def test_too_many_user_ids(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    result = await client.post('/api/users/batch/', json={'user_ids': list(range(USERS_BATCH_MAX_SIZE + 1))})
+    assert result.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    mock_user_service.get_users.assert_not_awaited()
@@ -0,0 +1,75 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.services.user_service import UserService
+from app.transports.handlers.users.utils import create_access_token, create_refresh_token
+from tests.conftest import ExplicitFastAPI
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    result = await client.post(
+        '/api/users/logout/',
+        headers={'Authorization': f'Bearer {create_access_token({"user_id": 3})}'},
+        json={'refresh': create_refresh_token({'user_id': 3})},
+    )
+    assert result.status_code == status.HTTP_204_NO_CONTENT
+    claims, refresh_claims = mock_user_service.logout_user.await_args.args
+    assert claims.user_id == 3
+    assert claims.jti
+    assert refresh_claims.token_type == 'refresh'
+    assert refresh_claims.user_id == 3
+    assert refresh_claims.jti != claims.jti
+
+
+async def test_expired_refresh_token(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+    mock_token_revocations: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    access_token = create_access_token({'user_id': 3})
+    refresh_token = create_refresh_token({'user_id': 3})
+    mock_token_revocations.is_revoked.side_effect = [False, True]
+    result = await client.post(
+        '/api/users/logout/',
+        headers={'Authorization': f'Bearer {access_token}'},
+        json={'refresh': refresh_token},
+    )
+    assert result.status_code == status.HTTP_204_NO_CONTENT
+    claims, refresh_claims = mock_user_service.logout_user.await_args.args
+    assert claims.user_id == 3
+    assert refresh_claims is None
+
+
+async def test_refresh_token_of_other_user(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    result = await client.post(
+        '/api/users/logout/',
+        headers={'Authorization': f'Bearer {create_access_token({"user_id": 3})}'},
+        json={'refresh': create_refresh_token({'user_id': 4})},
+    )
+    assert result.status_code == status.HTTP_401_UNAUTHORIZED
+    mock_user_service.logout_user.assert_not_awaited()
+
+
+async def test_unauthorized(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    result = await client.post('/api/users/logout/', json={'refresh': create_refresh_token({'user_id': 3})})
+    assert result.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+    mock_user_service.logout_user.assert_not_awaited()
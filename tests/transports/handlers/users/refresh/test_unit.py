@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock
+
+from httpx import AsyncClient
+from starlette import status
+
+from app.transports.handlers.users.utils import create_access_token, create_refresh_token, get_current_ws_user
+
+
+async def test_happy_path(
+    client: AsyncClient,
+    mock_token_revocations: AsyncMock,
+) -> None:
+    result = await client.post('/api/users/token/refresh/', json={'refresh': create_refresh_token({'user_id': 5})})
+    assert result.status_code == status.HTTP_200_OK
+    assert await get_current_ws_user(result.json()['access'], mock_token_revocations) == 5
+
+
+async def test_revoked_token_rejected(
+    client: AsyncClient,
+    mock_token_revocations: AsyncMock,
+) -> None:
+    mock_token_revocations.is_revoked.return_value = True
+    result = await client.post('/api/users/token/refresh/', json={'refresh': create_refresh_token({'user_id': 5})})
+    assert result.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_access_token_rejected(
+    client: AsyncClient,
+) -> None:
+    result = await client.post('/api/users/token/refresh/', json={'refresh': create_access_token({'user_id': 5})})
+    assert result.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_invalid_token(
+    client: AsyncClient,
+) -> None:
+    result = await client.post('/api/users/token/refresh/', json={'refresh': 'invalid'})
+    assert result.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from httpx import AsyncClient
+from jose import ExpiredSignatureError, JWTError, jwt
+import pytest
+from starlette import status
+
+from app.services.user_service import UserService
+from app.transports.handlers.users.utils import (
+    TokenVerifier,
+    create_access_token,
+    create_refresh_token,
+    get_current_ws_user,
+)
+from tests.conftest import ExplicitFastAPI
+
+SECRET_KEY = 'secret'
+ALGORITHM = 'HS256'
+
+
+def make_token(user_id: int, token_type: str, expires_in: timedelta = timedelta(minutes=5)) -> str:
+    now = datetime.now(timezone.utc)
+    return jwt.encode(
+        {'user_id': user_id, 'token_type': token_type, 'exp': now + expires_in, 'iat': now, 'jti': str(user_id)},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+
+def test_verified_token_cached() -> None:
+    token_verifier = TokenVerifier(secret_key=SECRET_KEY, algorithm=ALGORITHM, max_size=10)
+    token = make_token(1, 'access')
+    with patch('app.transports.handlers.users.utils.jwt.decode', wraps=jwt.decode) as decode:
+        first = token_verifier.verify(token)
+        second = token_verifier.verify(token)
+    assert decode.call_count == 1
+    assert first == second
+    assert (first.user_id, first.jti, first.token_type) == (1, '1', 'access')
+
+
+def test_invalid_signature() -> None:
+    token_verifier = TokenVerifier(secret_key='other', algorithm=ALGORITHM, max_size=10)
+    with pytest.raises(JWTError):
+        token_verifier.verify(make_token(1, 'access'))
+
+
+def test_cached_token_expires() -> None:
+    token_verifier = TokenVerifier(secret_key=SECRET_KEY, algorithm=ALGORITHM, max_size=10)
+    token = make_token(1, 'access', expires_in=timedelta(seconds=10))
+    token_verifier.verify(token)
+    with patch('app.transports.handlers.users.utils.time.time', return_value=datetime.now().timestamp() + 20):
+        with pytest.raises(ExpiredSignatureError):
+            token_verifier.verify(token)
+
+
+def test_cache_bounded_by_size() -> None:
+    token_verifier = TokenVerifier(secret_key=SECRET_KEY, algorithm=ALGORITHM, max_size=2)
+    tokens = [make_token(user_id, 'access') for user_id in range(3)]
+    for token in tokens:
+        token_verifier.verify(token)
+    with patch('app.transports.handlers.users.utils.jwt.decode', wraps=jwt.decode) as decode:
+        token_verifier.verify(tokens[2])
+        token_verifier.verify(tokens[0])
+    assert decode.call_count == 1
+
+
+async def test_access_token_accepted(
+    mock_token_revocations: AsyncMock,
+) -> None:
+    assert await get_current_ws_user(create_access_token({'user_id': 7}), mock_token_revocations) == 7
+
+
+async def test_refresh_token_rejected_as_access(
+    mock_token_revocations: AsyncMock,
+) -> None:
+    with pytest.raises(HTTPException):
+        await get_current_ws_user(create_refresh_token({'user_id': 7}), mock_token_revocations)
+    mock_token_revocations.is_revoked.assert_not_awaited()
+
+
+async def test_revoked_token_rejected(
+    mock_token_revocations: AsyncMock,
+) -> None:
+    mock_token_revocations.is_revoked.return_value = True
+    with pytest.raises(HTTPException):
+        await get_current_ws_user(create_access_token({'user_id': 7}), mock_token_revocations)
+
+
+async def test_refresh_token_rejected_by_route(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    result = await client.get(
+        '/api/users/personal_area/',
+        headers={'Authorization': f'Bearer {create_refresh_token({"user_id": 7})}'},
+    )
+    assert result.status_code == status.HTTP_401_UNAUTHORIZED
+    mock_user_service.get_current_user.assert_not_awaited()
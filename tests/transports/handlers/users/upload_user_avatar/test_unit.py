@@ -1,12 +1,15 @@
+from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock
 
 from httpx import AsyncClient
 from starlette import status
 
 from app.services.user_service import UserService
+from app.transports.body_size_limit import MULTIPART_OVERHEAD_BYTES
 from app.transports.handlers.users.exceptions import FileExtensionError, FileNotUploadError
 from app.transports.handlers.users.schemas import UpdatedUserResponse
 from app.transports.handlers.users.utils import get_current_user
+from app.utils.config import get_env_settings
 from tests.conftest import ExplicitFastAPI
 from tests.conftest_utils import DTOFactoryDict
 
@@ -61,3 +64,45 @@ async def test_file_not_uploaded(
     result = await client.post('/api/users/1/upload_avatar/', files={'file': (file_name, file_content, 'image/png')})
     assert result.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
     assert mock_user_service.upload_user_avatar.await_count == 1
+
+
+async def test_content_length_too_large(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    file_content = b'0' * (get_env_settings().avatar_max_bytes + MULTIPART_OVERHEAD_BYTES)
+    result = await client.post('/api/users/1/upload_avatar/', files={'file': ('avatar.png', file_content, 'image/png')})
+    assert result.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert mock_user_service.upload_user_avatar.await_count == 0
+
+
+async def test_streamed_body_too_large(
+    client: AsyncClient,
+    app: ExplicitFastAPI,
+    mock_user_service: AsyncMock,
+) -> None:
+    app.dependency_overrides[UserService] = lambda: mock_user_service
+    app.dependency_overrides[get_current_user] = lambda: 1
+    boundary = 'avatar-boundary'
+    chunk = b'0' * 1024 * 1024
+
+    async def body() -> AsyncGenerator[bytes]:
+        # Тело без Content-Length, лимит срабатывает только по мере чтения
+        yield (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="avatar.png"\r\n'
+            'Content-Type: image/png\r\n\r\n'
+        ).encode()
+        for _ in range(get_env_settings().avatar_max_bytes // len(chunk) + 2):
+            yield chunk
+        yield f'\r\n--{boundary}--\r\n'.encode()
+
+    result = await client.post(
+        '/api/users/1/upload_avatar/',
+        content=body(),
+        headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+    )
+    assert result.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert mock_user_service.upload_user_avatar.await_count == 0
@@ -0,0 +1,73 @@
+from io import BytesIO
+import os
+from pathlib import Path
+
+from PIL import Image
+
+from app.utils.avatar_processor import (
+    AVATAR_FORMATS,
+    AVATAR_SIZES,
+    AvatarProcessor,
+    avatar_path,
+    render_avatar_variants,
+)
+
+
+def image_bytes(size: tuple[int, int], color: str | tuple[int, ...] = 'red', format_: str = 'PNG') -> bytes:
+    buffer = BytesIO()
+    Image.new('RGBA' if isinstance(color, tuple) else 'RGB', size, color=color).save(buffer, format=format_)
+    return buffer.getvalue()
+
+
+def test_all_variants_saved(tmp_path: Path) -> None:
+    digest = render_avatar_variants(image_bytes((1200, 600), format_='JPEG'), str(tmp_path))
+    for size in AVATAR_SIZES:
+        for extension, image_format in AVATAR_FORMATS.items():
+            with Image.open(avatar_path(digest, size, extension, str(tmp_path))) as variant:
+                assert variant.format == image_format
+                assert variant.size == (size, size // 2)
+
+
+def test_transparent_image(tmp_path: Path) -> None:
+    digest = render_avatar_variants(image_bytes((100, 100), color=(255, 0, 0, 0)), str(tmp_path))
+    with Image.open(avatar_path(digest, AVATAR_SIZES[0], 'webp', str(tmp_path))) as variant:
+        assert variant.mode == 'RGBA'
+    with Image.open(avatar_path(digest, AVATAR_SIZES[0], 'jpg', str(tmp_path))) as variant:
+        assert variant.mode == 'RGB'
+
+
+def test_same_contents_not_rendered_again(tmp_path: Path) -> None:
+    contents = image_bytes((300, 300))
+    digest = render_avatar_variants(contents, str(tmp_path))
+    path = avatar_path(digest, directory=str(tmp_path))
+    modified_at = os.stat(path).st_mtime_ns
+
+    assert render_avatar_variants(contents, str(tmp_path)) == digest
+    assert os.stat(path).st_mtime_ns == modified_at
+    assert render_avatar_variants(image_bytes((301, 300)), str(tmp_path)) != digest
+
+
+async def test_process_in_pool(tmp_path: Path) -> None:
+    avatar_processor = AvatarProcessor(max_workers=1)
+    try:
+        path = await avatar_processor.process(image_bytes((500, 500)), str(tmp_path))
+    finally:
+        avatar_processor.shutdown()
+    assert path.startswith(str(tmp_path))
+    with Image.open(path) as variant:
+        assert variant.size == (AVATAR_SIZES[0], AVATAR_SIZES[0])
+
+
+async def test_broken_pool_restarted(tmp_path: Path) -> None:
+    avatar_processor = AvatarProcessor(max_workers=1)
+    try:
+        await avatar_processor.process(image_bytes((100, 100)), str(tmp_path))
+        broken_executor = avatar_processor._executor
+        for process in broken_executor._processes.values():
+            process.kill()
+
+        path = await avatar_processor.process(image_bytes((120, 100)), str(tmp_path))
+    finally:
+        avatar_processor.shutdown()
+    assert avatar_processor._executor is not broken_executor
+    assert os.path.exists(path)
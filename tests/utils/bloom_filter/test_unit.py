@@ -0,0 +1,22 @@
+from app.utils.bloom_filter import BloomFilter
+
+
+def test_no_false_negatives() -> None:
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f'jti:{index}' for index in range(1000)]
+    for item in items:
+        bloom_filter.add(item)
+    assert all(item in bloom_filter for item in items)
+    assert bloom_filter.count == 1000
+
+
+def test_false_positive_rate() -> None:
+    bloom_filter = BloomFilter(capacity=1000, error_rate=0.01)
+    for index in range(1000):
+        bloom_filter.add(f'jti:{index}')
+    false_positives = sum(f'user:{index}' in bloom_filter for index in range(10_000))
+    assert false_positives < 300
+
+
+def test_empty() -> None:
+    assert 'jti:1' not in BloomFilter(capacity=10, error_rate=0.01)
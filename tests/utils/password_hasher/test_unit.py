@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from app.utils.metrics import PASSWORD_HASH_QUEUE
+from app.utils.password_hasher import (
+    BCRYPT_MAX_ROUNDS,
+    BCRYPT_MIN_ROUNDS,
+    PasswordHasher,
+    calibrate_bcrypt_rounds,
+    pwd_context,
+)
+
+
+async def test_hash_and_verify() -> None:
+    password_hasher = PasswordHasher(max_workers=2)
+    hash_password = await password_hasher.hash('Stringst1')
+    assert await password_hasher.verify('Stringst1', hash_password)
+    assert not await password_hasher.verify('Stringst2', hash_password)
+
+
+async def test_event_loop_not_blocked() -> None:
+    password_hasher = PasswordHasher(max_workers=1)
+    hashing = asyncio.gather(*(password_hasher.hash('Stringst1') for _ in range(3)))
+    started_at = time.perf_counter()
+    await asyncio.sleep(0)
+    assert time.perf_counter() - started_at < 0.05
+    await hashing
+    assert PASSWORD_HASH_QUEUE._value.get() == 0
+
+
+async def test_cancelled_while_queued() -> None:
+    password_hasher = PasswordHasher(max_workers=1)
+    running = asyncio.create_task(password_hasher.hash('Stringst1'))
+    queued = asyncio.create_task(password_hasher.hash('Stringst1'))
+    await asyncio.sleep(0)
+    queued.cancel()
+    await running
+    assert queued.cancelled()
+    assert PASSWORD_HASH_QUEUE._value.get() == 0
+
+
+def test_calibrate_bcrypt_rounds() -> None:
+    assert calibrate_bcrypt_rounds(target_seconds=0.000001) == BCRYPT_MIN_ROUNDS
+    assert calibrate_bcrypt_rounds(target_seconds=3600) == BCRYPT_MAX_ROUNDS
+
+
+def test_set_rounds() -> None:
+    saved_context = pwd_context.to_string()
+    try:
+        PasswordHasher.set_rounds(BCRYPT_MIN_ROUNDS)
+        password_hasher = PasswordHasher(max_workers=1)
+        bcrypt_handler = pwd_context.handler('bcrypt')
+        assert password_hasher.needs_update(bcrypt_handler.using(rounds=BCRYPT_MIN_ROUNDS - 1).hash('Stringst1'))
+        assert not password_hasher.needs_update(bcrypt_handler.using(rounds=BCRYPT_MIN_ROUNDS).hash('Stringst1'))
+        assert not password_hasher.needs_update(bcrypt_handler.using(rounds=BCRYPT_MIN_ROUNDS + 1).hash('Stringst1'))
+        assert password_hasher.needs_update(bcrypt_handler.using(rounds=BCRYPT_MIN_ROUNDS + 2).hash('Stringst1'))
+    finally:
+        pwd_context.load(saved_context)